@@ -0,0 +1,227 @@
+from argparse import ArgumentParser
+from datetime import datetime
+from json import dumps
+from pathlib import Path
+from time import perf_counter
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.functions import array, col, concat_ws, count, element_at, explode, floor, lit, rand, split, \
+    sum as sum_
+
+# Benchmark Workloads (Run in This Order, After the Synthetic Data Generation).
+benchmark_workloads = ["sort", "groupby", "join", "wordcount", "s3a"]
+
+# Words of the Synthetic Text Column (Word Count Workload).
+synthetic_words = ["spark", "cluster", "shuffle", "executor", "driver", "stage", "task", "partition",
+                   "worker", "master", "memory", "core", "network", "disk", "cloud", "instance"]
+
+# Words Per Row of the Synthetic Text Column.
+words_per_row = 5
+
+
+def get_cluster_shape(spark_session: SparkSession) -> dict:
+    # Executors Registered With the Driver (The Driver's Own Block Manager Excluded, Except in Local Mode).
+    spark_context = spark_session.sparkContext
+    spark_conf = spark_context.getConf()
+    block_managers = spark_context._jsc.sc().getExecutorMemoryStatus().size()
+    return {"master": spark_context.master,
+            "spark_version": spark_context.version,
+            "executors": max(block_managers - 1, 1),
+            "default_parallelism": spark_context.defaultParallelism,
+            "executor_cores": spark_conf.get("spark.executor.cores", None),
+            "executor_memory": spark_conf.get("spark.executor.memory", None),
+            "cores_max": spark_conf.get("spark.cores.max", None),
+            "shuffle_partitions": spark_conf.get("spark.sql.shuffle.partitions", "200")}
+
+
+def generate_synthetic_data(spark_session: SparkSession,
+                            rows: int,
+                            keys: int,
+                            partitions: int,
+                            seed: int) -> DataFrame:
+    # Deterministic Rows (Same Seed, Same Data): Uniform Key, Uniform Value and a Few Random Words.
+    words = array(*[lit(word) for word in synthetic_words])
+    word_columns = [element_at(words, (floor(rand(seed + word_index + 1) * len(synthetic_words)) + 1).cast("int"))
+                    for word_index in range(words_per_row)]
+    return spark_session.range(0, rows, numPartitions=partitions) \
+        .select(col("id"),
+                floor(rand(seed) * keys).cast("long").alias("key"),
+                (rand(seed + words_per_row + 1) * 1000).alias("value"),
+                concat_ws(" ", *word_columns).alias("text"))
+
+
+def execute(data_frame: DataFrame) -> None:
+    # Run the Whole Plan Without Writing Its Output Anywhere (Spark's No-Op Sink).
+    data_frame.write.format("noop").mode("overwrite").save()
+
+
+def run_sort(data_frame: DataFrame,
+             keys: int) -> None:
+    execute(data_frame.sort(col("value")))
+
+
+def run_groupby(data_frame: DataFrame,
+                keys: int) -> None:
+    execute(data_frame.groupBy("key").agg(count("*").alias("rows"), sum_("value").alias("total_value")))
+
+
+def run_join(data_frame: DataFrame,
+             keys: int) -> None:
+    # Fact-to-Dimension Join on the Key (The Dimension Table Has One Row Per Key).
+    spark_session = data_frame.sparkSession
+    dimension_data_frame = spark_session.range(0, keys) \
+        .select(col("id").alias("key"), (col("id") % 100).alias("category"))
+    execute(data_frame.join(dimension_data_frame, "key").groupBy("category").agg(sum_("value")))
+
+
+def run_wordcount(data_frame: DataFrame,
+                  keys: int) -> None:
+    execute(data_frame.select(explode(split(col("text"), " ")).alias("word")).groupBy("word").count())
+
+
+def get_path_size_in_bytes(spark_session: SparkSession,
+                           path: str) -> int:
+    # Total Size of the Files Under the Path, Through the Hadoop FileSystem API (S3A Included).
+    jvm = spark_session.sparkContext._jvm
+    hadoop_path = jvm.org.apache.hadoop.fs.Path(path)
+    file_system = hadoop_path.getFileSystem(spark_session.sparkContext._jsc.hadoopConfiguration())
+    return file_system.getContentSummary(hadoop_path).getLength()
+
+
+def run_s3a(data_frame: DataFrame,
+            rows: int,
+            s3a_path: str) -> list:
+    # Write the Data as Parquet, Then Read It Back in Full (Throughput in Both Directions).
+    spark_session = data_frame.sparkSession
+    start_time = perf_counter()
+    data_frame.write.mode("overwrite").parquet(s3a_path)
+    write_time_in_seconds = perf_counter() - start_time
+    size_in_bytes = get_path_size_in_bytes(spark_session, s3a_path)
+    start_time = perf_counter()
+    execute(spark_session.read.parquet(s3a_path))
+    read_time_in_seconds = perf_counter() - start_time
+    return [{"workload": workload,
+             "wall_time_in_seconds": round(wall_time_in_seconds, 3),
+             "rows": rows,
+             "rows_per_second": round(rows / wall_time_in_seconds, 1),
+             "bytes": size_in_bytes,
+             "megabytes_per_second": round(size_in_bytes / 1048576 / wall_time_in_seconds, 2)}
+            for workload, wall_time_in_seconds in [("s3a_write", write_time_in_seconds),
+                                                   ("s3a_read", read_time_in_seconds)]]
+
+
+def run_benchmark(arguments_dict: dict) -> dict:
+    # Get Arguments.
+    workloads_list = arguments_dict["workloads"].split(",")
+    rows = arguments_dict["rows"]
+    keys = arguments_dict["keys"]
+    partitions = arguments_dict["partitions"]
+    seed = arguments_dict["seed"]
+    s3a_path = arguments_dict["s3a_path"]
+    invalid_workloads_list = [workload for workload in workloads_list if workload not in benchmark_workloads]
+    if invalid_workloads_list:
+        message = "Invalid workload(s) {0}! Supported workloads: {1}.".format(invalid_workloads_list,
+                                                                              benchmark_workloads)
+        raise ValueError(message)
+    # Get or Create the Spark Session (The Master Comes From 'spark-submit', Local or Standalone).
+    spark_session = SparkSession.builder.appName("sparking_cloud_benchmark").getOrCreate()
+    partitions = partitions or spark_session.sparkContext.defaultParallelism
+    run = {"started_at": datetime.now().isoformat(timespec="seconds"),
+           "parameters": {"workloads": workloads_list,
+                          "rows": rows,
+                          "keys": keys,
+                          "partitions": partitions,
+                          "seed": seed},
+           "results": []}
+    # Generate and Cache the Synthetic Data (Timed, as the Baseline Scan Throughput).
+    start_time = perf_counter()
+    data_frame = generate_synthetic_data(spark_session, rows, keys, partitions, seed).cache()
+    data_frame.count()
+    generation_time_in_seconds = perf_counter() - start_time
+    run["results"].append({"workload": "generate",
+                           "wall_time_in_seconds": round(generation_time_in_seconds, 3),
+                           "rows": rows,
+                           "rows_per_second": round(rows / generation_time_in_seconds, 1)})
+    workload_functions = {"sort": run_sort,
+                          "groupby": run_groupby,
+                          "join": run_join,
+                          "wordcount": run_wordcount}
+    for workload in workloads_list:
+        if workload == "s3a":
+            # The S3A Throughput Test Needs a Bucket Path (Skipped on Local Runs Without One).
+            if s3a_path:
+                run["results"].extend(run_s3a(data_frame, rows, s3a_path))
+            continue
+        start_time = perf_counter()
+        workload_functions[workload](data_frame, keys)
+        wall_time_in_seconds = perf_counter() - start_time
+        run["results"].append({"workload": workload,
+                               "wall_time_in_seconds": round(wall_time_in_seconds, 3),
+                               "rows": rows,
+                               "rows_per_second": round(rows / wall_time_in_seconds, 1)})
+    # Get the Cluster Shape Once the Executors Have Registered.
+    run["cluster_shape"] = get_cluster_shape(spark_session)
+    run["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    data_frame.unpersist()
+    spark_session.stop()
+    return run
+
+
+if __name__ == "__main__":
+    # Begin.
+    # Parse Benchmark Arguments.
+    ag = ArgumentParser(description="Benchmark Arguments")
+    ag.add_argument("--workloads",
+                    type=str,
+                    required=False,
+                    default=",".join(benchmark_workloads),
+                    help="Workloads (default: {0})".format(",".join(benchmark_workloads)))
+    ag.add_argument("--rows",
+                    type=int,
+                    required=False,
+                    default=10000000,
+                    help="Synthetic Data Rows (default: 10000000)")
+    ag.add_argument("--keys",
+                    type=int,
+                    required=False,
+                    default=100000,
+                    help="Distinct Keys of the Synthetic Data (default: 100000)")
+    ag.add_argument("--partitions",
+                    type=int,
+                    required=False,
+                    default=0,
+                    help="Synthetic Data Partitions, 0 for the Default Parallelism (default: 0)")
+    ag.add_argument("--seed",
+                    type=int,
+                    required=False,
+                    default=42,
+                    help="Random Seed of the Synthetic Data (default: 42)")
+    ag.add_argument("--s3a_path",
+                    type=str,
+                    required=False,
+                    default="",
+                    help="S3A Path of the Throughput Test, e.g., s3a://bucket/benchmark (default: skipped)")
+    ag.add_argument("--results_file",
+                    type=Path,
+                    required=False,
+                    default=Path("benchmark_results.jsonl"),
+                    help="Results File, One JSON Run Per Line (default: benchmark_results.jsonl)")
+    parsed_args = ag.parse_args()
+    # Generate Arguments Dict.
+    args_dict = {"workloads": str(parsed_args.workloads),
+                 "rows": int(parsed_args.rows),
+                 "keys": int(parsed_args.keys),
+                 "partitions": int(parsed_args.partitions),
+                 "seed": int(parsed_args.seed),
+                 "s3a_path": str(parsed_args.s3a_path)}
+    # Run the Benchmark and Append Its Results (Also Printed, so the Driver's Log Holds Them Too).
+    benchmark_run = run_benchmark(args_dict)
+    benchmark_run_line = dumps(benchmark_run, sort_keys=True)
+    results_file = Path(parsed_args.results_file)
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(file=results_file, mode="a", encoding="utf-8") as file:
+        file.write(benchmark_run_line + "\n")
+    print("BENCHMARK_RUN {0}".format(benchmark_run_line))
+    # Unbind Objects (Garbage Collector).
+    del ag
+    # End.
+    exit(0)
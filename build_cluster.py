@@ -1,16 +1,19 @@
 from argparse import ArgumentParser
 from botocore.exceptions import ClientError
 from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
 from pathlib import Path
+from queue import Queue
 from typing import Any
-from cloud_manager.ec2_manager import EC2Manager
+from cloud_manager.ec2_manager import EC2Manager, get_ec2_manager
+from configure_cluster import ClusterConfigurator
 from util.aws_config_util import parse_aws_config_file
-from util.config_parser_util import parse_config_section
+from util.cluster_inventory_util import ClusterInventory, ended_instance_states, load_cluster_inventory, \
+    unload_cluster_inventory
 from util.logging_util import load_logger, log_message
-from util.os_util import check_if_file_exists, remove_file
-from util.sparking_cloud_util import parse_sparking_cloud_config_file, append_instance_dict_to_file, \
-    read_instances_file, generate_cluster_instances_summary, print_cluster_instances_summary
+from util.instance_registry_util import InstanceRegistry, load_instance_registry
+from util.sparking_cloud_util import load_sparking_cloud_config_file, generate_cluster_instances_summary, \
+    print_cluster_instances_summary
+from util.tracing_util import trace_span
 from terminate_cluster import terminate_cluster
 
 
@@ -24,8 +27,10 @@ class ClusterBuilder:
         self.logging_settings = None
         self.aws_settings = None
         self.configuration_rules = None
+        self.instances_settings = None
         # Other Attributes.
         self.logger = None
+        self.instances_queue = None
 
     def set_attribute(self,
                       attribute_name: str,
@@ -36,10 +41,17 @@ class ClusterBuilder:
                       attribute_name: str) -> Any:
         return getattr(self, attribute_name)
 
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
+
     def build_cluster_from_scratch(self,
                                    cluster_name: str,
                                    cluster_settings: dict,
-                                   config_parser: ConfigParser,
                                    ec2m: EC2Manager) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
@@ -48,7 +60,6 @@ class ClusterBuilder:
             log_message(logger, message, "INFO")
             future = thread_pool_executor.submit(self.build_cluster_tasks,
                                                  cluster_settings,
-                                                 config_parser,
                                                  ec2m)
             wait([future])
             message = "The Cluster '{0}' was build successfully!".format(cluster_name)
@@ -57,8 +68,7 @@ class ClusterBuilder:
     def show_cluster_build_options_input(self,
                                          cluster_name: str,
                                          cluster_settings: dict,
-                                         cluster_instances_file: Path,
-                                         config_parser: ConfigParser,
+                                         instance_registry: InstanceRegistry,
                                          ec2m: EC2Manager) -> None:
         valid_responses = ["1", "2", "3", "4"]
         response = None
@@ -78,23 +88,34 @@ class ClusterBuilder:
             print("This action is still under development...")
             pass
         elif response == "2":
-            print("This action is still under development...")
-            pass
+            # Waking Up the Stopped Instances is Still Under Development (See Option 1).
+            # Add the New Worker Instances Described in the Configuration File.
+            self.add_new_cluster_instances(cluster_name,
+                                           cluster_settings,
+                                           ec2m)
+            # Read the Cluster's Registered Instances.
+            instances_list = instance_registry.get_instances(cluster_name)
+            # Generate the Cluster Instances Summary (All Providers).
+            cluster_instances_summary = generate_cluster_instances_summary(instances_list, ec2m)
+            # Print the Grown Cluster Instances Summary.
+            print_cluster_instances_summary(cluster_name,
+                                            cluster_instances_summary)
         elif response == "3":
             # Generate Arguments Dict.
             arguments_dict = {"sparking_cloud_config_file": self.sparking_cloud_config_file,
                               "cluster_names": cluster_name}
             # Terminate the previously built cluster (old instances).
             terminate_cluster(arguments_dict)
-            # Remove the instances file of the previously built cluster.
-            remove_file(cluster_instances_file)
+            # Remove the registered instances of the previously built cluster.
+            instance_registry.delete_cluster(cluster_name)
+            unload_cluster_inventory(self.get_attribute("general_settings")["cluster_instances_root_folder"],
+                                     cluster_name)
             # Build the Cluster from Scratch (New Instances).
             self.build_cluster_from_scratch(cluster_name,
                                             cluster_settings,
-                                            config_parser,
                                             ec2m)
-            # Read the Cluster's Instances File.
-            instances_list = read_instances_file(cluster_instances_file)
+            # Read the Cluster's Registered Instances.
+            instances_list = instance_registry.get_instances(cluster_name)
             # Generate the Cluster Instances Summary (All Providers).
             cluster_instances_summary = generate_cluster_instances_summary(instances_list, ec2m)
             # Print the Recently Created Cluster Instances Summary.
@@ -103,6 +124,20 @@ class ClusterBuilder:
         elif response == "4":
             pass
 
+    def load_placement_group(self,
+                             cluster_name: str,
+                             instances_settings_dict: dict,
+                             ec2m: EC2Manager) -> str:
+        # Create the Cluster's Placement Group for the Settings' Strategy (If Any), Returning Its Name.
+        placement_strategy = instances_settings_dict["placement_strategy"]
+        if placement_strategy == "none":
+            return None
+        placement_group_name = ec2m.get_placement_group_name(cluster_name, placement_strategy)
+        ec2m.create_placement_group(placement_group_name,
+                                    placement_strategy,
+                                    instances_settings_dict["placement_partition_count"])
+        return placement_group_name
+
     def create_spark_master_on_aws_tasks(self,
                                          cluster_name: str,
                                          master_id: int,
@@ -112,40 +147,58 @@ class ClusterBuilder:
         logger = self.get_attribute("logger")
         # Get Clusters Instances Root Folder.
         cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        # Get Cluster Instances File.
-        cluster_instances_file = Path(cluster_instances_root_folder).joinpath(cluster_name)
+        # Get Instance Registry.
+        instance_registry = load_instance_registry(cluster_instances_root_folder)
         master_prefix_name = master_instances_settings_dict["prefix_name"]
         master_name = cluster_name + "-" + master_prefix_name + "-" + str(master_id)
-        master_instance_options = ec2m.load_ec2_instance_options(master_name,
-                                                                 master_instances_settings_dict)
         master_instance_id = None
         master_instance = None
-        try:
-            master_instance_id = ec2m.create_one_ec2_instance(master_instance_options)
-            ec2m.wait_for_ec2_instance_to_be_alive(master_instance_id)
-            master_instance = ec2m.get_ec2_instance(master_instance_id)
-        except ClientError as ce:
-            message = ce.args[0]
-            log_message(logger, message, "INFO")
-            if "MaxSpotInstanceCountExceeded" in message:
-                raise ce
+        with trace_span("launch_instance", cluster=cluster_name, node=master_name, phase="build") as span:
+            try:
+                master_placement_group_name = self.load_placement_group(cluster_name,
+                                                                        master_instances_settings_dict,
+                                                                        ec2m)
+                master_instance_options = ec2m.load_ec2_instance_options(master_name,
+                                                                         master_instances_settings_dict,
+                                                                         master_placement_group_name)
+                master_instance_id = ec2m.create_one_ec2_instance(master_instance_options)
+                span.set_attribute("instance_id", master_instance_id)
+                ec2m.wait_for_ec2_instance_to_be_alive(master_instance_id)
+                master_instance = ec2m.get_ec2_instance(master_instance_id)
+            except ClientError as ce:
+                message = ce.args[0]
+                log_message(logger, message, "INFO")
+                span.set_attribute("error", message)
+                if "MaxSpotInstanceCountExceeded" in message:
+                    raise ce
         if master_instance:
             master_type = master_instances_settings_dict["type"]
             master_market_type = master_instances_settings_dict["market_type"]
             master_keyname = master_instances_settings_dict["key_name"]
             master_username = master_instances_settings_dict["username"]
             master_public_ipv4_address = ec2m.get_ec2_instance_public_ipv4_address(master_instance)
+            master_private_ipv4_address = ec2m.get_ec2_instance_private_ipv4_address(master_instance)
+            master_private_dns_name = ec2m.get_ec2_instance_private_dns_name(master_instance)
             master_ssh_port = master_instances_settings_dict["ssh_port"]
             master_instance_dict = {"provider": "AWS",
                                     "name": master_name,
+                                    "role": "master",
                                     "id": master_instance_id,
                                     "type": master_type,
                                     "market_type": master_market_type,
                                     "key_name": master_keyname,
                                     "username": master_username,
                                     "public_ipv4_address": master_public_ipv4_address,
-                                    "ssh_port": master_ssh_port}
-            append_instance_dict_to_file(master_instance_dict, cluster_instances_file)
+                                    "ssh_port": master_ssh_port,
+                                    "private_ipv4_address": master_private_ipv4_address,
+                                    "private_dns_name": master_private_dns_name}
+            instance_registry.insert_instance(cluster_name, master_instance_dict)
+            # Add the Master Instance to the Cluster's Inventory (Resolving Its Key File Once).
+            master_instance_record = self.get_cluster_inventory(cluster_name).add_instance(master_instance_dict)
+            # Publish the Alive Master Instance to the Instances Queue (If Any Consumer is Streaming).
+            instances_queue = self.get_attribute("instances_queue")
+            if instances_queue:
+                instances_queue.put(master_instance_record)
 
     def parallel_create_spark_masters_on_aws(self,
                                              cluster_name: str,
@@ -170,67 +223,143 @@ class ClusterBuilder:
         logger = self.get_attribute("logger")
         # Get Clusters Instances Root Folder.
         cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        # Get Cluster Instances File.
-        cluster_instances_file = Path(cluster_instances_root_folder).joinpath(cluster_name)
+        # Get Instance Registry.
+        instance_registry = load_instance_registry(cluster_instances_root_folder)
         worker_prefix_name = worker_instances_settings_dict["prefix_name"]
         worker_name = cluster_name + "-" + worker_prefix_name + "-" + str(worker_id)
-        worker_instance_options = ec2m.load_ec2_instance_options(worker_name,
-                                                                 worker_instances_settings_dict)
         worker_instance_id = None
         worker_instance = None
-        try:
-            worker_instance_id = ec2m.create_one_ec2_instance(worker_instance_options)
-            ec2m.wait_for_ec2_instance_to_be_alive(worker_instance_id)
-            worker_instance = ec2m.get_ec2_instance(worker_instance_id)
-        except ClientError as ce:
-            message = ce.args[0]
-            log_message(logger, message, "INFO")
-            if "MaxSpotInstanceCountExceeded" in message:
-                raise ce
+        with trace_span("launch_instance", cluster=cluster_name, node=worker_name, phase="build") as span:
+            try:
+                worker_placement_group_name = self.load_placement_group(cluster_name,
+                                                                        worker_instances_settings_dict,
+                                                                        ec2m)
+                worker_instance_options = ec2m.load_ec2_instance_options(worker_name,
+                                                                         worker_instances_settings_dict,
+                                                                         worker_placement_group_name)
+                worker_instance_id = ec2m.create_one_ec2_instance(worker_instance_options)
+                span.set_attribute("instance_id", worker_instance_id)
+                ec2m.wait_for_ec2_instance_to_be_alive(worker_instance_id)
+                worker_instance = ec2m.get_ec2_instance(worker_instance_id)
+            except ClientError as ce:
+                message = ce.args[0]
+                log_message(logger, message, "INFO")
+                span.set_attribute("error", message)
+                if "MaxSpotInstanceCountExceeded" in message:
+                    raise ce
         if worker_instance:
             worker_type = worker_instances_settings_dict["type"]
             worker_market_type = worker_instances_settings_dict["market_type"]
             worker_keyname = worker_instances_settings_dict["key_name"]
             worker_username = worker_instances_settings_dict["username"]
             worker_public_ipv4_address = ec2m.get_ec2_instance_public_ipv4_address(worker_instance)
+            worker_private_ipv4_address = ec2m.get_ec2_instance_private_ipv4_address(worker_instance)
+            worker_private_dns_name = ec2m.get_ec2_instance_private_dns_name(worker_instance)
             worker_ssh_port = worker_instances_settings_dict["ssh_port"]
             worker_instance_dict = {"provider": "AWS",
                                     "name": worker_name,
+                                    "role": "worker",
                                     "id": worker_instance_id,
                                     "type": worker_type,
                                     "market_type": worker_market_type,
                                     "key_name": worker_keyname,
                                     "username": worker_username,
                                     "public_ipv4_address": worker_public_ipv4_address,
-                                    "ssh_port": worker_ssh_port}
-            append_instance_dict_to_file(worker_instance_dict, cluster_instances_file)
+                                    "ssh_port": worker_ssh_port,
+                                    "private_ipv4_address": worker_private_ipv4_address,
+                                    "private_dns_name": worker_private_dns_name}
+            instance_registry.insert_instance(cluster_name, worker_instance_dict)
+            # Add the Worker Instance to the Cluster's Inventory (Resolving Its Key File Once).
+            worker_instance_record = self.get_cluster_inventory(cluster_name).add_instance(worker_instance_dict)
+            # Publish the Alive Worker Instance to the Instances Queue (If Any Consumer is Streaming).
+            instances_queue = self.get_attribute("instances_queue")
+            if instances_queue:
+                instances_queue.put(worker_instance_record)
 
     def parallel_create_spark_workers_on_aws(self,
                                              cluster_name: str,
                                              worker_instances_settings_dict: dict,
-                                             ec2m: EC2Manager) -> None:
-        number_of_worker_instances = worker_instances_settings_dict["number_of_worker_instances"]
+                                             ec2m: EC2Manager,
+                                             first_worker_id: int = 0,
+                                             number_of_worker_instances: int = None) -> None:
+        if number_of_worker_instances is None:
+            number_of_worker_instances = worker_instances_settings_dict["number_of_worker_instances"]
         if number_of_worker_instances > 0:
             with ThreadPoolExecutor() as thread_pool_executor:
-                for worker_id in range(0, number_of_worker_instances):
+                for worker_id in range(first_worker_id, first_worker_id + number_of_worker_instances):
                     thread_pool_executor.submit(self.create_spark_worker_on_aws_tasks,
                                                 cluster_name,
                                                 worker_id,
                                                 worker_instances_settings_dict,
                                                 ec2m)
 
+    def get_existing_worker_ids(self,
+                                cluster_name: str,
+                                worker_instances_settings_dict: dict,
+                                include_ended_workers: bool = True) -> list:
+        # Worker Names Follow the '<Cluster Name>-<Prefix Name>-<Worker ID>' Pattern.
+        # Ended (Terminated) Workers Keep Their IDs Reserved, but Do Not Count as Part of the Cluster.
+        worker_name_prefix = cluster_name + "-" + worker_instances_settings_dict["prefix_name"] + "-"
+        existing_worker_ids = []
+        for worker in self.get_cluster_inventory(cluster_name).get_workers():
+            if not include_ended_workers and worker.state in ended_instance_states:
+                continue
+            worker_id = worker.name[len(worker_name_prefix):]
+            if worker.name.startswith(worker_name_prefix) and worker_id.isdigit():
+                existing_worker_ids.append(int(worker_id))
+        return existing_worker_ids
+
+    def add_spark_workers_on_aws(self,
+                                 cluster_name: str,
+                                 worker_instances_settings_dict: dict,
+                                 number_of_new_worker_instances: int,
+                                 ec2m: EC2Manager) -> list:
+        # Launch New Workers, Numbered After the Existing Ones (Registered Instances Are Never Renumbered).
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        existing_worker_ids = self.get_existing_worker_ids(cluster_name, worker_instances_settings_dict)
+        first_worker_id = max(existing_worker_ids) + 1 if existing_worker_ids else 0
+        existing_workers = set(cluster_inventory.get_workers())
+        self.parallel_create_spark_workers_on_aws(cluster_name,
+                                                  worker_instances_settings_dict,
+                                                  ec2m,
+                                                  first_worker_id,
+                                                  number_of_new_worker_instances)
+        return [worker for worker in cluster_inventory.get_workers() if worker not in existing_workers]
+
+    def add_new_cluster_instances(self,
+                                  cluster_name: str,
+                                  cluster_settings: dict,
+                                  ec2m: EC2Manager) -> None:
+        # Launch the Workers Described in the Config File That Are Not Part of the Cluster Yet.
+        instances_settings = self.get_attribute("instances_settings")
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for worker_instances_settings in cluster_settings["worker_instances_settings"]:
+                worker_instances_settings_dict = instances_settings[worker_instances_settings]
+                if "AWS" in worker_instances_settings:
+                    number_of_existing_workers = len(self.get_existing_worker_ids(cluster_name,
+                                                                                  worker_instances_settings_dict,
+                                                                                  include_ended_workers=False))
+                    number_of_new_worker_instances = \
+                        worker_instances_settings_dict["number_of_worker_instances"] - number_of_existing_workers
+                    if number_of_new_worker_instances > 0:
+                        thread_pool_executor.submit(self.add_spark_workers_on_aws,
+                                                    cluster_name,
+                                                    worker_instances_settings_dict,
+                                                    number_of_new_worker_instances,
+                                                    ec2m)
+
     def build_cluster_tasks(self,
                             cluster_settings: dict,
-                            config_parser: ConfigParser,
                             ec2m: EC2Manager) -> None:
         cluster_name = cluster_settings["cluster_name"]
         master_instances_settings_list = cluster_settings["master_instances_settings"]
         worker_instances_settings_list = cluster_settings["worker_instances_settings"]
+        # Get Instances Settings (Already Parsed and Validated).
+        instances_settings = self.get_attribute("instances_settings")
         with ThreadPoolExecutor() as thread_pool_executor:
             # Parallel Launch Master Instances.
             for master_instances_settings in master_instances_settings_list:
-                master_instances_settings_dict = parse_config_section(config_parser,
-                                                                      master_instances_settings + " Settings")
+                master_instances_settings_dict = instances_settings[master_instances_settings]
                 if "AWS" in master_instances_settings:
                     thread_pool_executor.submit(self.parallel_create_spark_masters_on_aws,
                                                 cluster_name,
@@ -238,8 +367,7 @@ class ClusterBuilder:
                                                 ec2m)
             # Parallel Launch Worker Instances.
             for worker_instances_settings in worker_instances_settings_list:
-                worker_instances_settings_dict = parse_config_section(config_parser,
-                                                                      worker_instances_settings + " Settings")
+                worker_instances_settings_dict = instances_settings[worker_instances_settings]
                 if "AWS" in worker_instances_settings:
                     thread_pool_executor.submit(self.parallel_create_spark_workers_on_aws,
                                                 cluster_name,
@@ -250,19 +378,19 @@ class ClusterBuilder:
                                       cluster_name: str,
                                       cluster_settings: dict,
                                       cluster_instances_root_folder: Path,
-                                      cluster_instances_file: Path,
-                                      config_parser: ConfigParser,
                                       ec2m: EC2Manager) -> None:
-        is_existing_cluster_name = check_if_file_exists(cluster_instances_file)
+        # Get Instance Registry.
+        instance_registry = load_instance_registry(cluster_instances_root_folder)
+        is_existing_cluster_name = instance_registry.has_cluster(cluster_name)
         if is_existing_cluster_name:
             # Print the Existing Cluster Message.
-            message = "The instances file of a previously built cluster named '{0}' " \
-                      "was found in the '{1}' folder, as follows:" \
+            message = "The instances of a previously built cluster named '{0}' " \
+                      "were found in the '{1}' folder's registry, as follows:" \
                 .format(cluster_name,
                         cluster_instances_root_folder)
             print(message)
-            # Read the Cluster's Instances File.
-            instances_list = read_instances_file(cluster_instances_file)
+            # Read the Cluster's Registered Instances.
+            instances_list = instance_registry.get_instances(cluster_name)
             # Generate the Cluster Instances Summary (All Providers).
             cluster_instances_summary = generate_cluster_instances_summary(instances_list, ec2m)
             # Print the Existing Cluster Instances Summary.
@@ -271,25 +399,22 @@ class ClusterBuilder:
             # Show the Cluster Build Options Input.
             self.show_cluster_build_options_input(cluster_name,
                                                   cluster_settings,
-                                                  cluster_instances_file,
-                                                  config_parser,
+                                                  instance_registry,
                                                   ec2m)
         else:
             # Build the Cluster from Scratch (New Instances).
             self.build_cluster_from_scratch(cluster_name,
                                             cluster_settings,
-                                            config_parser,
                                             ec2m)
-            # Read the Cluster's Instances File.
-            instances_list = read_instances_file(cluster_instances_file)
+            # Read the Cluster's Registered Instances.
+            instances_list = instance_registry.get_instances(cluster_name)
             # Generate the Cluster Instances Summary (All Providers).
             cluster_instances_summary = generate_cluster_instances_summary(instances_list, ec2m)
             # Print the Recently Created Cluster Instances Summary.
             print_cluster_instances_summary(cluster_name,
                                             cluster_instances_summary)
 
-    def parallel_build_clusters(self,
-                                config_parser: ConfigParser) -> None:
+    def parallel_build_clusters(self) -> None:
         # Get Clusters Settings.
         clusters_settings = self.get_attribute("clusters_settings")
         # Get Clusters Instances Root Folder.
@@ -303,34 +428,50 @@ class ClusterBuilder:
             aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
             # Get AWS Service Setting (EC2).
             aws_service = self.get_attribute("aws_settings")["service"]
-            # Init AWS EC2Manager Object.
-            ec2m = EC2Manager(service_name=aws_service, region_name=aws_region)
+            # Get AWS EC2Manager Object (Pooled).
+            ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
         with ThreadPoolExecutor() as thread_pool_executor:
             for cluster_settings in clusters_settings:
                 cluster_name = cluster_settings["cluster_name"]
-                cluster_instances_file = Path(cluster_instances_root_folder).joinpath(cluster_name)
                 thread_pool_executor.submit(self.parallel_build_clusters_tasks,
                                             cluster_name,
                                             cluster_settings,
                                             cluster_instances_root_folder,
-                                            cluster_instances_file,
-                                            config_parser,
                                             ec2m)
         # Unbind Objects (Garbage Collector).
         del ec2m
 
+    def parallel_build_and_configure_clusters(self,
+                                              cluster_configurator: ClusterConfigurator) -> None:
+        # Stream Each Alive Instance From the Builder to the Configurator.
+        instances_queue = Queue()
+        self.set_attribute("instances_queue", instances_queue)
+        try:
+            with ThreadPoolExecutor() as thread_pool_executor:
+                future = thread_pool_executor.submit(cluster_configurator.configure_instances_from_queue,
+                                                     instances_queue)
+                try:
+                    # Parallel Build Clusters.
+                    self.parallel_build_clusters()
+                finally:
+                    # End the Instances Stream (Even If Building Failed, so the Configurator Returns).
+                    instances_queue.put(None)
+                _, failed_instances_dict = future.result()
+        finally:
+            self.set_attribute("instances_queue", None)
+        # Surface the Configuration Failures (Each One Was Logged by the Configurator, the First Is Raised).
+        if failed_instances_dict:
+            raise next(iter(failed_instances_dict.values()))
+
 
 def build_cluster(arguments_dict: dict) -> None:
     # Get Arguments.
     sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
+    configure_cluster = arguments_dict["configure_cluster"]
     # Init Cluster Builder Object.
     cb = ClusterBuilder(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         cb.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -340,10 +481,19 @@ def build_cluster(arguments_dict: dict) -> None:
     # Instantiate and Set Logger.
     logger = load_logger(enable_logging, logging_settings)
     cb.set_attribute("logger", logger)
-    # Parallel Build Clusters.
-    cb.parallel_build_clusters(cp)
+    if configure_cluster:
+        # Init Cluster Configurator Object (Sharing the Parsed Settings and Logger).
+        cc = ClusterConfigurator(sparking_cloud_config_file)
+        for k, v in sparking_cloud_settings_dict.items():
+            cc.set_attribute(k, v)
+        cc.set_attribute("logger", logger)
+        # Parallel Build Clusters, Configuring Each Instance as Soon as It Is Alive.
+        cb.parallel_build_and_configure_clusters(cc)
+        del cc
+    else:
+        # Parallel Build Clusters.
+        cb.parallel_build_clusters()
     # Unbind Objects (Garbage Collector).
-    del cp
     del cb
 
 
@@ -356,9 +506,13 @@ if __name__ == "__main__":
                     required=False,
                     default=Path("config/sparking_cloud.cfg"),
                     help="Sparking Cloud Config File (default: config/sparking_cloud.cfg)")
+    ag.add_argument("--configure_cluster",
+                    action="store_true",
+                    help="Configure Each Instance as Soon as It Is Alive (default: False)")
     parsed_args = ag.parse_args()
     # Generate Arguments Dict.
-    args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file)}
+    args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
+                 "configure_cluster": bool(parsed_args.configure_cluster)}
     # Build Cluster.
     build_cluster(args_dict)
     # Unbind Objects (Garbage Collector).
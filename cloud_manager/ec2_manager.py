@@ -2,9 +2,18 @@ from botocore import exceptions
 from boto3 import client, resource
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from json import loads
 from socket import AF_INET, SOCK_STREAM, socket
-from time import sleep
+from threading import Lock
+from time import monotonic, sleep
 from typing import Any
+from util.tracing_util import trace_span
+
+# Pricing API's Operating System Names, by the Spot Price History's Product Descriptions.
+pricing_operating_systems = {"Linux/UNIX": "Linux",
+                             "Red Hat Enterprise Linux": "RHEL",
+                             "SUSE Linux": "SUSE",
+                             "Windows": "Windows"}
 
 
 class EC2Manager:
@@ -14,6 +23,12 @@ class EC2Manager:
                  region_name: str) -> None:
         self.ec2_client = client(region_name=region_name, service_name=service_name)
         self.ec2_resource = resource(region_name=region_name, service_name=service_name)
+        self.region_name = region_name
+        # Pricing API Client (Created on First Use, Its Endpoint Lives in 'us-east-1').
+        self.pricing_client = None
+        # Placement Groups Already Created or Found (Instances Are Launched Concurrently).
+        self.placement_groups = set()
+        self.placement_groups_lock = Lock()
 
     def fetch_current_ec2_spot_instance_price(self,
                                               availability_zone: str,
@@ -29,9 +44,99 @@ class EC2Manager:
             current_ec2_spot_instance_price = spot_price_history_json[0].get("SpotPrice")
         return current_ec2_spot_instance_price
 
+    def fetch_ec2_on_demand_instance_price(self,
+                                           instance_type: str,
+                                           operating_system: str) -> float:
+        # On-Demand Hourly Price (USD) of a Shared Tenancy Instance Without Pre-Installed Software.
+        if self.pricing_client is None:
+            self.pricing_client = client(region_name="us-east-1", service_name="pricing")
+        filters = [("regionCode", self.region_name),
+                   ("instanceType", instance_type),
+                   ("operatingSystem", pricing_operating_systems.get(operating_system, operating_system)),
+                   ("tenancy", "Shared"),
+                   ("preInstalledSw", "NA"),
+                   ("capacitystatus", "Used")]
+        query_result_json = \
+            self.pricing_client.get_products(ServiceCode="AmazonEC2",
+                                             Filters=[{"Type": "TERM_MATCH", "Field": field, "Value": value}
+                                                      for field, value in filters],
+                                             MaxResults=1)
+        for price_item in query_result_json.get("PriceList", []):
+            for on_demand_term in loads(price_item).get("terms", {}).get("OnDemand", {}).values():
+                for price_dimension in on_demand_term.get("priceDimensions", {}).values():
+                    return float(price_dimension.get("pricePerUnit", {}).get("USD", 0))
+        return 0
+
+    def describe_ec2_instance_types(self,
+                                    instance_types: list) -> list:
+        # Describe Up to 100 Instance Types Per Request (API Limit), Following the Pagination Tokens.
+        instance_types_info = []
+        paginator = self.ec2_client.get_paginator("describe_instance_types")
+        for batch_begin in range(0, len(instance_types), 100):
+            instance_types_batch = instance_types[batch_begin:batch_begin + 100]
+            for page in paginator.paginate(InstanceTypes=instance_types_batch):
+                instance_types_info.extend(page.get("InstanceTypes", []))
+        return instance_types_info
+
+    @staticmethod
+    def get_placement_group_name(cluster_name: str,
+                                 placement_strategy: str) -> str:
+        # One Placement Group Per Cluster and Strategy (Masters and Workers May Use Different Strategies).
+        return cluster_name + "-" + placement_strategy
+
+    def create_placement_group(self,
+                               placement_group_name: str,
+                               placement_strategy: str,
+                               placement_partition_count: int) -> None:
+        # Create the Placement Group Once (Idempotent: an Existing Group With the Same Name is Reused).
+        with self.placement_groups_lock:
+            if placement_group_name in self.placement_groups:
+                return
+            placement_group_options = {"GroupName": placement_group_name,
+                                       "Strategy": placement_strategy}
+            if placement_strategy == "partition":
+                placement_group_options["PartitionCount"] = placement_partition_count
+            try:
+                self.ec2_client.create_placement_group(**placement_group_options)
+            except exceptions.ClientError as client_error:
+                error_code = client_error.response["Error"]["Code"]
+                if error_code != "InvalidPlacementGroup.Duplicate":
+                    raise client_error
+            self.placement_groups.add(placement_group_name)
+
+    def delete_placement_groups(self,
+                                placement_groups_names_list: list,
+                                timeout_in_seconds: int = 300) -> list:
+        # Delete the Existing Placement Groups Among the Given Names, Returning the Deleted Ones.
+        # A Group Can Only Be Deleted Once Its Instances Are Fully Terminated, Hence the Retries While It Is in Use.
+        query_result_json = \
+            self.ec2_client.describe_placement_groups(Filters=[{"Name": "group-name",
+                                                               "Values": placement_groups_names_list}])
+        existing_placement_groups_names_list = [placement_group["GroupName"] for placement_group
+                                                in query_result_json.get("PlacementGroups", [])]
+        deleted_placement_groups_names_list = []
+        for placement_group_name in existing_placement_groups_names_list:
+            deadline = monotonic() + timeout_in_seconds
+            while True:
+                try:
+                    self.ec2_client.delete_placement_group(GroupName=placement_group_name)
+                    deleted_placement_groups_names_list.append(placement_group_name)
+                    break
+                except exceptions.ClientError as client_error:
+                    error_code = client_error.response["Error"]["Code"]
+                    if error_code == "InvalidPlacementGroup.Unknown":
+                        break
+                    if error_code != "InvalidPlacementGroup.InUse" or monotonic() >= deadline:
+                        raise client_error
+                    sleep(5)
+            with self.placement_groups_lock:
+                self.placement_groups.discard(placement_group_name)
+        return deleted_placement_groups_names_list
+
     def load_ec2_instance_options(self,
                                   instance_name: str,
-                                  instances_settings_dict: dict) -> dict:
+                                  instances_settings_dict: dict,
+                                  placement_group_name: str = None) -> dict:
         instance_operating_system = instances_settings_dict["operating_system"]
         instance_type = instances_settings_dict["type"]
         instance_security_group_ids = instances_settings_dict["security_group_ids"]
@@ -56,6 +161,8 @@ class EC2Manager:
             instance_market_options = {"MarketType": instance_market_type,
                                        "SpotOptions": instance_spot_options}
         instance_placement = {"AvailabilityZone": instance_availability_zone}
+        if placement_group_name:
+            instance_placement["GroupName"] = placement_group_name
         instance_subnet_id = instances_settings_dict["subnet_id"]
         aws_instance_options = {"ImageId": instances_settings_dict["ami_id"],
                                 "InstanceType": instance_type,
@@ -97,6 +204,14 @@ class EC2Manager:
     def get_ec2_instance_public_ipv4_address(instance: any) -> str:
         return instance.public_ip_address
 
+    @staticmethod
+    def get_ec2_instance_private_ipv4_address(instance: any) -> str:
+        return instance.private_ip_address
+
+    @staticmethod
+    def get_ec2_instance_private_dns_name(instance: any) -> str:
+        return instance.private_dns_name
+
     @staticmethod
     def _wait_for_ec2_instance_ssh_port_availability(instance_public_ip_address: str) -> None:
         while True:
@@ -108,13 +223,15 @@ class EC2Manager:
 
     def wait_for_ec2_instance_to_be_alive(self,
                                           instance_id: str) -> None:
-        while True:
-            instance = self._wait_for_ec2_instance_to_start_running(instance_id)
-            instance_public_ip_address = self.get_ec2_instance_public_ipv4_address(instance)
-            if instance_public_ip_address:
-                break
-            sleep(1)
-        self._wait_for_ec2_instance_ssh_port_availability(instance_public_ip_address)
+        with trace_span("wait_until_running", instance_id=instance_id):
+            while True:
+                instance = self._wait_for_ec2_instance_to_start_running(instance_id)
+                instance_public_ip_address = self.get_ec2_instance_public_ipv4_address(instance)
+                if instance_public_ip_address:
+                    break
+                sleep(1)
+        with trace_span("wait_for_ssh_port", instance_id=instance_id, host=instance_public_ip_address):
+            self._wait_for_ec2_instance_ssh_port_availability(instance_public_ip_address)
 
     def wait_for_ec2_instances_to_be_alive(self,
                                            instances_list: list) -> None:
@@ -181,3 +298,18 @@ class EC2Manager:
                 error_code = client_error.response["Error"]["Code"]
                 if error_code == "InvalidInstanceID.NotFound":
                     pass
+
+
+# EC2Manager Objects Pool (One Per Service and Region, Shared Across Tasks and Stages).
+ec2_managers_pool = {}
+ec2_managers_pool_lock = Lock()
+
+
+def get_ec2_manager(service_name: str,
+                    region_name: str) -> EC2Manager:
+    with ec2_managers_pool_lock:
+        ec2_manager_key = (service_name, region_name)
+        if ec2_manager_key not in ec2_managers_pool:
+            ec2_managers_pool[ec2_manager_key] = EC2Manager(service_name=service_name,
+                                                            region_name=region_name)
+        return ec2_managers_pool[ec2_manager_key]
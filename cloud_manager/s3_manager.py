@@ -0,0 +1,44 @@
+from boto3 import client
+from pathlib import Path
+from threading import Lock
+
+
+class S3Manager:
+
+    def __init__(self,
+                 region_name: str,
+                 endpoint_url: str = None) -> None:
+        # The Endpoint URL Points the Client at an S3-Compatible Store (e.g., a Local Stand-In).
+        self.s3_client = client(region_name=region_name, service_name="s3", endpoint_url=endpoint_url or None)
+
+    def list_object_keys(self,
+                         bucket_name: str,
+                         prefix: str) -> list:
+        # List Every Object Key Under the Prefix, Following the Pagination Tokens.
+        object_keys = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            object_keys.extend(s3_object["Key"] for s3_object in page.get("Contents", []))
+        return object_keys
+
+    def download_object(self,
+                        bucket_name: str,
+                        object_key: str,
+                        local_file: Path) -> None:
+        Path(local_file).parent.mkdir(parents=True, exist_ok=True)
+        self.s3_client.download_file(Bucket=bucket_name, Key=object_key, Filename=str(local_file))
+
+
+# S3Manager Objects Pool (One Per Region and Endpoint, Shared Across Tasks and Stages).
+s3_managers_pool = {}
+s3_managers_pool_lock = Lock()
+
+
+def get_s3_manager(region_name: str,
+                   endpoint_url: str = None) -> S3Manager:
+    with s3_managers_pool_lock:
+        s3_manager_key = (region_name, endpoint_url)
+        if s3_manager_key not in s3_managers_pool:
+            s3_managers_pool[s3_manager_key] = S3Manager(region_name=region_name,
+                                                         endpoint_url=endpoint_url)
+        return s3_managers_pool[s3_manager_key]
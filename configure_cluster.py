@@ -1,12 +1,21 @@
 from argparse import ArgumentParser
-from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
 from typing import Any
+from util.cluster_inventory_util import ClusterInventory, InstanceRecord, check_instances_key_files, \
+    load_cluster_inventory
+from util.dependency_jars_util import get_dependency_jars_coordinates, load_dependency_jars, \
+    load_dependency_jars_staging_script
 from util.logging_util import load_logger, log_message
-from util.os_util import check_if_file_exists, find_full_file_name_by_prefix
-from util.process_util import execute_command, remotely_execute_command
-from util.sparking_cloud_util import parse_sparking_cloud_config_file
+from util.local_storage_util import load_local_storage_setup_script
+from util.node_facts_util import gather_instance_facts
+from util.process_util import execute_command, load_rsync_remote_shell, remotely_execute_command
+from util.spark_job_util import encode_remote_script
+from util.spark_properties_util import read_spark_properties_file
+from util.spark_tuner_util import tune_s3a_properties
+from util.sparking_cloud_util import load_sparking_cloud_config_file
+from util.tracing_util import trace_span
 
 
 class ClusterConfigurator:
@@ -31,34 +40,13 @@ class ClusterConfigurator:
                       attribute_name: str) -> Any:
         return getattr(self, attribute_name)
 
-    def read_instances_file(self,
-                            cluster_name: str) -> list:
-        instances_file_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        instances_file = Path(instances_file_root_folder).joinpath(cluster_name)
-        instances_list_parser = ConfigParser()
-        instances_list_parser.optionxform = str
-        instances_list_parser.read(filenames=instances_file,
-                                   encoding="utf-8")
-        instances_list = []
-        for section in instances_list_parser.sections():
-            if "Instance" in section:
-                instance_provider = instances_list_parser.get(section, "provider")
-                instance_name = instances_list_parser.get(section, "name")
-                instance_id = instances_list_parser.get(section, "id")
-                instance_key_name = instances_list_parser.get(section, "key_name")
-                instance_username = instances_list_parser.get(section, "username")
-                instance_public_ipv4_address = instances_list_parser.get(section, "public_ipv4_address")
-                instance_ssh_port = instances_list_parser.get(section, "ssh_port")
-                instance_dict = {"provider": instance_provider,
-                                 "name": instance_name,
-                                 "id": instance_id,
-                                 "key_name": instance_key_name,
-                                 "username": instance_username,
-                                 "public_ipv4_address": instance_public_ipv4_address,
-                                 "ssh_port": instance_ssh_port}
-                instances_list.append(instance_dict)
-        del instances_list_parser
-        return instances_list
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
 
     def store_instance_public_key_on_known_hosts(self,
                                                  instance_public_ipv4_address: str) -> None:
@@ -93,28 +81,15 @@ class ClusterConfigurator:
                             logger_level="DEBUG")
 
     def setup_hadoop_on_master_instance(self,
-                                        instance_dict: dict) -> None:
+                                        instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -141,11 +116,11 @@ class ClusterConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
         # Send the Hadoop Setup Script to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2}@{3}:~/{4}".format(instance_key_file,
-                                                                               hadoop_setup_on_master_script_file,
-                                                                               instance_username,
-                                                                               instance_public_ipv4_address,
-                                                                               destination_folder)
+        local_command = "rsync -q -e '{0}' -r {1} {2}@{3}:~/{4}".format(load_rsync_remote_shell(instance_key_file),
+                                                                        hadoop_setup_on_master_script_file,
+                                                                        instance_username,
+                                                                        instance_public_ipv4_address,
+                                                                        destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -183,28 +158,15 @@ class ClusterConfigurator:
                                  logger_level="DEBUG")
 
     def setup_spark_on_master_instance(self,
-                                       instance_dict: dict) -> None:
+                                       instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -231,11 +193,11 @@ class ClusterConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
         # Send the Spark Setup Script to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2}@{3}:~/{4}".format(instance_key_file,
-                                                                               spark_setup_on_master_script_file,
-                                                                               instance_username,
-                                                                               instance_public_ipv4_address,
-                                                                               destination_folder)
+        local_command = "rsync -q -e '{0}' -r {1} {2}@{3}:~/{4}".format(load_rsync_remote_shell(instance_key_file),
+                                                                        spark_setup_on_master_script_file,
+                                                                        instance_username,
+                                                                        instance_public_ipv4_address,
+                                                                        destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -273,28 +235,15 @@ class ClusterConfigurator:
                                  logger_level="DEBUG")
 
     def setup_hadoop_on_worker_instance(self,
-                                        instance_dict: dict) -> None:
+                                        instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -321,11 +270,11 @@ class ClusterConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
         # Send the Hadoop Setup Script to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2}@{3}:~/{4}".format(instance_key_file,
-                                                                               hadoop_setup_on_worker_script_file,
-                                                                               instance_username,
-                                                                               instance_public_ipv4_address,
-                                                                               destination_folder)
+        local_command = "rsync -q -e '{0}' -r {1} {2}@{3}:~/{4}".format(load_rsync_remote_shell(instance_key_file),
+                                                                        hadoop_setup_on_worker_script_file,
+                                                                        instance_username,
+                                                                        instance_public_ipv4_address,
+                                                                        destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -363,28 +312,15 @@ class ClusterConfigurator:
                                  logger_level="DEBUG")
 
     def setup_spark_on_worker_instance(self,
-                                       instance_dict: dict) -> None:
+                                       instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -411,11 +347,11 @@ class ClusterConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
         # Send the Spark Setup Script to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2}@{3}:~/{4}".format(instance_key_file,
-                                                                               spark_setup_on_worker_script_file,
-                                                                               instance_username,
-                                                                               instance_public_ipv4_address,
-                                                                               destination_folder)
+        local_command = "rsync -q -e '{0}' -r {1} {2}@{3}:~/{4}".format(load_rsync_remote_shell(instance_key_file),
+                                                                        spark_setup_on_worker_script_file,
+                                                                        instance_username,
+                                                                        instance_public_ipv4_address,
+                                                                        destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -452,42 +388,162 @@ class ClusterConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
 
-    def configure_cluster_tasks(self,
-                                cluster_name: str) -> None:
+    def setup_local_storage_on_worker_instance(self,
+                                               instance: InstanceRecord) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        message = "Setting up the local storage on the remote host {0} ({1})..." \
+            .format(instance.public_ipv4_address,
+                    instance.name)
+        log_message(logger, message, "DEBUG")
+        # Remotely Assemble, Format and Mount the Instance-Store Devices (RAID0 If There Are Several).
+        remote_command = encode_remote_script(
+            load_local_storage_setup_script(configuration_rules_settings["local_storage_mount_point"],
+                                            configuration_rules_settings["local_storage_filesystem"]))
+        remotely_execute_command(key_file=instance.key_file,
+                                 username=instance.username,
+                                 public_ipv4_address=instance.public_ipv4_address,
+                                 ssh_port=instance.ssh_port,
+                                 remote_command=remote_command,
+                                 on_new_windows=False,
+                                 request_tty=False,
+                                 max_tries=max_tries,
+                                 time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                 logger=logger,
+                                 logger_level="DEBUG")
+
+    def stage_dependency_jars_on_instance(self,
+                                          instance: InstanceRecord) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        dependency_jars_folder = configuration_rules_settings["dependency_jars_folder"]
+        # Resolve the Dependency Jars Once (Shared by Every Node), Then Stage Them on the Instance.
+        spark_properties = read_spark_properties_file(Path(configuration_rules_settings["properties_file"]))
+        if configuration_rules_settings["tune_s3a_properties"]:
+            # The S3A Committers Need Spark's Cloud Bindings Staged Too.
+            spark_properties.update(tune_s3a_properties(spark_properties, configuration_rules_settings)[0])
+        coordinates = get_dependency_jars_coordinates(configuration_rules_settings, spark_properties)
+        if not coordinates:
+            return
+        dependency_jars = load_dependency_jars(configuration_rules_settings["dependency_jars_repository"],
+                                               coordinates,
+                                               dependency_jars_folder)
+        message = "Staging {0} dependency jar(s) on the remote host {1} ({2})..." \
+            .format(len(dependency_jars),
+                    instance.public_ipv4_address,
+                    instance.name)
+        log_message(logger, message, "DEBUG")
+        remote_command = encode_remote_script(load_dependency_jars_staging_script(dependency_jars_folder,
+                                                                                  dependency_jars))
+        remotely_execute_command(key_file=instance.key_file,
+                                 username=instance.username,
+                                 public_ipv4_address=instance.public_ipv4_address,
+                                 ssh_port=instance.ssh_port,
+                                 remote_command=remote_command,
+                                 on_new_windows=False,
+                                 request_tty=False,
+                                 max_tries=max_tries,
+                                 time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                 logger=logger,
+                                 logger_level="DEBUG")
+
+    def configure_instance_tasks(self,
+                                 instance: InstanceRecord) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Key Root Folder.
+        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         install_hadoop = configuration_rules_settings["install_hadoop"]
         install_spark = configuration_rules_settings["install_spark"]
-        # Read Cluster's Instances File.
-        instances_list = self.read_instances_file(cluster_name)
-        # Parallel Store Instances' Public Keys on 'known_hosts' File.
+        stage_dependency_jars = configuration_rules_settings["stage_dependency_jars"]
+        configure_local_storage = configuration_rules_settings["configure_local_storage"]
+        with trace_span("configure_instance", node=instance.name, role=instance.role, phase="configure"):
+            # Check Instance's Key File.
+            check_instances_key_files([instance], key_root_folder, logger)
+            # Store Instance's Public Key on 'known_hosts' File.
+            self.store_instance_public_key_on_known_hosts(instance.public_ipv4_address)
+            # Remotely Setup Hadoop and Spark on Instance (Master or Worker).
+            if instance.role == "master":
+                if install_hadoop:
+                    self.setup_hadoop_on_master_instance(instance)
+                if install_spark:
+                    self.setup_spark_on_master_instance(instance)
+            elif instance.role == "worker":
+                if install_hadoop:
+                    self.setup_hadoop_on_worker_instance(instance)
+                if install_spark:
+                    self.setup_spark_on_worker_instance(instance)
+                # Put Spark's Shuffle and Spill Files on the Instance-Store Devices (If Any).
+                if configure_local_storage:
+                    self.setup_local_storage_on_worker_instance(instance)
+            # Stage the Jobs' Dependency Jars (Instead of Resolving Them Through Ivy at Every Submit).
+            if stage_dependency_jars:
+                self.stage_dependency_jars_on_instance(instance)
+            # Gather the Instance's Facts, Unless Already Cached (Used by the Start and Tuning Steps).
+            gather_instance_facts(instance,
+                                  self.get_attribute("general_settings")["cluster_instances_root_folder"],
+                                  configuration_rules_settings,
+                                  logger)
+
+    def configure_instances_from_queue(self,
+                                       instances_queue: Queue) -> tuple:
+        # Parallel Configure Instances as Soon as They Are Published (None Ends the Stream).
+        # Returns the Configured Instances and the Failed Ones ({Instance: Exception}).
+        futures = {}
         with ThreadPoolExecutor() as thread_pool_executor:
-            for instance_dict in instances_list:
-                instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-                thread_pool_executor.submit(self.store_instance_public_key_on_known_hosts,
-                                            instance_public_ipv4_address)
-        # Parallel Remotely Setup Hadoop on Instances (Masters and Workers).
-        if install_hadoop:
-            with ThreadPoolExecutor() as thread_pool_executor:
-                for instance_dict in instances_list:
-                    instance_name = instance_dict["name"]
-                    if "master" in instance_name.lower():
-                        thread_pool_executor.submit(self.setup_hadoop_on_master_instance,
-                                                    instance_dict)
-                    elif "worker" in instance_name.lower():
-                        thread_pool_executor.submit(self.setup_hadoop_on_worker_instance,
-                                                    instance_dict)
-        # Parallel Remotely Setup Spark on Instances (Masters and Workers).
-        if install_spark:
-            with ThreadPoolExecutor() as thread_pool_executor:
-                for instance_dict in instances_list:
-                    instance_name = instance_dict["name"]
-                    if "master" in instance_name.lower():
-                        thread_pool_executor.submit(self.setup_spark_on_master_instance,
-                                                    instance_dict)
-                    elif "worker" in instance_name.lower():
-                        thread_pool_executor.submit(self.setup_spark_on_worker_instance,
-                                                    instance_dict)
+            while True:
+                instance = instances_queue.get()
+                if instance is None:
+                    break
+                futures[instance] = thread_pool_executor.submit(self.configure_instance_tasks,
+                                                                instance)
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        configured_instances_list = []
+        failed_instances_dict = {}
+        for instance, future in futures.items():
+            exception = future.exception()
+            if exception is None:
+                configured_instances_list.append(instance)
+            else:
+                message = "The instance '{0}' could not be configured: {1}".format(instance.name, exception)
+                log_message(logger, message, "INFO")
+                failed_instances_dict[instance] = exception
+        return configured_instances_list, failed_instances_dict
+
+    def configure_cluster_tasks(self,
+                                cluster_name: str) -> None:
+        # Get Cluster's Inventory.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        # Parallel Configure Instances (Masters and Workers).
+        # Each instance runs its own 'known_hosts' -> Hadoop -> Spark pipeline, so a slow node
+        # does not hold the remaining ones back between steps.
+        futures = {}
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for instance in cluster_inventory.get_instances():
+                futures[instance] = thread_pool_executor.submit(self.configure_instance_tasks,
+                                                                instance)
+        # Surface the Configuration Failures (Each One Is Logged, the First Is Raised), so Spark Is Not Started.
+        logger = self.get_attribute("logger")
+        failed_instances_dict = {}
+        for instance, future in futures.items():
+            exception = future.exception()
+            if exception is not None:
+                message = "The instance '{0}' could not be configured: {1}".format(instance.name, exception)
+                log_message(logger, message, "INFO")
+                failed_instances_dict[instance] = exception
+        if failed_instances_dict:
+            raise next(iter(failed_instances_dict.values()))
 
     def parallel_configure_clusters(self,
                                     cluster_names: list) -> None:
@@ -499,7 +555,8 @@ class ClusterConfigurator:
                 log_message(logger, message, "INFO")
                 future = thread_pool_executor.submit(self.configure_cluster_tasks,
                                                      cluster_name)
-                wait([future])
+                # Raise the Cluster's First Configuration Failure (Spark Is Not Started on a Partly Configured Cluster).
+                future.result()
                 message = "The Cluster '{0}' was configured successfully!".format(cluster_name)
                 log_message(logger, message, "INFO")
 
@@ -510,14 +567,10 @@ def configure_cluster(arguments_dict: dict) -> None:
     cluster_names = arguments_dict["cluster_names"]
     # Get Cluster Names List.
     cluster_names_list = cluster_names.split(",")
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
     # Init Cluster Configurator Object.
     cc = ClusterConfigurator(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         cc.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -530,7 +583,6 @@ def configure_cluster(arguments_dict: dict) -> None:
     # Parallel Configure Clusters.
     cc.parallel_configure_clusters(cluster_names_list)
     # Unbind Objects (Garbage Collector).
-    del cp
     del cc
     del logger
 
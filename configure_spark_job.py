@@ -1,14 +1,18 @@
 from argparse import ArgumentParser
 from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
 from pathlib import Path
 from typing import Any
-from cloud_manager.ec2_manager import EC2Manager
+from cloud_manager.ec2_manager import get_ec2_manager
 from util.aws_config_util import parse_aws_config_file, parse_aws_credentials_file
+from util.cluster_inventory_util import ClusterInventory, InstanceRecord, load_cluster_inventory
+from util.dependency_jars_util import get_dependency_jars_coordinates, get_dependency_jars_spark_properties, \
+    load_dependency_jars
+from util.instance_type_catalog_util import load_instance_type_catalog
 from util.logging_util import load_logger, log_message
-from util.os_util import check_if_file_exists, find_full_file_name_by_prefix
-from util.process_util import execute_command, remotely_execute_command
-from util.sparking_cloud_util import parse_sparking_cloud_config_file
+from util.process_util import execute_command, load_rsync_remote_shell, remotely_execute_command
+from util.spark_properties_util import read_spark_properties_file, write_spark_properties_file
+from util.spark_tuner_util import tune_executor_layout, tune_s3a_properties
+from util.sparking_cloud_util import load_sparking_cloud_config_file
 
 
 class SparkJobConfigurator:
@@ -24,6 +28,7 @@ class SparkJobConfigurator:
         # Other Attributes.
         self.logger = None
         self.configuration_mode = None
+        self.explain_tuning = False
 
     def set_attribute(self,
                       attribute_name: str,
@@ -34,81 +39,130 @@ class SparkJobConfigurator:
                       attribute_name: str) -> Any:
         return getattr(self, attribute_name)
 
-    def read_instances_file(self,
-                            cluster_name: str) -> list:
-        instances_file_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        instances_file = Path(instances_file_root_folder).joinpath(cluster_name)
-        instances_list_parser = ConfigParser()
-        instances_list_parser.optionxform = str
-        instances_list_parser.read(filenames=instances_file,
-                                   encoding="utf-8")
-        instances_list = []
-        for section in instances_list_parser.sections():
-            if "Instance" in section:
-                instance_provider = instances_list_parser.get(section, "provider")
-                instance_name = instances_list_parser.get(section, "name")
-                instance_id = instances_list_parser.get(section, "id")
-                instance_key_name = instances_list_parser.get(section, "key_name")
-                instance_username = instances_list_parser.get(section, "username")
-                instance_public_ipv4_address = instances_list_parser.get(section, "public_ipv4_address")
-                instance_ssh_port = instances_list_parser.get(section, "ssh_port")
-                instance_dict = {"provider": instance_provider,
-                                 "name": instance_name,
-                                 "id": instance_id,
-                                 "key_name": instance_key_name,
-                                 "username": instance_username,
-                                 "public_ipv4_address": instance_public_ipv4_address,
-                                 "ssh_port": instance_ssh_port}
-                instances_list.append(instance_dict)
-        del instances_list_parser
-        return instances_list
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
 
-    def get_first_running_master_instance_dict(self,
-                                               instances_list: list) -> dict:
-        first_running_master_instance_dict = None
-        for instance_dict in instances_list:
-            instance_name = instance_dict["name"]
-            if "master" in instance_name.lower():
-                instance_provider = instance_dict["provider"]
-                if instance_provider == "AWS":
-                    # Parse AWS Config File.
-                    aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
-                    aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
-                    # Get AWS Service Setting (EC2).
-                    aws_service = self.get_attribute("aws_settings")["service"]
-                    # Init AWS EC2Manager Object.
-                    ec2m = EC2Manager(service_name=aws_service, region_name=aws_region)
-                    instance_id = instance_dict["id"]
-                    instance = ec2m.get_ec2_instance_from_id(instance_id)
-                    if ec2m.is_ec2_instance_running(instance):
-                        first_running_master_instance_dict = instance_dict
-                        del ec2m
-                        break
-        return first_running_master_instance_dict
+    def get_first_running_master_instance(self,
+                                          cluster_inventory: ClusterInventory) -> InstanceRecord:
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
+        return cluster_inventory.get_first_running_master(ec2m)
+
+    def get_workers_hardware_specs(self,
+                                   cluster_inventory: ClusterInventory) -> list:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
+        # Describe the Workers' Instance Types Missing From the Catalog (Batched, Once Per Type).
+        instance_type_catalog = load_instance_type_catalog(cluster_instances_root_folder)
+        workers_list = cluster_inventory.get_workers()
+        instance_type_catalog.fetch_instance_types(aws_region,
+                                                   [worker.type for worker in workers_list if worker.provider == "AWS"],
+                                                   ec2m)
+        # Get Each Worker's vCPUs and Memory (Instance Type Catalog First, Cached Node Facts Otherwise).
+        workers_hardware_specs = []
+        for worker in workers_list:
+            instance_type_specs = None
+            if worker.provider == "AWS":
+                instance_type_specs = instance_type_catalog.get_instance_type(aws_region, worker.type)
+            if instance_type_specs and instance_type_specs["vcpus"] and instance_type_specs["memory_in_mib"]:
+                workers_hardware_specs.append({"vcpus": instance_type_specs["vcpus"],
+                                               "memory_in_kb": instance_type_specs["memory_in_mib"] * 1024})
+            elif worker.facts and worker.facts.get("vcpus") and worker.facts.get("memory_in_kb"):
+                workers_hardware_specs.append({"vcpus": worker.facts["vcpus"],
+                                               "memory_in_kb": worker.facts["memory_in_kb"]})
+        return workers_hardware_specs
+
+    def generate_tuned_properties_file(self,
+                                       cluster_name: str,
+                                       cluster_inventory: ClusterInventory) -> Path:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        properties_file = Path(configuration_rules_settings["properties_file"])
+        tune_spark_properties = configuration_rules_settings["tune_spark_properties"]
+        stage_dependency_jars = configuration_rules_settings["stage_dependency_jars"]
+        tune_s3a = configuration_rules_settings["tune_s3a_properties"]
+        if not tune_spark_properties and not stage_dependency_jars and not tune_s3a:
+            return properties_file
+        properties = read_spark_properties_file(properties_file)
+        comments = ["Generated for the Cluster '{0}' from '{1}'.".format(cluster_name, properties_file)]
+        tuned = False
+        if tune_spark_properties:
+            # Get the Workers' Hardware Specs (Keeps the Static Executor Layout If Any Worker Is Unknown).
+            workers_hardware_specs = self.get_workers_hardware_specs(cluster_inventory)
+            if not workers_hardware_specs or len(workers_hardware_specs) < len(cluster_inventory.get_workers()):
+                message = "The hardware of the Cluster '{0}' workers is not fully known, " \
+                          "keeping the '{1}' properties file untuned!".format(cluster_name, properties_file)
+                log_message(logger, message, "INFO")
+            else:
+                # Compute the Executor Layout and Override the Static Properties With It.
+                tuned_properties, explanation = tune_executor_layout(workers_hardware_specs,
+                                                                     configuration_rules_settings)
+                properties.update(tuned_properties)
+                comments.extend(explanation)
+                tuned = True
+                # Show the Reasoning (Explain Mode) or Log It.
+                explain_tuning = self.get_attribute("explain_tuning")
+                message = "Spark executor layout of the Cluster '{0}':\n\t{1}" \
+                    .format(cluster_name, "\n\t".join(explanation))
+                log_message(logger, message, "INFO" if explain_tuning else "DEBUG")
+        if tune_s3a:
+            # Generate the S3A Throughput Profile (Sized by the Executor Cores Above).
+            s3a_properties, s3a_explanation = tune_s3a_properties(properties, configuration_rules_settings)
+            properties.update(s3a_properties)
+            comments.extend(s3a_explanation)
+            tuned = True
+            message = "S3A profile of the Cluster '{0}':\n\t{1}".format(cluster_name, "\n\t".join(s3a_explanation))
+            log_message(logger, message, "INFO" if self.get_attribute("explain_tuning") else "DEBUG")
+        if stage_dependency_jars:
+            # Point the Jobs at the Jars Staged on Every Node (Instead of Resolving 'spark.jars.packages').
+            coordinates = get_dependency_jars_coordinates(configuration_rules_settings, properties)
+            if coordinates:
+                dependency_jars = load_dependency_jars(configuration_rules_settings["dependency_jars_repository"],
+                                                       coordinates,
+                                                       configuration_rules_settings["dependency_jars_folder"])
+                properties = get_dependency_jars_spark_properties(properties, dependency_jars)
+                comments.append("Dependency jars staged under '{0}': {1}."
+                                .format(configuration_rules_settings["dependency_jars_folder"],
+                                        ", ".join(coordinates)))
+                tuned = True
+        if not tuned:
+            return properties_file
+        # Write the Cluster-Specific Properties File (Same File Name, so the Remote Path is Unchanged).
+        tuned_properties_file = Path(cluster_instances_root_folder).joinpath(cluster_name, properties_file.name)
+        write_spark_properties_file(tuned_properties_file, properties, comments)
+        return tuned_properties_file
 
     def send_application_settings_files_to_instance(self,
-                                                    instance_dict: dict) -> None:
+                                                    instance: InstanceRecord,
+                                                    local_properties_file: Path) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -129,13 +183,13 @@ class SparkJobConfigurator:
                                  logger_level="DEBUG")
         properties_file = configuration_rules_settings["properties_file"]
         pool_properties_file = configuration_rules_settings["pool_properties_file"]
-        # Send the Spark Defaults and the Spark Scheduler Allocation Files to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2} {3}@{4}:~/{5}".format(instance_key_file,
-                                                                                   properties_file,
-                                                                                   pool_properties_file,
-                                                                                   instance_username,
-                                                                                   instance_public_ipv4_address,
-                                                                                   destination_folder)
+        # Send the Spark Defaults (Tuned for the Cluster, If Enabled) and the Spark Scheduler Allocation Files.
+        local_command = "rsync -q -e '{0}' -r {1} {2} {3}@{4}:~/{5}".format(load_rsync_remote_shell(instance_key_file),
+                                                                            local_properties_file,
+                                                                            pool_properties_file,
+                                                                            instance_username,
+                                                                            instance_public_ipv4_address,
+                                                                            destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -175,28 +229,15 @@ class SparkJobConfigurator:
                                  logger_level="DEBUG")
 
     def send_application_to_instance(self,
-                                     instance_dict: dict) -> None:
+                                     instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -236,11 +277,11 @@ class SparkJobConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
         # Send the Application to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2}@{3}:~/{4}".format(instance_key_file,
-                                                                               application_folder,
-                                                                               instance_username,
-                                                                               instance_public_ipv4_address,
-                                                                               application_destination_folder)
+        local_command = "rsync -q -e '{0}' -r {1} {2}@{3}:~/{4}".format(load_rsync_remote_shell(instance_key_file),
+                                                                        application_folder,
+                                                                        instance_username,
+                                                                        instance_public_ipv4_address,
+                                                                        application_destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -249,28 +290,15 @@ class SparkJobConfigurator:
                         logger_level="DEBUG")
 
     def send_input_to_instance(self,
-                               instance_dict: dict) -> None:
+                               instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -311,11 +339,11 @@ class SparkJobConfigurator:
                                  logger=logger,
                                  logger_level="DEBUG")
         # Send the Input to the Remote Host.
-        local_command = "rsync -q -e 'ssh -i {0}' -r {1} {2}@{3}:~/{4}".format(instance_key_file,
-                                                                               input_folder,
-                                                                               instance_username,
-                                                                               instance_public_ipv4_address,
-                                                                               application_input_destination_folder)
+        local_command = "rsync -q -e '{0}' -r {1} {2}@{3}:~/{4}".format(load_rsync_remote_shell(instance_key_file),
+                                                                        input_folder,
+                                                                        instance_username,
+                                                                        instance_public_ipv4_address,
+                                                                        application_input_destination_folder)
         execute_command(command=local_command,
                         on_new_windows=False,
                         max_tries=max_tries,
@@ -327,29 +355,33 @@ class SparkJobConfigurator:
                                   cluster_name: str) -> None:
         # Get Configuration Mode.
         configuration_mode = self.get_attribute("configuration_mode")
-        # Read Cluster's Instances File.
-        instances_list = self.read_instances_file(cluster_name)
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Cluster's Inventory.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        cluster_inventory.check_key_files(logger)
         # Get Input Folder.
         send_local_input_folder = self.get_attribute("configuration_rules_settings")["send_local_input_folder"]
         if configuration_mode == "full":
+            # Generate the Cluster-Specific Properties File (Executor Layout Tuned to the Workers).
+            local_properties_file = self.generate_tuned_properties_file(cluster_name, cluster_inventory)
             # Parallel Send the Spark Application and Input for Instances (Masters and Workers).
             with ThreadPoolExecutor() as thread_pool_executor:
-                for instance_dict in instances_list:
-                    instance_name = instance_dict["name"]
-                    if "master" in instance_name.lower():
-                        thread_pool_executor.submit(self.send_application_to_instance,
-                                                    instance_dict)
-                        thread_pool_executor.submit(self.send_application_settings_files_to_instance,
-                                                    instance_dict)
-                        if send_local_input_folder:
-                            thread_pool_executor.submit(self.send_input_to_instance,
-                                                        instance_dict)
-                    elif "worker" in instance_name.lower():
-                        thread_pool_executor.submit(self.send_application_to_instance,
-                                                    instance_dict)
-                        if send_local_input_folder:
-                            thread_pool_executor.submit(self.send_input_to_instance,
-                                                        instance_dict)
+                for instance in cluster_inventory.get_masters():
+                    thread_pool_executor.submit(self.send_application_to_instance,
+                                                instance)
+                    thread_pool_executor.submit(self.send_application_settings_files_to_instance,
+                                                instance,
+                                                local_properties_file)
+                    if send_local_input_folder:
+                        thread_pool_executor.submit(self.send_input_to_instance,
+                                                    instance)
+                for instance in cluster_inventory.get_workers():
+                    thread_pool_executor.submit(self.send_application_to_instance,
+                                                instance)
+                    if send_local_input_folder:
+                        thread_pool_executor.submit(self.send_input_to_instance,
+                                                    instance)
 
     def parallel_configure_spark_jobs(self,
                                       cluster_names: list) -> None:
@@ -371,16 +403,13 @@ def configure_spark_job(arguments_dict: dict) -> None:
     sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
     cluster_names = arguments_dict["cluster_names"]
     configuration_mode = arguments_dict["configuration_mode"]
+    explain_tuning = arguments_dict["explain_tuning"]
     # Get Cluster Names List.
     cluster_names_list = cluster_names.split(",")
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
     # Init Spark Job Configurator Object.
     sjc = SparkJobConfigurator(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         sjc.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -392,10 +421,11 @@ def configure_spark_job(arguments_dict: dict) -> None:
     sjc.set_attribute("logger", logger)
     # Set Configuration Mode.
     sjc.set_attribute("configuration_mode", configuration_mode)
+    # Set Explain Tuning Mode.
+    sjc.set_attribute("explain_tuning", explain_tuning)
     # Parallel Configure Spark Jobs.
     sjc.parallel_configure_spark_jobs(cluster_names_list)
     # Unbind Objects (Garbage Collector).
-    del cp
     del sjc
     del logger
 
@@ -417,11 +447,15 @@ if __name__ == "__main__":
                     type=str,
                     required=True,
                     help="Configuration Mode (e.g., full)")
+    ag.add_argument("--explain_tuning",
+                    action="store_true",
+                    help="Show the Reasoning Behind the Tuned Spark Executor Layout (default: False)")
     parsed_args = ag.parse_args()
     # Generate Arguments Dict.
     args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
                  "cluster_names": str(parsed_args.cluster_names),
-                 "configuration_mode": str(parsed_args.configuration_mode)}
+                 "configuration_mode": str(parsed_args.configuration_mode),
+                 "explain_tuning": bool(parsed_args.explain_tuning)}
     # Configure Spark Job.
     configure_spark_job(args_dict)
     # Unbind Objects (Garbage Collector).
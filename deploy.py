@@ -0,0 +1,243 @@
+from argparse import ArgumentParser
+from datetime import datetime
+from logging import Logger
+from pathlib import Path
+from typing import Any
+from build_cluster import ClusterBuilder
+from configure_cluster import ClusterConfigurator
+from configure_spark_job import SparkJobConfigurator
+from start_spark import SparkStarter
+from submit_spark_job import SparkJobSubmitter
+from util.logging_util import load_logger, log_message
+from util.process_util import enable_ssh_connection_sharing
+from util.sparking_cloud_util import load_sparking_cloud_config_file
+from util.tracing_util import enable_tracing, get_tracer, trace_span
+
+# Deployment Lifecycle Stages (In Execution Order).
+deploy_stages = ["build", "configure", "start", "configure_job", "submit"]
+
+
+class Deployer:
+
+    def __init__(self,
+                 sparking_cloud_config_file: Path) -> None:
+        self.sparking_cloud_config_file = sparking_cloud_config_file
+        # Sparking Cloud's Config File Settings.
+        self.sparking_cloud_settings = None
+        # Other Attributes.
+        self.logger = None
+        self.cluster_names = None
+        self.stages = None
+        self.configuration_mode = None
+        self.detached = False
+
+    def set_attribute(self,
+                      attribute_name: str,
+                      attribute_value: Any) -> None:
+        setattr(self, attribute_name, attribute_value)
+
+    def get_attribute(self,
+                      attribute_name: str) -> Any:
+        return getattr(self, attribute_name)
+
+    def load_stage_object(self,
+                          stage_class: type) -> Any:
+        # Init the Stage Object Sharing the Already Parsed Settings and the Logger.
+        stage_object = stage_class(self.get_attribute("sparking_cloud_config_file"))
+        sparking_cloud_settings = self.get_attribute("sparking_cloud_settings")
+        for k, v in sparking_cloud_settings.items():
+            stage_object.set_attribute(k, v)
+        stage_object.set_attribute("logger", self.get_attribute("logger"))
+        return stage_object
+
+    def run_build_stage(self) -> None:
+        # Get Cluster Names and Stages.
+        cluster_names = self.get_attribute("cluster_names")
+        stages = self.get_attribute("stages")
+        # Load the Cluster Builder (Only the Selected Clusters).
+        cb = self.load_stage_object(ClusterBuilder)
+        clusters_settings = [cluster_settings for cluster_settings in cb.get_attribute("clusters_settings")
+                             if cluster_settings["cluster_name"] in cluster_names]
+        cb.set_attribute("clusters_settings", clusters_settings)
+        if "configure" in stages:
+            # Build and Configure Together (Each Instance is Configured as Soon as It Is Alive).
+            cc = self.load_stage_object(ClusterConfigurator)
+            cb.parallel_build_and_configure_clusters(cc)
+            del cc
+        else:
+            cb.parallel_build_clusters()
+        del cb
+
+    def deploy_clusters(self) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Cluster Names, Stages and Configuration Mode.
+        cluster_names = self.get_attribute("cluster_names")
+        stages = self.get_attribute("stages")
+        configuration_mode = self.get_attribute("configuration_mode")
+        message = "Deploying the Cluster(s) {0} (Stages: {1})...".format(cluster_names, stages)
+        log_message(logger, message, "INFO")
+        # Build (and Configure) Stage.
+        if "build" in stages:
+            with trace_span("build", stage="build", phase="build"):
+                self.run_build_stage()
+        # Configure Stage (Already Streamed Alongside the Build Stage, If Both Were Selected).
+        elif "configure" in stages:
+            with trace_span("configure", stage="configure", phase="configure"):
+                cc = self.load_stage_object(ClusterConfigurator)
+                cc.parallel_configure_clusters(cluster_names)
+                del cc
+        # Start Stage.
+        if "start" in stages:
+            with trace_span("start", stage="start", phase="start"):
+                ss = self.load_stage_object(SparkStarter)
+                ss.parallel_start_spark_clusters(cluster_names)
+                del ss
+        # Configure Job Stage.
+        if "configure_job" in stages:
+            with trace_span("configure_job", stage="configure_job", phase="configure_job"):
+                sjc = self.load_stage_object(SparkJobConfigurator)
+                sjc.set_attribute("configuration_mode", configuration_mode)
+                sjc.parallel_configure_spark_jobs(cluster_names)
+                del sjc
+        # Submit Stage.
+        if "submit" in stages:
+            with trace_span("submit", stage="submit", phase="submit"):
+                sjs = self.load_stage_object(SparkJobSubmitter)
+                sjs.set_attribute("detached", self.get_attribute("detached"))
+                sjs.parallel_submit_spark_jobs(cluster_names)
+                del sjs
+        message = "The Cluster(s) {0} were deployed successfully!".format(cluster_names)
+        log_message(logger, message, "INFO")
+
+
+def log_trace_summary(logger: Logger,
+                      trace_folder: str) -> None:
+    exported_files, summary = get_tracer().export(Path(trace_folder))
+    message = "Run traced in {0:.1f} seconds! Trace files: {1}." \
+        .format(summary["total_duration_in_seconds"],
+                ", ".join(str(exported_file) for exported_file in exported_files))
+    log_message(logger, message, "INFO")
+    critical_path = " -> ".join("{0} ({1}, {2:.1f}s)".format(step["name"], step["node"], step["duration_in_seconds"])
+                                for step in summary["critical_path"])
+    message = "Critical path: {0}.".format(critical_path or "none")
+    log_message(logger, message, "INFO")
+    slowest_nodes = ", ".join("{0} ({1:.1f}s)".format(node["node"], node["duration_in_seconds"])
+                              for node in summary["slowest_nodes"][:5])
+    message = "Slowest nodes: {0}.".format(slowest_nodes or "none")
+    log_message(logger, message, "INFO")
+    retry_hotspots = ", ".join("{0} on {1} ({2} retries)".format(hotspot["name"], hotspot["node"], hotspot["retries"])
+                               for hotspot in summary["retry_hotspots"][:5])
+    message = "Retry hotspots: {0}.".format(retry_hotspots or "none")
+    log_message(logger, message, "INFO")
+
+
+def deploy(arguments_dict: dict) -> None:
+    # Get Arguments.
+    sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
+    cluster_names = arguments_dict["cluster_names"]
+    stages = arguments_dict["stages"]
+    configuration_mode = arguments_dict["configuration_mode"]
+    ssh_control_persist_in_seconds = arguments_dict["ssh_control_persist_in_seconds"]
+    detached = arguments_dict["detached"]
+    trace_folder = arguments_dict["trace_folder"]
+    # Get Stages List (Always Executed in the Lifecycle Order).
+    stages_list = stages.split(",")
+    invalid_stages_list = [stage for stage in stages_list if stage not in deploy_stages]
+    if invalid_stages_list:
+        message = "Invalid stage(s) {0}! Supported stages: {1}.".format(invalid_stages_list, deploy_stages)
+        raise ValueError(message)
+    stages_list = [stage for stage in deploy_stages if stage in stages_list]
+    # Init Deployer Object.
+    dp = Deployer(sparking_cloud_config_file)
+    # Load Sparking Cloud Config File Only Once for All Stages (Validated and Cached).
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
+    dp.set_attribute("sparking_cloud_settings", sparking_cloud_settings_dict)
+    # Get Cluster Names List (Default: All Clusters of the Config File).
+    if cluster_names:
+        cluster_names_list = cluster_names.split(",")
+    else:
+        cluster_names_list = sparking_cloud_settings_dict["general_settings"]["cluster_names"]
+    dp.set_attribute("cluster_names", cluster_names_list)
+    dp.set_attribute("stages", stages_list)
+    dp.set_attribute("configuration_mode", configuration_mode)
+    dp.set_attribute("detached", detached)
+    # Check if Logging is Enabled.
+    enable_logging = sparking_cloud_settings_dict["general_settings"]["enable_logging"]
+    # Get Logging Settings.
+    logging_settings = sparking_cloud_settings_dict.get("logging_settings")
+    # Instantiate and Set Logger (Shared by All Stages).
+    logger = load_logger(enable_logging, logging_settings)
+    dp.set_attribute("logger", logger)
+    # Keep SSH Connections Warm Across Stages.
+    if ssh_control_persist_in_seconds > 0:
+        control_sockets_folder = Path.home().joinpath(".ssh", "sparking_cloud")
+        enable_ssh_connection_sharing(control_sockets_folder,
+                                      ssh_control_persist_in_seconds)
+    # Trace the Stages, Instances and Commands of the Run (Unless Disabled).
+    if trace_folder:
+        enable_tracing("deploy_{0}".format(datetime.now().strftime("%Y%m%d%H%M%S")))
+    try:
+        # Deploy Clusters.
+        dp.deploy_clusters()
+    finally:
+        # Export the Run's Trace and Log Its Summary (Failed Runs Included).
+        if trace_folder:
+            log_trace_summary(logger, trace_folder)
+    # Unbind Objects (Garbage Collector).
+    del dp
+    del logger
+
+
+if __name__ == "__main__":
+    # Begin.
+    # Parse Deployer Arguments.
+    ag = ArgumentParser(description="Deployer Arguments")
+    ag.add_argument("--sparking_cloud_config_file",
+                    type=Path,
+                    required=False,
+                    default=Path("config/sparking_cloud.cfg"),
+                    help="Sparking Cloud Config File (default: config/sparking_cloud.cfg)")
+    ag.add_argument("--cluster_names",
+                    type=str,
+                    required=False,
+                    default="",
+                    help="Cluster Names (default: all clusters of the config file)")
+    ag.add_argument("--stages",
+                    type=str,
+                    required=False,
+                    default=",".join(deploy_stages),
+                    help="Stages (default: {0})".format(",".join(deploy_stages)))
+    ag.add_argument("--configuration_mode",
+                    type=str,
+                    required=False,
+                    default="full",
+                    help="Spark Job Configuration Mode (default: full)")
+    ag.add_argument("--ssh_control_persist_in_seconds",
+                    type=int,
+                    required=False,
+                    default=300,
+                    help="Idle Time to Keep Shared SSH Connections Open, 0 to Disable (default: 300)")
+    ag.add_argument("--detached",
+                    action="store_true",
+                    help="Submit the Spark Job Headless, Detached From the SSH Session (default: False)")
+    ag.add_argument("--trace_folder",
+                    type=str,
+                    required=False,
+                    default="",
+                    help="Folder of the Run's Chrome Trace, Spans and Summary Files (default: tracing disabled)")
+    parsed_args = ag.parse_args()
+    # Generate Arguments Dict.
+    args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
+                 "cluster_names": str(parsed_args.cluster_names),
+                 "stages": str(parsed_args.stages),
+                 "configuration_mode": str(parsed_args.configuration_mode),
+                 "ssh_control_persist_in_seconds": int(parsed_args.ssh_control_persist_in_seconds),
+                 "detached": bool(parsed_args.detached),
+                 "trace_folder": str(parsed_args.trace_folder)}
+    # Deploy.
+    deploy(args_dict)
+    # Unbind Objects (Garbage Collector).
+    del ag
+    # End.
+    exit(0)
@@ -0,0 +1,272 @@
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Optional
+from cloud_manager.ec2_manager import get_ec2_manager
+from cloud_manager.s3_manager import S3Manager, get_s3_manager
+from util.aws_config_util import parse_aws_config_file
+from util.cluster_inventory_util import ClusterInventory, InstanceRecord, load_cluster_inventory
+from util.event_log_util import find_event_log_name, get_event_log_dir, get_finished_event_log_names, \
+    is_local_event_log_dir, split_s3a_event_log_dir
+from util.logging_util import load_logger, log_message
+from util.process_util import execute_command, load_rsync_remote_shell, remotely_execute_command
+from util.spark_properties_util import read_spark_properties_file
+from util.sparking_cloud_util import load_sparking_cloud_config_file
+
+
+class SparkEventLogFetcher:
+
+    def __init__(self,
+                 sparking_cloud_config_file: Path) -> None:
+        self.sparking_cloud_config_file = sparking_cloud_config_file
+        # Sparking Cloud's Config File Settings.
+        self.general_settings = None
+        self.logging_settings = None
+        self.aws_settings = None
+        self.configuration_rules_settings = None
+        # Other Attributes.
+        self.logger = None
+
+    def set_attribute(self,
+                      attribute_name: str,
+                      attribute_value: Any) -> None:
+        setattr(self, attribute_name, attribute_value)
+
+    def get_attribute(self,
+                      attribute_name: str) -> Any:
+        return getattr(self, attribute_name)
+
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
+
+    def get_first_running_master_instance(self,
+                                          cluster_inventory: ClusterInventory) -> InstanceRecord:
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
+        return cluster_inventory.get_first_running_master(ec2m)
+
+    def get_local_event_logs_folder(self,
+                                    cluster_name: str) -> Path:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        local_event_logs_folder = Path(cluster_instances_root_folder).joinpath(cluster_name, "event_logs")
+        local_event_logs_folder.mkdir(parents=True, exist_ok=True)
+        return local_event_logs_folder
+
+    def get_s3_manager(self,
+                       cluster_name: str) -> S3Manager:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Reach the Same Store as the Drivers: the S3A Endpoint of the Properties Sent to the Cluster (If Any).
+        properties_file = Path(configuration_rules_settings["properties_file"])
+        tuned_properties_file = Path(cluster_instances_root_folder).joinpath(cluster_name, properties_file.name)
+        spark_properties = read_spark_properties_file(tuned_properties_file if tuned_properties_file.is_file()
+                                                      else properties_file)
+        endpoint_url = spark_properties.get("spark.hadoop.fs.s3a.endpoint")
+        if endpoint_url and "://" not in endpoint_url:
+            ssl_enabled = spark_properties.get("spark.hadoop.fs.s3a.connection.ssl.enabled", "true") == "true"
+            endpoint_url = "{0}://{1}".format("https" if ssl_enabled else "http", endpoint_url)
+        return get_s3_manager(aws_region, endpoint_url)
+
+    def list_remote_event_logs(self,
+                               cluster_name: str,
+                               master_instance: Optional[InstanceRecord]) -> list:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        event_log_dir = get_event_log_dir(configuration_rules_settings)
+        # Finished Event Log Names (Files, or Folders When Rolling) Directly Under the Event Log Location.
+        # The Rolling Folders' Files Are Listed Too, to Tell the Running Applications' Ones Apart.
+        if not is_local_event_log_dir(event_log_dir):
+            bucket_name, prefix = split_s3a_event_log_dir(event_log_dir)
+            object_keys = self.get_s3_manager(cluster_name).list_object_keys(bucket_name, prefix)
+            return get_finished_event_log_names([object_key[len(prefix):] for object_key in object_keys])
+        remote_command = "cd {0} 2> /dev/null && find . -mindepth 1 -maxdepth 2; true" \
+            .format(event_log_dir[len("file://"):])
+        process_stdout = remotely_execute_command(key_file=master_instance.key_file,
+                                                  username=master_instance.username,
+                                                  public_ipv4_address=master_instance.public_ipv4_address,
+                                                  ssh_port=master_instance.ssh_port,
+                                                  remote_command=remote_command,
+                                                  on_new_windows=False,
+                                                  request_tty=False,
+                                                  max_tries=max_tries,
+                                                  time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                                  logger=logger,
+                                                  logger_level="DEBUG")
+        return get_finished_event_log_names([event_log_path[len("./"):] for line in process_stdout
+                                             for event_log_path in line.split() if event_log_path.startswith("./")])
+
+    def fetch_event_log(self,
+                        cluster_name: str,
+                        master_instance: Optional[InstanceRecord],
+                        event_log_name: str) -> Path:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        event_log_dir = get_event_log_dir(configuration_rules_settings)
+        local_event_logs_folder = self.get_local_event_logs_folder(cluster_name)
+        local_event_log_path = local_event_logs_folder.joinpath(event_log_name)
+        # Finished Event Logs Never Change: Fetched Once (Running Applications' Logs Are Never Listed).
+        if local_event_log_path.exists():
+            return local_event_log_path
+        if not is_local_event_log_dir(event_log_dir):
+            # Download the Object (or Every Object of a Rolling Event Log's Folder).
+            bucket_name, prefix = split_s3a_event_log_dir(event_log_dir)
+            s3m = self.get_s3_manager(cluster_name)
+            for object_key in s3m.list_object_keys(bucket_name, prefix + event_log_name):
+                relative_object_key = object_key[len(prefix):]
+                if relative_object_key == event_log_name or relative_object_key.startswith(event_log_name + "/"):
+                    s3m.download_object(bucket_name, object_key, local_event_logs_folder.joinpath(relative_object_key))
+        else:
+            # Copy the File (or the Rolling Event Log's Folder) From the Master.
+            remote_event_log_path = Path(event_log_dir[len("file://"):]).joinpath(event_log_name)
+            remote_shell = load_rsync_remote_shell(master_instance.key_file)
+            local_command = "rsync -q -r -e '{0}' {1}@{2}:{3} {4}/".format(remote_shell,
+                                                                           master_instance.username,
+                                                                           master_instance.public_ipv4_address,
+                                                                           remote_event_log_path,
+                                                                           local_event_logs_folder)
+            execute_command(command=local_command,
+                            on_new_windows=False,
+                            max_tries=max_tries,
+                            time_between_retries_in_seconds=time_between_retries_in_seconds,
+                            logger=logger,
+                            logger_level="DEBUG")
+        return local_event_log_path
+
+    def fetch_application_event_log(self,
+                                    cluster_name: str,
+                                    master_instance: Optional[InstanceRecord],
+                                    application_id: str) -> Optional[Path]:
+        # Fetch the Application's Finished Event Log (None If It Was Not Logged, or Is Still in Progress).
+        event_log_name = find_event_log_name(self.list_remote_event_logs(cluster_name, master_instance),
+                                             application_id)
+        if event_log_name is None:
+            return None
+        return self.fetch_event_log(cluster_name, master_instance, event_log_name)
+
+    def fetch_event_logs_tasks(self,
+                               cluster_name: str,
+                               application_ids_list: list) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        # Shared Event Logs Outlive the Cluster; the Master's Disk Requires a Running Master.
+        master_instance = None
+        if is_local_event_log_dir(get_event_log_dir(configuration_rules_settings)):
+            cluster_inventory = self.get_cluster_inventory(cluster_name)
+            cluster_inventory.check_key_files(logger)
+            master_instance = self.get_first_running_master_instance(cluster_inventory)
+        event_log_names = self.list_remote_event_logs(cluster_name, master_instance)
+        if application_ids_list:
+            event_log_names = [find_event_log_name(event_log_names, application_id)
+                               for application_id in application_ids_list]
+        event_log_names = [event_log_name for event_log_name in event_log_names if event_log_name]
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for event_log_name in event_log_names:
+                thread_pool_executor.submit(self.fetch_event_log,
+                                            cluster_name,
+                                            master_instance,
+                                            event_log_name)
+        message = "Fetched {0} event log(s) of the Cluster '{1}' into '{2}'." \
+            .format(len(event_log_names),
+                    cluster_name,
+                    self.get_local_event_logs_folder(cluster_name))
+        log_message(logger, message, "INFO")
+
+    def parallel_fetch_event_logs(self,
+                                  cluster_names: list,
+                                  application_ids_list: list) -> None:
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for cluster_name in cluster_names:
+                # Get Logger.
+                logger = self.get_attribute("logger")
+                message = "Fetching the event logs of the Cluster '{0}'...".format(cluster_name)
+                log_message(logger, message, "INFO")
+                future = thread_pool_executor.submit(self.fetch_event_logs_tasks,
+                                                     cluster_name,
+                                                     application_ids_list)
+                wait([future])
+
+
+def fetch_event_logs(arguments_dict: dict) -> None:
+    # Get Arguments.
+    sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
+    cluster_names = arguments_dict["cluster_names"]
+    application_ids = arguments_dict["application_ids"]
+    # Get Cluster Names and Application IDs Lists.
+    cluster_names_list = cluster_names.split(",")
+    application_ids_list = application_ids.split(",") if application_ids else []
+    # Init Spark Event Log Fetcher Object.
+    elf = SparkEventLogFetcher(sparking_cloud_config_file)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
+    for k, v in sparking_cloud_settings_dict.items():
+        elf.set_attribute(k, v)
+    # Check if Logging is Enabled.
+    enable_logging = elf.get_attribute("general_settings")["enable_logging"]
+    # Get Logging Settings.
+    logging_settings = elf.get_attribute("logging_settings")
+    # Instantiate and Set Logger.
+    logger = load_logger(enable_logging, logging_settings)
+    elf.set_attribute("logger", logger)
+    # Parallel Fetch the Clusters' Event Logs.
+    elf.parallel_fetch_event_logs(cluster_names_list,
+                                  application_ids_list)
+    # Unbind Objects (Garbage Collector).
+    del elf
+    del logger
+
+
+if __name__ == "__main__":
+    # Begin.
+    # Parse Event Log Fetcher Arguments.
+    ag = ArgumentParser(description="Event Log Fetcher Arguments")
+    ag.add_argument("--sparking_cloud_config_file",
+                    type=Path,
+                    required=False,
+                    default=Path("config/sparking_cloud.cfg"),
+                    help="Sparking Cloud Config File (default: config/sparking_cloud.cfg)")
+    ag.add_argument("--cluster_names",
+                    type=str,
+                    required=True,
+                    help="Cluster Names (no default)")
+    ag.add_argument("--application_ids",
+                    type=str,
+                    required=False,
+                    default="",
+                    help="Application IDs, e.g., app-20240101000000-0000 (default: every finished application)")
+    parsed_args = ag.parse_args()
+    # Generate Arguments Dict.
+    args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
+                 "cluster_names": str(parsed_args.cluster_names),
+                 "application_ids": str(parsed_args.application_ids)}
+    # Fetch Event Logs.
+    fetch_event_logs(args_dict)
+    # Unbind Objects (Garbage Collector).
+    del ag
+    # End.
+    exit(0)
@@ -0,0 +1,320 @@
+from argparse import ArgumentParser
+from configparser import ConfigParser
+from pathlib import Path
+from typing import Any
+from cloud_manager.ec2_manager import EC2Manager, get_ec2_manager
+from util.aws_config_util import parse_aws_config_file
+from util.instance_price_cache_util import load_instance_price_cache
+from util.instance_type_catalog_util import load_instance_type_catalog
+from util.logging_util import load_logger, log_message
+from util.shape_planner_util import fit_scaling_model, get_job_runs, recommend_cluster_shape, \
+    render_settings_section, shape_planner_objectives
+from util.spark_job_util import load_spark_job_records
+from util.sparking_cloud_util import load_sparking_cloud_config_file
+
+
+class ClusterShapePlanner:
+
+    def __init__(self,
+                 sparking_cloud_config_file: Path) -> None:
+        self.sparking_cloud_config_file = sparking_cloud_config_file
+        # Sparking Cloud's Config File Settings.
+        self.general_settings = None
+        self.logging_settings = None
+        self.clusters_settings = None
+        self.instances_settings = None
+        self.aws_settings = None
+        self.configuration_rules_settings = None
+        # Other Attributes.
+        self.logger = None
+        self.price_max_age_in_seconds = 3600
+
+    def set_attribute(self,
+                      attribute_name: str,
+                      attribute_value: Any) -> None:
+        setattr(self, attribute_name, attribute_value)
+
+    def get_attribute(self,
+                      attribute_name: str) -> Any:
+        return getattr(self, attribute_name)
+
+    def get_ec2_manager(self) -> tuple:
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        return aws_region, get_ec2_manager(service_name=aws_service, region_name=aws_region)
+
+    def get_cluster_settings(self,
+                             cluster_name: str) -> dict:
+        for cluster_settings in self.get_attribute("clusters_settings"):
+            if cluster_settings["cluster_name"] == cluster_name:
+                return cluster_settings
+        message = "The cluster '{0}' is not defined in the config file!".format(cluster_name)
+        raise ValueError(message)
+
+    def get_job_records(self) -> list:
+        # Runs of Every Configured Cluster (Different Shapes Are What the Scaling Model Learns From).
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        job_records = []
+        for cluster_name in self.get_attribute("general_settings")["cluster_names"]:
+            job_records.extend(load_spark_job_records(cluster_instances_root_folder, cluster_name).get_jobs())
+        return job_records
+
+    def get_hourly_price(self,
+                         instance_type: str,
+                         instances_settings_dict: dict,
+                         aws_region: str,
+                         ec2m: EC2Manager) -> float:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        instance_price_cache = load_instance_price_cache(cluster_instances_root_folder)
+        return instance_price_cache.get_instance_price(aws_region,
+                                                       instances_settings_dict["market_type"],
+                                                       instances_settings_dict["placement"],
+                                                       instance_type,
+                                                       instances_settings_dict["operating_system"],
+                                                       self.get_attribute("price_max_age_in_seconds"),
+                                                       ec2m)
+
+    def read_raw_instances_settings(self,
+                                    instances_settings_name: str) -> dict:
+        # The Section's Settings as Written (Not Parsed), so the Recommended Section Keeps Their Syntax.
+        config_parser = ConfigParser(interpolation=None)
+        config_parser.optionxform = str
+        config_parser.read(self.get_attribute("sparking_cloud_config_file"), encoding="utf-8")
+        return dict(config_parser[instances_settings_name + " Settings"])
+
+    def plan_cluster_shape(self,
+                           cluster_name: str,
+                           job_name: str,
+                           candidate_types_list: list,
+                           objective: str,
+                           budget_in_usd: float,
+                           min_workers: int,
+                           max_workers: int,
+                           section_name: str) -> str:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get the Cluster's Master and Worker Instances Settings (The First of Each).
+        cluster_settings = self.get_cluster_settings(cluster_name)
+        master_instances_settings_name = cluster_settings["master_instances_settings"][0]
+        master_instances_settings_dict = self.get_attribute("instances_settings")[master_instances_settings_name]
+        worker_instances_settings_name = cluster_settings["worker_instances_settings"][0]
+        worker_instances_settings_dict = self.get_attribute("instances_settings")[worker_instances_settings_name]
+        # Get the Named Job's Runs and Every Instance Type Involved (Candidates Default to Those Already Run).
+        job_records = [job_record for job_record in self.get_job_records() if job_record.get("name") == job_name]
+        run_types_list = sorted({instance_type for job_record in job_records
+                                 for instance_type in job_record.get("worker_instance_types") or []})
+        candidate_types_list = candidate_types_list or sorted(set(run_types_list)
+                                                              | {worker_instances_settings_dict["type"]})
+        # Get the Instance Types' Hardware Specs (Described Once, Then Cataloged).
+        aws_region, ec2m = self.get_ec2_manager()
+        instance_type_catalog = load_instance_type_catalog(cluster_instances_root_folder)
+        instance_type_catalog.fetch_instance_types(aws_region,
+                                                   run_types_list + candidate_types_list,
+                                                   ec2m)
+        types_vcpus = {}
+        for instance_type in set(run_types_list + candidate_types_list):
+            instance_type_specs = instance_type_catalog.get_instance_type(aws_region, instance_type)
+            if instance_type_specs and instance_type_specs.get("vcpus"):
+                types_vcpus[instance_type] = instance_type_specs["vcpus"]
+        # Fit the Job's Scaling Model.
+        job_runs = get_job_runs(job_records, job_name, types_vcpus)
+        if not job_runs:
+            message = "No finished runs of the job '{0}' were recorded! Submit it detached at least once, " \
+                      "from a job manifest or named with --job_name." \
+                .format(job_name)
+            raise ValueError(message)
+        scaling_model = fit_scaling_model(job_runs)
+        message = "Job '{0}' scaling model: {1:.1f} s serial + {2:.1f} vCPU-s parallel " \
+                  "({3} run(s) on {4} cluster size(s), RMS error {5:.1f} s)." \
+            .format(job_name,
+                    scaling_model["serial_time_in_seconds"],
+                    scaling_model["parallel_work_in_vcpu_seconds"],
+                    scaling_model["runs"],
+                    scaling_model["distinct_worker_vcpus"],
+                    scaling_model["rms_error_in_seconds"])
+        log_message(logger, message, "INFO")
+        # Get the Candidate Types' Hourly Prices (Cached), in the Worker Settings' Market and Zone.
+        candidate_types = {}
+        for instance_type in candidate_types_list:
+            hourly_price = self.get_hourly_price(instance_type, worker_instances_settings_dict, aws_region, ec2m)
+            if instance_type not in types_vcpus or not hourly_price:
+                message = "The instance type '{0}' has no known specs or price, skipping it!".format(instance_type)
+                log_message(logger, message, "INFO")
+                continue
+            candidate_types[instance_type] = {"vcpus": types_vcpus[instance_type], "hourly_price": hourly_price}
+        master_hourly_price = (self.get_hourly_price(master_instances_settings_dict["type"],
+                                                     master_instances_settings_dict,
+                                                     aws_region,
+                                                     ec2m) or 0) \
+            * master_instances_settings_dict["number_of_master_instances"]
+        # Recommend the Best Shape.
+        shapes = recommend_cluster_shape(scaling_model,
+                                         candidate_types,
+                                         master_hourly_price,
+                                         min_workers,
+                                         max_workers,
+                                         objective,
+                                         budget_in_usd)
+        for shape in shapes[:5]:
+            message = "{0} x {1}: ~{2} s, ~{3:.4f} USD per run ({4:.4f} USD/hour)." \
+                .format(shape["number_of_worker_instances"],
+                        shape["type"],
+                        shape["predicted_runtime_in_seconds"],
+                        shape["predicted_cost_in_usd"],
+                        shape["hourly_price_in_usd"])
+            log_message(logger, message, "INFO")
+        best_shape = shapes[0]
+        # Render the Recommended Worker Instances Settings (The Current Section, Resized).
+        raw_settings = self.read_raw_instances_settings(worker_instances_settings_name)
+        raw_settings["number_of_worker_instances"] = str(best_shape["number_of_worker_instances"])
+        raw_settings["type"] = best_shape["type"]
+        header_lines = ["Recommended for the job '{0}' (objective: {1}{2}): {3} x {4}, ~{5} s, ~{6:.4f} USD per run."
+                        .format(job_name,
+                                objective,
+                                ", budget: {0} USD".format(budget_in_usd) if objective == "time_under_budget"
+                                else "",
+                                best_shape["number_of_worker_instances"],
+                                best_shape["type"],
+                                best_shape["predicted_runtime_in_seconds"],
+                                best_shape["predicted_cost_in_usd"]),
+                        "Reference it from the '[{0} Settings]' section's 'worker_instances_settings'."
+                        .format(cluster_name)]
+        return render_settings_section(section_name or "{0}_{1}".format(worker_instances_settings_name, job_name),
+                                       raw_settings,
+                                       header_lines)
+
+
+def plan_cluster_shape(arguments_dict: dict) -> None:
+    # Get Arguments.
+    sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
+    cluster_name = arguments_dict["cluster_name"]
+    job_name = arguments_dict["job_name"]
+    candidate_types = arguments_dict["candidate_types"]
+    objective = arguments_dict["objective"]
+    budget_in_usd = arguments_dict["budget_in_usd"]
+    min_workers = arguments_dict["min_workers"]
+    max_workers = arguments_dict["max_workers"]
+    price_max_age_in_seconds = arguments_dict["price_max_age_in_seconds"]
+    section_name = arguments_dict["section_name"]
+    output_file = arguments_dict["output_file"]
+    if objective == "time_under_budget" and budget_in_usd <= 0:
+        message = "The 'time_under_budget' objective requires a positive budget!"
+        raise ValueError(message)
+    # Init Cluster Shape Planner Object.
+    csp = ClusterShapePlanner(sparking_cloud_config_file)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
+    for k, v in sparking_cloud_settings_dict.items():
+        csp.set_attribute(k, v)
+    csp.set_attribute("price_max_age_in_seconds", price_max_age_in_seconds)
+    # Check if Logging is Enabled.
+    enable_logging = csp.get_attribute("general_settings")["enable_logging"]
+    # Get Logging Settings.
+    logging_settings = csp.get_attribute("logging_settings")
+    # Instantiate and Set Logger.
+    logger = load_logger(enable_logging, logging_settings)
+    csp.set_attribute("logger", logger)
+    # Get the Maximum Workers (Default: the Autoscaler's Upper Bound).
+    max_workers = max_workers or csp.get_attribute("configuration_rules_settings")["autoscale_max_workers"]
+    # Plan the Cluster Shape.
+    settings_section = csp.plan_cluster_shape(cluster_name,
+                                              job_name,
+                                              candidate_types.split(",") if candidate_types else [],
+                                              objective,
+                                              budget_in_usd,
+                                              min_workers,
+                                              max_workers,
+                                              section_name)
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(settings_section, encoding="utf-8")
+    print(settings_section)
+    # Unbind Objects (Garbage Collector).
+    del csp
+    del logger
+
+
+if __name__ == "__main__":
+    # Begin.
+    # Parse Cluster Shape Planner Arguments.
+    ag = ArgumentParser(description="Cluster Shape Planner Arguments")
+    ag.add_argument("--sparking_cloud_config_file",
+                    type=Path,
+                    required=False,
+                    default=Path("config/sparking_cloud.cfg"),
+                    help="Sparking Cloud Config File (default: config/sparking_cloud.cfg)")
+    ag.add_argument("--cluster_name",
+                    type=str,
+                    required=True,
+                    help="Cluster Name, Whose Worker Instances Settings Are Resized (no default)")
+    ag.add_argument("--job_name",
+                    type=str,
+                    required=True,
+                    help="Job Name, as Named in the Job Manifest (no default)")
+    ag.add_argument("--candidate_types",
+                    type=str,
+                    required=False,
+                    default="",
+                    help="Candidate Instance Types, e.g., m5.xlarge,c5.2xlarge (default: types already run)")
+    ag.add_argument("--objective",
+                    type=str,
+                    required=False,
+                    default="cost",
+                    choices=shape_planner_objectives,
+                    help="Objective (default: cost)")
+    ag.add_argument("--budget_in_usd",
+                    type=float,
+                    required=False,
+                    default=0,
+                    help="Maximum Cost Per Run, for the 'time_under_budget' Objective (default: 0)")
+    ag.add_argument("--min_workers",
+                    type=int,
+                    required=False,
+                    default=1,
+                    help="Minimum Number of Worker Instances (default: 1)")
+    ag.add_argument("--max_workers",
+                    type=int,
+                    required=False,
+                    default=0,
+                    help="Maximum Number of Worker Instances, 0 for 'autoscale_max_workers' (default: 0)")
+    ag.add_argument("--price_max_age_in_seconds",
+                    type=int,
+                    required=False,
+                    default=3600,
+                    help="Age After Which Cached Prices Are Fetched Again (default: 3600)")
+    ag.add_argument("--section_name",
+                    type=str,
+                    required=False,
+                    default="",
+                    help="Recommended Settings Section Name (default: <worker instances settings>_<job name>)")
+    ag.add_argument("--output_file",
+                    type=Path,
+                    required=False,
+                    default=None,
+                    help="File to Write the Recommended Settings Section to (default: printed only)")
+    parsed_args = ag.parse_args()
+    # Generate Arguments Dict.
+    args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
+                 "cluster_name": str(parsed_args.cluster_name),
+                 "job_name": str(parsed_args.job_name),
+                 "candidate_types": str(parsed_args.candidate_types),
+                 "objective": str(parsed_args.objective),
+                 "budget_in_usd": float(parsed_args.budget_in_usd),
+                 "min_workers": int(parsed_args.min_workers),
+                 "max_workers": int(parsed_args.max_workers),
+                 "price_max_age_in_seconds": int(parsed_args.price_max_age_in_seconds),
+                 "section_name": str(parsed_args.section_name),
+                 "output_file": Path(parsed_args.output_file) if parsed_args.output_file else None}
+    # Plan Cluster Shape.
+    plan_cluster_shape(args_dict)
+    # Unbind Objects (Garbage Collector).
+    del ag
+    # End.
+    exit(0)
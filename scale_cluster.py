@@ -0,0 +1,362 @@
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from queue import Queue
+from time import monotonic, sleep
+from typing import Any
+from urllib.error import URLError
+from build_cluster import ClusterBuilder
+from cloud_manager.ec2_manager import EC2Manager, get_ec2_manager
+from configure_cluster import ClusterConfigurator
+from start_spark import SparkStarter
+from util.autoscaler_util import decide_scaling_action, load_autoscaler_state, observe_master_status
+from util.aws_config_util import parse_aws_config_file
+from util.cluster_inventory_util import ClusterInventory, load_cluster_inventory
+from util.instance_registry_util import load_instance_registry
+from util.logging_util import load_logger, log_message
+from util.spark_master_util import fetch_spark_master_status, get_worker_addresses
+from util.sparking_cloud_util import load_sparking_cloud_config_file
+
+
+class ClusterScaler:
+
+    def __init__(self,
+                 sparking_cloud_config_file: Path) -> None:
+        self.sparking_cloud_config_file = sparking_cloud_config_file
+        # Sparking Cloud's Config File Settings.
+        self.general_settings = None
+        self.logging_settings = None
+        self.aws_settings = None
+        self.spark_environment_settings = None
+        # Other Attributes.
+        self.logger = None
+        self.sparking_cloud_settings = None
+
+    def set_attribute(self,
+                      attribute_name: str,
+                      attribute_value: Any) -> None:
+        setattr(self, attribute_name, attribute_value)
+
+    def get_attribute(self,
+                      attribute_name: str) -> Any:
+        return getattr(self, attribute_name)
+
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
+
+    def get_ec2_manager(self) -> EC2Manager:
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        return get_ec2_manager(service_name=aws_service, region_name=aws_region)
+
+    def load_stage_object(self,
+                          stage_class: type) -> Any:
+        # Init the Stage Object Sharing the Already Parsed Settings and the Logger.
+        stage_object = stage_class(self.get_attribute("sparking_cloud_config_file"))
+        sparking_cloud_settings = self.get_attribute("sparking_cloud_settings")
+        for k, v in sparking_cloud_settings.items():
+            stage_object.set_attribute(k, v)
+        stage_object.set_attribute("logger", self.get_attribute("logger"))
+        return stage_object
+
+    def launch_and_configure_workers(self,
+                                     cluster_name: str,
+                                     worker_instances_settings: str,
+                                     number_of_new_worker_instances: int) -> tuple:
+        # Returns the Configured New Workers and the Failed Ones ({Worker: Exception}).
+        # Get Instances Settings (Already Parsed and Validated).
+        worker_instances_settings_dict = self.get_attribute("instances_settings")[worker_instances_settings]
+        # Load the Cluster Builder and the Cluster Configurator.
+        cb = self.load_stage_object(ClusterBuilder)
+        cc = self.load_stage_object(ClusterConfigurator)
+        # Stream Each New Alive Worker From the Builder to the Configurator (Only the New Nodes Are Configured).
+        instances_queue = Queue()
+        cb.set_attribute("instances_queue", instances_queue)
+        with ThreadPoolExecutor() as thread_pool_executor:
+            future = thread_pool_executor.submit(cc.configure_instances_from_queue,
+                                                 instances_queue)
+            try:
+                cb.add_spark_workers_on_aws(cluster_name,
+                                            worker_instances_settings_dict,
+                                            number_of_new_worker_instances,
+                                            self.get_ec2_manager())
+            finally:
+                # End the Instances Stream (Even If Launching Failed, so the Configurator Returns).
+                instances_queue.put(None)
+            configured_workers_list, failed_workers_dict = future.result()
+        # Unbind Objects (Garbage Collector).
+        del cb
+        del cc
+        return configured_workers_list, failed_workers_dict
+
+    def start_workers(self,
+                      cluster_name: str,
+                      workers_list: list) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Load the Spark Starter.
+        ss = self.load_stage_object(SparkStarter)
+        # Get the Cluster's Current Running Master.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        first_running_master_instance = ss.get_first_running_master_instance(cluster_inventory)
+        if first_running_master_instance is None:
+            message = "The Cluster '{0}' has no running master, the new workers were not started!" \
+                .format(cluster_name)
+            log_message(logger, message, "INFO")
+            return
+        # The Operator Polls the Master's Web UI Over Its Public Address, the Workers Reach It Over Its Private One.
+        master_public_ipv4_address = first_running_master_instance.public_ipv4_address
+        master_cluster_address = first_running_master_instance.get_cluster_address()
+        # Parallel Remotely Start Spark on the Workers, Against the Running Master.
+        ss.fetch_worker_instance_types_specs(cluster_inventory)
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for worker in workers_list:
+                thread_pool_executor.submit(ss.start_spark_on_worker_instance,
+                                            worker,
+                                            master_cluster_address)
+        # Wait for the Running Workers to Register With the Master (Unless Disabled; Stopped or Ended Ones Never Do).
+        if self.get_attribute("configuration_rules_settings")["worker_registration_timeout_in_seconds"] > 0:
+            ss.wait_for_workers_registration(cluster_name,
+                                             master_public_ipv4_address,
+                                             cluster_inventory.get_instances(role="worker", state="running"))
+        # Unbind Objects (Garbage Collector).
+        del ss
+
+    def scale_out_cluster(self,
+                          cluster_name: str,
+                          worker_instances_settings: str,
+                          number_of_new_worker_instances: int,
+                          remove_failed_workers: bool = False) -> list:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        if worker_instances_settings not in self.get_attribute("instances_settings") \
+                or "AWS" not in worker_instances_settings:
+            message = "Invalid worker instances settings '{0}'! Expected an AWS instances settings section." \
+                .format(worker_instances_settings)
+            raise ValueError(message)
+        message = "Adding {0} worker(s) from '{1}' to the Cluster '{2}'..." \
+            .format(number_of_new_worker_instances,
+                    worker_instances_settings,
+                    cluster_name)
+        log_message(logger, message, "INFO")
+        # Launch and Configure the New Workers, Then Start the Configured Ones.
+        new_workers_list, failed_workers_dict = self.launch_and_configure_workers(cluster_name,
+                                                                                  worker_instances_settings,
+                                                                                  number_of_new_worker_instances)
+        if new_workers_list:
+            self.start_workers(cluster_name, new_workers_list)
+        message = "{0} worker(s) were added to the Cluster '{1}': {2}." \
+            .format(len(new_workers_list),
+                    cluster_name,
+                    ", ".join(worker.name for worker in new_workers_list))
+        log_message(logger, message, "INFO")
+        # Surface the Configuration Failures (Each One Was Logged by the Configurator, the First Is Raised).
+        if failed_workers_dict:
+            message = "{0} new worker(s) of the Cluster '{1}' could not be configured and were not started: {2}." \
+                .format(len(failed_workers_dict),
+                        cluster_name,
+                        ", ".join(worker.name for worker in failed_workers_dict))
+            log_message(logger, message, "INFO")
+            if remove_failed_workers:
+                # Terminate and Deregister the Failed Workers (Else Left Running, Billed and Counted as Launched).
+                self.scale_in_cluster(cluster_name, list(failed_workers_dict))
+            raise next(iter(failed_workers_dict.values()))
+        return new_workers_list
+
+    def scale_in_cluster(self,
+                         cluster_name: str,
+                         workers_list: list) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        message = "Removing {0} worker(s) from the Cluster '{1}': {2}..." \
+            .format(len(workers_list),
+                    cluster_name,
+                    ", ".join(worker.name for worker in workers_list))
+        log_message(logger, message, "INFO")
+        # Terminate the Workers' EC2 Instances.
+        workers_ids_list = [worker.id for worker in workers_list if worker.provider == "AWS"]
+        self.get_ec2_manager().terminate_ec2_instances_list(workers_ids_list)
+        # Remove the Workers From the Instance Registry and From the Cluster's Inventory.
+        load_instance_registry(cluster_instances_root_folder).delete_instances(workers_ids_list)
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        for worker_id in workers_ids_list:
+            cluster_inventory.remove_instance(worker_id)
+
+    def get_idle_workers(self,
+                         cluster_name: str,
+                         observation: dict) -> list:
+        # Match the Idle Workers Registered With the Master to the Cluster's Worker Instances.
+        idle_workers_addresses = set()
+        for idle_worker in observation["idle_workers"]:
+            idle_workers_addresses.update(get_worker_addresses(idle_worker))
+        return [worker for worker in self.get_cluster_inventory(cluster_name).get_workers()
+                if idle_workers_addresses.intersection(worker.get_addresses())]
+
+    def get_removable_workers(self,
+                              cluster_name: str,
+                              master_public_ipv4_address: str,
+                              number_of_workers: int) -> list:
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        master_webui_port = configuration_rules_settings["master_webui_port"]
+        # Re-Check the Master's Status Right Before Picking the Victims (The Decision's Poll May Be Stale).
+        try:
+            master_status = fetch_spark_master_status(master_public_ipv4_address, master_webui_port)
+        except (URLError, OSError, ValueError):
+            return []
+        observation = observe_master_status(master_status)
+        if configuration_rules_settings["enable_external_shuffle_service"] and observation["active_applications"] > 0:
+            return []
+        return self.get_idle_workers(cluster_name, observation)[:number_of_workers]
+
+    def autoscale_cluster(self,
+                          cluster_name: str,
+                          worker_instances_settings: str) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings (Autoscaling Settings Included).
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        master_webui_port = configuration_rules_settings["master_webui_port"]
+        poll_interval_in_seconds = configuration_rules_settings["autoscale_poll_interval_in_seconds"]
+        message = "Autoscaling the Cluster '{0}' between {1} and {2} worker(s) (Ctrl+C to stop)..." \
+            .format(cluster_name,
+                    configuration_rules_settings["autoscale_min_workers"],
+                    configuration_rules_settings["autoscale_max_workers"])
+        log_message(logger, message, "INFO")
+        autoscaler_state = load_autoscaler_state()
+        while True:
+            # Observe the Cluster Through the Running Master's Status.
+            master_status = None
+            cluster_inventory = self.get_cluster_inventory(cluster_name)
+            master = cluster_inventory.get_first_running_master(self.get_ec2_manager())
+            if master is not None:
+                try:
+                    master_status = fetch_spark_master_status(master.public_ipv4_address, master_webui_port)
+                except (URLError, OSError, ValueError):
+                    master_status = None
+            if master_status is None:
+                message = "The Cluster '{0}' master status is unavailable, retrying...".format(cluster_name)
+                log_message(logger, message, "INFO")
+                sleep(poll_interval_in_seconds)
+                continue
+            # Decide and Act (Counting the Launched Workers Not Yet Registered Against the Maximum).
+            launched_workers = [worker for worker in cluster_inventory.get_workers()
+                                if worker.state in ["pending", "running"]]
+            observation = observe_master_status(master_status, len(launched_workers))
+            action, number_of_workers, reason, autoscaler_state = \
+                decide_scaling_action(observation,
+                                      autoscaler_state,
+                                      configuration_rules_settings,
+                                      monotonic())
+            message = "Cluster '{0}' autoscaler: {1} ({2})." \
+                .format(cluster_name,
+                        "scale {0} by {1} worker(s)".format(action, number_of_workers) if action else "no action",
+                        reason)
+            log_message(logger, message, "INFO" if action else "DEBUG")
+            try:
+                if action == "out":
+                    self.scale_out_cluster(cluster_name,
+                                           worker_instances_settings,
+                                           number_of_workers,
+                                           remove_failed_workers=True)
+                elif action == "in":
+                    idle_workers_list = self.get_removable_workers(cluster_name,
+                                                                   master.public_ipv4_address,
+                                                                   number_of_workers)
+                    if idle_workers_list:
+                        self.scale_in_cluster(cluster_name, idle_workers_list)
+                    else:
+                        message = "Cluster '{0}' autoscaler: no worker is idle anymore, scaling in was skipped." \
+                            .format(cluster_name)
+                        log_message(logger, message, "INFO")
+            except Exception as ex:
+                # A Failed Action Does Not End the Autoscaler: The Next Polls Observe the Resulting Pool.
+                message = "Cluster '{0}' autoscaler: scaling {1} failed: {2}".format(cluster_name, action, ex)
+                log_message(logger, message, "INFO")
+            sleep(poll_interval_in_seconds)
+
+
+def scale_cluster(arguments_dict: dict) -> None:
+    # Get Arguments.
+    sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
+    cluster_name = arguments_dict["cluster_name"]
+    worker_instances_settings = arguments_dict["worker_instances_settings"]
+    number_of_worker_instances = arguments_dict["number_of_worker_instances"]
+    autoscale = arguments_dict["autoscale"]
+    # Init Cluster Scaler Object.
+    cs = ClusterScaler(sparking_cloud_config_file)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
+    for k, v in sparking_cloud_settings_dict.items():
+        cs.set_attribute(k, v)
+    cs.set_attribute("sparking_cloud_settings", sparking_cloud_settings_dict)
+    # Check if Logging is Enabled.
+    enable_logging = cs.get_attribute("general_settings")["enable_logging"]
+    # Get Logging Settings.
+    logging_settings = cs.get_attribute("logging_settings")
+    # Instantiate and Set Logger.
+    logger = load_logger(enable_logging, logging_settings)
+    cs.set_attribute("logger", logger)
+    if autoscale:
+        # Autoscale the Cluster's Worker Pool (Runs Until Interrupted).
+        cs.autoscale_cluster(cluster_name,
+                             worker_instances_settings)
+    else:
+        # Scale Out the Cluster.
+        cs.scale_out_cluster(cluster_name,
+                             worker_instances_settings,
+                             number_of_worker_instances)
+    # Unbind Objects (Garbage Collector).
+    del cs
+    del logger
+
+
+if __name__ == "__main__":
+    # Begin.
+    # Parse Cluster Scaler Arguments.
+    ag = ArgumentParser(description="Cluster Scaler Arguments")
+    ag.add_argument("--sparking_cloud_config_file",
+                    type=Path,
+                    required=False,
+                    default=Path("config/sparking_cloud.cfg"),
+                    help="Sparking Cloud Config File (default: config/sparking_cloud.cfg)")
+    ag.add_argument("--cluster_name",
+                    type=str,
+                    required=True,
+                    help="Cluster Name (no default)")
+    ag.add_argument("--worker_instances_settings",
+                    type=str,
+                    required=True,
+                    help="Worker Instances Settings Name (e.g., AWS_Worker_Instances_Settings_1)")
+    ag.add_argument("--number_of_worker_instances",
+                    type=int,
+                    required=False,
+                    default=1,
+                    help="Number of Worker Instances to Add (default: 1)")
+    ag.add_argument("--autoscale",
+                    action="store_true",
+                    help="Keep Scaling the Worker Pool Based on the Master's Load (default: False)")
+    parsed_args = ag.parse_args()
+    # Generate Arguments Dict.
+    args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
+                 "cluster_name": str(parsed_args.cluster_name),
+                 "worker_instances_settings": str(parsed_args.worker_instances_settings),
+                 "number_of_worker_instances": int(parsed_args.number_of_worker_instances),
+                 "autoscale": bool(parsed_args.autoscale)}
+    # Scale Cluster.
+    scale_cluster(args_dict)
+    # Unbind Objects (Garbage Collector).
+    del ag
+    # End.
+    exit(0)
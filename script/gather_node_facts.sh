@@ -0,0 +1,53 @@
+#!/bin/bash
+
+# MIT License
+
+# Copyright (c) 2023 Alan Lira
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Script Begin.
+
+# Gathers the Node's Facts in a Single Pass, Printing One 'key=value' Pair Per Line.
+
+# Load the Environment Variables Set Up by the Hadoop and Spark Setup Scripts (If Any).
+source ~/.bashrc 2> /dev/null
+
+# CPU Topology.
+echo "architecture=$(uname -m)"
+echo "vcpus=$(nproc --all)"
+lscpu 2> /dev/null | awk -F ':' '
+    /^Socket\(s\)/ {gsub(/ /, "", $2); print "sockets=" $2}
+    /^Core\(s\) per socket/ {gsub(/ /, "", $2); print "cores_per_socket=" $2}
+    /^Thread\(s\) per core/ {gsub(/ /, "", $2); print "threads_per_core=" $2}
+    /^NUMA node\(s\)/ {gsub(/ /, "", $2); print "numa_nodes=" $2}'
+
+# Memory.
+awk '/^MemTotal/ {print "memory_in_kb=" $2}' /proc/meminfo
+
+# Block Devices (Mounted and Unmounted): Name, Size in Bytes, Type and Mount Point.
+lsblk -n -r -b -p -o NAME,SIZE,TYPE,MOUNTPOINT 2> /dev/null | awk '{print "block_device=" $1 "," $2 "," $3 "," $4}'
+
+# Java, Hadoop and Spark Versions (Empty If Not Installed).
+echo "java_version=$(java -version 2>&1 | awk -F '"' '/version/ {print $2; exit}')"
+echo "hadoop_version=$(hadoop version 2> /dev/null | awk '/^Hadoop/ {print $2; exit}')"
+echo "spark_version=$(ls -d ${SPARK_HOME:-~/spark-*} 2> /dev/null | head -n 1 | sed -E 's/.*spark-([^-]+)-.*/\1/')"
+
+# Script End.
+exit 0
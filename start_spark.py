@@ -1,14 +1,27 @@
 from argparse import ArgumentParser
 from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
 from pathlib import Path
-from typing import Any
-from cloud_manager.ec2_manager import EC2Manager
+from typing import Any, Optional
+from urllib.error import URLError
+from cloud_manager.ec2_manager import get_ec2_manager
 from util.aws_config_util import parse_aws_config_file
+from util.cluster_inventory_util import ClusterInventory, InstanceRecord, load_cluster_inventory
+from util.event_log_util import load_history_server_start_script
+from util.instance_type_catalog_util import load_instance_type_catalog
+from util.local_storage_util import load_local_storage_environment_command
 from util.logging_util import load_logger, log_message
-from util.os_util import check_if_file_exists, find_full_file_name_by_prefix
+from util.node_facts_util import gather_instance_facts
 from util.process_util import remotely_execute_command
-from util.sparking_cloud_util import parse_sparking_cloud_config_file
+from util.spark_job_util import encode_remote_script
+from util.spark_master_util import fetch_spark_master_status, get_alive_workers, get_missing_workers, \
+    wait_for_spark_workers_registration
+from util.spark_properties_util import read_spark_properties_file
+from util.spark_tuner_util import get_worker_available_cores, get_worker_available_memory_in_kb
+from util.sparking_cloud_util import load_sparking_cloud_config_file
+from util.tracing_util import trace_span
+
+# Memory Units (Worker Memory Settings) in Megabytes.
+memory_units_in_mb = {"KB": 1 / 1024, "MB": 1, "GB": 1024, "TB": 1024 * 1024}
 
 
 class SparkStarter:
@@ -33,81 +46,35 @@ class SparkStarter:
                       attribute_name: str) -> Any:
         return getattr(self, attribute_name)
 
-    def read_instances_file(self,
-                            cluster_name: str) -> list:
-        instances_file_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        instances_file = Path(instances_file_root_folder).joinpath(cluster_name)
-        instances_list_parser = ConfigParser()
-        instances_list_parser.optionxform = str
-        instances_list_parser.read(filenames=instances_file,
-                                   encoding="utf-8")
-        instances_list = []
-        for section in instances_list_parser.sections():
-            if "Instance" in section:
-                instance_provider = instances_list_parser.get(section, "provider")
-                instance_name = instances_list_parser.get(section, "name")
-                instance_id = instances_list_parser.get(section, "id")
-                instance_key_name = instances_list_parser.get(section, "key_name")
-                instance_username = instances_list_parser.get(section, "username")
-                instance_public_ipv4_address = instances_list_parser.get(section, "public_ipv4_address")
-                instance_ssh_port = instances_list_parser.get(section, "ssh_port")
-                instance_dict = {"provider": instance_provider,
-                                 "name": instance_name,
-                                 "id": instance_id,
-                                 "key_name": instance_key_name,
-                                 "username": instance_username,
-                                 "public_ipv4_address": instance_public_ipv4_address,
-                                 "ssh_port": instance_ssh_port}
-                instances_list.append(instance_dict)
-        del instances_list_parser
-        return instances_list
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
 
-    def get_first_running_master_instance_dict(self,
-                                               instances_list: list) -> dict:
-        first_running_master_instance_dict = None
-        for instance_dict in instances_list:
-            instance_name = instance_dict["name"]
-            if "master" in instance_name.lower():
-                instance_provider = instance_dict["provider"]
-                if instance_provider == "AWS":
-                    # Parse AWS Config File.
-                    aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
-                    aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
-                    # Get AWS Service Setting (EC2).
-                    aws_service = self.get_attribute("aws_settings")["service"]
-                    # Init AWS EC2Manager Object.
-                    ec2m = EC2Manager(service_name=aws_service, region_name=aws_region)
-                    instance_id = instance_dict["id"]
-                    instance = ec2m.get_ec2_instance_from_id(instance_id)
-                    if ec2m.is_ec2_instance_running(instance):
-                        first_running_master_instance_dict = instance_dict
-                        del ec2m
-                        break
-        return first_running_master_instance_dict
+    def get_first_running_master_instance(self,
+                                          cluster_inventory: ClusterInventory) -> InstanceRecord:
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
+        return cluster_inventory.get_first_running_master(ec2m)
 
     def start_spark_on_master_instance(self,
-                                       instance_dict: dict) -> None:
+                                       instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -120,144 +87,160 @@ class SparkStarter:
         spark_home_directory = Path("\\$SPARK_HOME")
         spark_scripts_folder = spark_home_directory.joinpath("sbin")
         spark_start_master_script_file = spark_scripts_folder.joinpath("start-master.sh")
+        # Bind and Advertise the Master on the Private Address (Intra-Cluster Traffic Stays Within the VPC).
+        instance_cluster_address = instance.get_cluster_address()
+        master_host_option = "--host {0}".format(instance_cluster_address)
         master_port_option = "--port {0}".format(master_port)
         master_webui_port_option = "--webui-port {0}".format(master_webui_port)
-        remote_command = "bash {0} {1} {2}" \
-            .format(spark_start_master_script_file,
+        remote_command = "SPARK_LOCAL_IP={0} bash {1} {2} {3} {4}" \
+            .format(instance_cluster_address,
+                    spark_start_master_script_file,
+                    master_host_option,
                     master_port_option,
                     master_webui_port_option)
-        remotely_execute_command(key_file=instance_key_file,
-                                 username=instance_username,
-                                 public_ipv4_address=instance_public_ipv4_address,
-                                 ssh_port=instance_ssh_port,
-                                 remote_command=remote_command,
-                                 on_new_windows=False,
-                                 request_tty=False,
-                                 max_tries=max_tries,
-                                 time_between_retries_in_seconds=time_between_retries_in_seconds,
-                                 logger=logger,
-                                 logger_level="DEBUG")
+        with trace_span("start_master", node=instance_name, phase="start"):
+            remotely_execute_command(key_file=instance_key_file,
+                                     username=instance_username,
+                                     public_ipv4_address=instance_public_ipv4_address,
+                                     ssh_port=instance_ssh_port,
+                                     remote_command=remote_command,
+                                     on_new_windows=False,
+                                     request_tty=False,
+                                     max_tries=max_tries,
+                                     time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                     logger=logger,
+                                     logger_level="DEBUG")
 
-    def get_number_of_cpu_cores(self,
-                                instance_dict: dict) -> int:
+    def start_history_server_on_master_instance(self,
+                                                cluster_name: str,
+                                                instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
         time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
-        remote_command = "grep 'cpu cores' /proc/cpuinfo | awk '{print \\$4;}' | uniq"
-        process_stdout = remotely_execute_command(key_file=instance_key_file,
-                                                  username=instance_username,
-                                                  public_ipv4_address=instance_public_ipv4_address,
-                                                  ssh_port=instance_ssh_port,
-                                                  remote_command=remote_command,
-                                                  on_new_windows=False,
-                                                  request_tty=False,
-                                                  max_tries=max_tries,
-                                                  time_between_retries_in_seconds=time_between_retries_in_seconds,
-                                                  logger=logger,
-                                                  logger_level="DEBUG")
-        number_of_cpu_cores = int(process_stdout[0])
-        return number_of_cpu_cores
+        message = "Starting the Spark history server on the remote host {0} ({1})..." \
+            .format(instance.public_ipv4_address,
+                    instance.name)
+        log_message(logger, message, "DEBUG")
+        # The S3A Settings of the Properties Sent to the Cluster Let It Read Shared Event Logs.
+        properties_file = Path(configuration_rules_settings["properties_file"])
+        tuned_properties_file = Path(cluster_instances_root_folder).joinpath(cluster_name, properties_file.name)
+        spark_properties = read_spark_properties_file(tuned_properties_file if tuned_properties_file.is_file()
+                                                      else properties_file)
+        history_server_start_script = load_history_server_start_script(configuration_rules_settings,
+                                                                       spark_properties)
+        remote_command = encode_remote_script(history_server_start_script)
+        with trace_span("start_history_server", node=instance.name, phase="start"):
+            remotely_execute_command(key_file=instance.key_file,
+                                     username=instance.username,
+                                     public_ipv4_address=instance.public_ipv4_address,
+                                     ssh_port=instance.ssh_port,
+                                     remote_command=remote_command,
+                                     on_new_windows=False,
+                                     request_tty=False,
+                                     max_tries=max_tries,
+                                     time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                     logger=logger,
+                                     logger_level="DEBUG")
+
+    def fetch_worker_instance_types_specs(self,
+                                          cluster_inventory: ClusterInventory) -> None:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
+        # Describe the Workers' Instance Types Missing From the Catalog (Batched, Once Per Type).
+        instance_type_catalog = load_instance_type_catalog(cluster_instances_root_folder)
+        worker_instance_types_list = [instance.type for instance in cluster_inventory.get_workers()
+                                      if instance.provider == "AWS"]
+        instance_type_catalog.fetch_instance_types(aws_region,
+                                                   worker_instance_types_list,
+                                                   ec2m)
+
+    def get_instance_type_specs(self,
+                                instance: InstanceRecord) -> Optional[dict]:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get Instance Type Specs From the Catalog (None If Not Cataloged).
+        instance_type_specs = None
+        if instance.provider == "AWS" and instance.type:
+            instance_type_catalog = load_instance_type_catalog(cluster_instances_root_folder)
+            instance_type_specs = instance_type_catalog.get_instance_type(aws_region, instance.type)
+        return instance_type_specs
+
+    def get_number_of_cpu_cores(self,
+                                instance: InstanceRecord) -> int:
+        # Get the Number of vCPUs From the Instance Type Catalog (No SSH Round Trip).
+        instance_type_specs = self.get_instance_type_specs(instance)
+        if instance_type_specs and instance_type_specs["vcpus"]:
+            return instance_type_specs["vcpus"]
+        # Fall Back to the Instance's Facts (Gathered Only If Not Cached Yet).
+        instance_facts = gather_instance_facts(instance,
+                                               self.get_attribute("general_settings")["cluster_instances_root_folder"],
+                                               self.get_attribute("configuration_rules_settings"),
+                                               self.get_attribute("logger"))
+        return instance_facts["vcpus"]
 
     def get_memory_size_in_kilobytes(self,
-                                     instance_dict: dict) -> int:
-        # Get Logger.
-        logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+                                     instance: InstanceRecord) -> int:
+        # Get the Memory Size From the Instance Type Catalog (No SSH Round Trip).
+        instance_type_specs = self.get_instance_type_specs(instance)
+        if instance_type_specs and instance_type_specs["memory_in_mib"]:
+            return instance_type_specs["memory_in_mib"] * 1024
+        # Fall Back to the Instance's Facts (Gathered Only If Not Cached Yet).
+        instance_facts = gather_instance_facts(instance,
+                                               self.get_attribute("general_settings")["cluster_instances_root_folder"],
+                                               self.get_attribute("configuration_rules_settings"),
+                                               self.get_attribute("logger"))
+        return instance_facts["memory_in_kb"]
+
+    def get_worker_offer(self,
+                         instance: InstanceRecord) -> tuple:
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
-        max_tries = configuration_rules_settings["max_tries"]
-        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
-        remote_command = "grep 'MemTotal' /proc/meminfo | awk '{print \\$2;}'"
-        process_stdout = remotely_execute_command(key_file=instance_key_file,
-                                                  username=instance_username,
-                                                  public_ipv4_address=instance_public_ipv4_address,
-                                                  ssh_port=instance_ssh_port,
-                                                  remote_command=remote_command,
-                                                  on_new_windows=False,
-                                                  request_tty=False,
-                                                  max_tries=max_tries,
-                                                  time_between_retries_in_seconds=time_between_retries_in_seconds,
-                                                  logger=logger,
-                                                  logger_level="DEBUG")
-        memory_size_in_kilobytes = int(process_stdout[0])
-        return memory_size_in_kilobytes
+        worker_cores = configuration_rules_settings["worker_cores"]
+        if worker_cores == "maximum":
+            # Offer All vCPUs, Except the Ones Reserved for the OS and Daemons.
+            worker_cores = get_worker_available_cores(self.get_number_of_cpu_cores(instance),
+                                                      configuration_rules_settings)
+        worker_memory = configuration_rules_settings["worker_memory"]
+        worker_memory_unit = configuration_rules_settings["worker_memory_unit"]
+        if worker_memory == "maximum":
+            # Offer All Memory, Except the Headroom Reserved for the OS and Daemons.
+            worker_memory = get_worker_available_memory_in_kb(self.get_memory_size_in_kilobytes(instance),
+                                                              configuration_rules_settings)
+            worker_memory_unit = "KB"
+        return worker_cores, worker_memory, worker_memory_unit
 
     def start_spark_on_worker_instance(self,
-                                       instance_dict: dict,
-                                       master_public_ipv4_address: str) -> None:
+                                       instance: InstanceRecord,
+                                       master_cluster_address: str) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
         time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
         master_port = configuration_rules_settings["master_port"]
-        worker_cores = configuration_rules_settings["worker_cores"]
-        if worker_cores == "maximum":
-            worker_cores = self.get_number_of_cpu_cores(instance_dict)
-        worker_memory = configuration_rules_settings["worker_memory"]
-        if worker_memory == "maximum":
-            worker_memory = self.get_memory_size_in_kilobytes(instance_dict)
-        worker_memory_unit = configuration_rules_settings["worker_memory_unit"]
+        worker_cores, worker_memory, worker_memory_unit = self.get_worker_offer(instance)
         worker_port = configuration_rules_settings["worker_port"]
         worker_webui_port = configuration_rules_settings["worker_webui_port"]
         message = "Starting Spark on the remote host {0} ({1})...".format(instance_public_ipv4_address, instance_name)
@@ -266,48 +249,220 @@ class SparkStarter:
         spark_home_directory = Path("\\$SPARK_HOME")
         spark_scripts_folder = spark_home_directory.joinpath("sbin")
         spark_start_worker_script_file = spark_scripts_folder.joinpath("start-worker.sh")
-        master_url_option = "spark://{0}:{1}".format(master_public_ipv4_address, master_port)
+        # Reach the Master and Bind the Worker on the Private Addresses (Intra-Cluster Traffic Stays Within the VPC).
+        instance_cluster_address = instance.get_cluster_address()
+        master_url_option = "spark://{0}:{1}".format(master_cluster_address, master_port)
+        worker_host_option = "--host {0}".format(instance_cluster_address)
         worker_cores_option = "--cores {0}".format(worker_cores)
         worker_memory_option = "--memory {0}{1}".format(worker_memory, worker_memory_unit[0])
         worker_port_option = "--port {0}".format(worker_port)
         worker_webui_port_option = "--webui-port {0}".format(worker_webui_port)
-        remote_command = "bash {0} {1} {2} {3} {4} {5}" \
-            .format(spark_start_worker_script_file,
+        # Run the External Shuffle Service Inside the Worker (Shuffle Files Outlive Dynamically Removed Executors).
+        worker_opts = ""
+        if configuration_rules_settings["enable_external_shuffle_service"]:
+            worker_opts = "SPARK_WORKER_OPTS='-Dspark.shuffle.service.enabled=true -Dspark.shuffle.service.port={0}' " \
+                .format(configuration_rules_settings["shuffle_service_port"])
+        # Keep Shuffle and Spill Files (and the Executors' Work Folders) on the Local Storage, If Mounted.
+        local_storage_command = ""
+        if configuration_rules_settings["configure_local_storage"]:
+            local_storage_command = \
+                load_local_storage_environment_command(configuration_rules_settings["local_storage_mount_point"])
+        remote_command = "{0}{1}SPARK_LOCAL_IP={2} bash {3} {4} {5} {6} {7} {8} {9}" \
+            .format(local_storage_command,
+                    worker_opts,
+                    instance_cluster_address,
+                    spark_start_worker_script_file,
                     master_url_option,
+                    worker_host_option,
                     worker_cores_option,
                     worker_memory_option,
                     worker_port_option,
                     worker_webui_port_option)
-        remotely_execute_command(key_file=instance_key_file,
-                                 username=instance_username,
-                                 public_ipv4_address=instance_public_ipv4_address,
-                                 ssh_port=instance_ssh_port,
-                                 remote_command=remote_command,
-                                 on_new_windows=False,
-                                 request_tty=False,
-                                 max_tries=max_tries,
-                                 time_between_retries_in_seconds=time_between_retries_in_seconds,
-                                 logger=logger,
-                                 logger_level="DEBUG")
+        with trace_span("start_worker", node=instance_name, phase="start"):
+            remotely_execute_command(key_file=instance_key_file,
+                                     username=instance_username,
+                                     public_ipv4_address=instance_public_ipv4_address,
+                                     ssh_port=instance_ssh_port,
+                                     remote_command=remote_command,
+                                     on_new_windows=False,
+                                     request_tty=False,
+                                     max_tries=max_tries,
+                                     time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                     logger=logger,
+                                     logger_level="DEBUG")
+
+    def probe_spark_daemons_on_instance(self,
+                                        instance: InstanceRecord) -> dict:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        # Check the Master and Worker JVMs in a Single SSH Round Trip.
+        # The Bracketed First Letter Keeps 'pgrep' From Matching the Remote Shell Running This Command.
+        remote_command = "pgrep -f '[o]rg.apache.spark.deploy.master.Master' > /dev/null && echo master; " \
+                         "pgrep -f '[o]rg.apache.spark.deploy.worker.Worker' > /dev/null && echo worker; " \
+                         "pgrep -f '[o]rg.apache.spark.deploy.history.HistoryServer' > /dev/null && echo history; true"
+        process_stdout = remotely_execute_command(key_file=instance.key_file,
+                                                  username=instance.username,
+                                                  public_ipv4_address=instance.public_ipv4_address,
+                                                  ssh_port=instance.ssh_port,
+                                                  remote_command=remote_command,
+                                                  on_new_windows=False,
+                                                  request_tty=False,
+                                                  max_tries=max_tries,
+                                                  time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                                  logger=logger,
+                                                  logger_level="DEBUG")
+        running_daemons = [line.strip() for line in process_stdout]
+        return {"master": "master" in running_daemons,
+                "worker": "worker" in running_daemons,
+                "history": "history" in running_daemons}
+
+    def probe_spark_daemons(self,
+                            cluster_inventory: ClusterInventory) -> dict:
+        # Parallel Probe All Instances ({Instance: {'master': Running?, 'worker': Running?}}).
+        with ThreadPoolExecutor() as thread_pool_executor:
+            futures = {instance: thread_pool_executor.submit(self.probe_spark_daemons_on_instance,
+                                                             instance)
+                       for instance in cluster_inventory.get_instances()}
+        return {instance: future.result() for instance, future in futures.items()}
 
     def start_spark_cluster_tasks(self,
                                   cluster_name: str) -> None:
-        # Read Cluster's Instances File.
-        instances_list = self.read_instances_file(cluster_name)
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Cluster's Inventory.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        cluster_inventory.check_key_files(logger)
+        # Get the Workers' Instance Types Specs Ahead (If Workers Are Sized to the Maximum).
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        if "maximum" in [configuration_rules_settings["worker_cores"], configuration_rules_settings["worker_memory"]]:
+            self.fetch_worker_instance_types_specs(cluster_inventory)
         # Get the First Running Master Instance.
-        first_running_master_instance_dict = self.get_first_running_master_instance_dict(instances_list)
-        master_public_ipv4_address = first_running_master_instance_dict["public_ipv4_address"]
-        # Parallel Remotely Start Spark on Instances (Masters and Workers).
+        first_running_master_instance = self.get_first_running_master_instance(cluster_inventory)
+        # The Operator Polls the Master's Web UI Over Its Public Address, the Workers Reach It Over Its Private One.
+        master_public_ipv4_address = first_running_master_instance.public_ipv4_address
+        master_cluster_address = first_running_master_instance.get_cluster_address()
+        # Find Out Which Daemons Are Already Running (One Pass Over All Instances).
+        running_daemons = self.probe_spark_daemons(cluster_inventory)
+        masters_to_start = [instance for instance in cluster_inventory.get_masters()
+                            if not running_daemons[instance]["master"]]
+        workers_to_start = [instance for instance in cluster_inventory.get_workers()
+                            if not running_daemons[instance]["worker"]]
+        self.log_running_daemons(cluster_name,
+                                 master_public_ipv4_address,
+                                 running_daemons,
+                                 masters_to_start,
+                                 workers_to_start)
+        # Parallel Remotely Start the Missing Spark Daemons Only (Masters and Workers).
         with ThreadPoolExecutor() as thread_pool_executor:
-            for instance_dict in instances_list:
-                instance_name = instance_dict["name"]
-                if "master" in instance_name.lower():
-                    thread_pool_executor.submit(self.start_spark_on_master_instance,
-                                                instance_dict)
-                elif "worker" in instance_name.lower():
-                    thread_pool_executor.submit(self.start_spark_on_worker_instance,
-                                                instance_dict,
-                                                master_public_ipv4_address)
+            for instance in masters_to_start:
+                thread_pool_executor.submit(self.start_spark_on_master_instance,
+                                            instance)
+            for instance in workers_to_start:
+                thread_pool_executor.submit(self.start_spark_on_worker_instance,
+                                            instance,
+                                            master_cluster_address)
+            # Start the History Server Beside the Master (Reading the Event Logs Where the Drivers Write Them).
+            history_server_running = running_daemons.get(first_running_master_instance, {}).get("history")
+            if configuration_rules_settings["start_history_server"] and not history_server_running:
+                thread_pool_executor.submit(self.start_history_server_on_master_instance,
+                                            cluster_name,
+                                            first_running_master_instance)
+        # Wait for the Running Workers to Register With the Master (Unless Disabled; Stopped or Ended Ones Never Do).
+        if configuration_rules_settings["worker_registration_timeout_in_seconds"] > 0:
+            with trace_span("wait_for_workers_registration", cluster=cluster_name, phase="start"):
+                self.wait_for_workers_registration(cluster_name,
+                                                   master_public_ipv4_address,
+                                                   cluster_inventory.get_instances(role="worker", state="running"))
+
+    def log_running_daemons(self,
+                            cluster_name: str,
+                            master_public_ipv4_address: str,
+                            running_daemons: dict,
+                            masters_to_start: list,
+                            workers_to_start: list) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        master_webui_port = configuration_rules_settings["master_webui_port"]
+        running_workers = [instance for instance, daemons in running_daemons.items()
+                           if instance.role == "worker" and daemons["worker"]]
+        message = "Cluster '{0}': starting {1} master(s) and {2} worker(s), {3} worker(s) already running." \
+            .format(cluster_name,
+                    len(masters_to_start),
+                    len(workers_to_start),
+                    len(running_workers))
+        log_message(logger, message, "INFO")
+        # Report Running Workers Not Registered With the Master (If It Is Already Up).
+        if running_workers and not masters_to_start:
+            try:
+                master_status = fetch_spark_master_status(master_public_ipv4_address, master_webui_port)
+            except (URLError, OSError, ValueError):
+                master_status = {}
+            unregistered_workers = get_missing_workers(master_status,
+                                                       {instance.name: instance.get_addresses()
+                                                        for instance in running_workers})
+            if unregistered_workers:
+                message = "Running worker(s) not registered with the Cluster '{0}' master: {1}." \
+                    .format(cluster_name,
+                            ", ".join(unregistered_workers))
+                log_message(logger, message, "INFO")
+
+    def wait_for_workers_registration(self,
+                                      cluster_name: str,
+                                      master_public_ipv4_address: str,
+                                      workers_list: list) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        master_webui_port = configuration_rules_settings["master_webui_port"]
+        timeout_in_seconds = configuration_rules_settings["worker_registration_timeout_in_seconds"]
+        poll_interval_in_seconds = configuration_rules_settings["worker_registration_poll_interval_in_seconds"]
+        # Get the Expected Workers, Cores and Memory (As Offered by Each Started Worker).
+        expected_workers = {}
+        expected_cores = 0
+        expected_memory_in_mb = 0
+        for instance in workers_list:
+            worker_cores, worker_memory, worker_memory_unit = self.get_worker_offer(instance)
+            worker_memory_in_mb = int(worker_memory * memory_units_in_mb[worker_memory_unit])
+            expected_workers[instance.name] = instance.get_addresses()
+            expected_cores = expected_cores + worker_cores
+            expected_memory_in_mb = expected_memory_in_mb + worker_memory_in_mb
+        message = "Waiting for {0} worker(s) ({1} cores, {2} MB) to register with the Cluster '{3}' master..." \
+            .format(len(expected_workers),
+                    expected_cores,
+                    expected_memory_in_mb,
+                    cluster_name)
+        log_message(logger, message, "INFO")
+        registered, master_status, missing_workers = \
+            wait_for_spark_workers_registration(master_public_ipv4_address,
+                                                master_webui_port,
+                                                expected_workers,
+                                                expected_cores,
+                                                expected_memory_in_mb,
+                                                timeout_in_seconds,
+                                                poll_interval_in_seconds)
+        alive_workers = get_alive_workers(master_status)
+        if registered:
+            message = "All {0} worker(s) of the Cluster '{1}' are registered ({2} cores, {3} MB)!" \
+                .format(len(alive_workers),
+                        cluster_name,
+                        sum(worker.get("cores", 0) for worker in alive_workers),
+                        sum(worker.get("memory", 0) for worker in alive_workers))
+        else:
+            message = "Only {0} of {1} worker(s) of the Cluster '{2}' registered within {3} seconds! " \
+                      "Missing worker(s): {4}." \
+                .format(len(alive_workers),
+                        len(expected_workers),
+                        cluster_name,
+                        timeout_in_seconds,
+                        ", ".join(missing_workers) if missing_workers else "unknown")
+        log_message(logger, message, "INFO")
 
     def parallel_start_spark_clusters(self,
                                       cluster_names: list) -> None:
@@ -330,14 +485,10 @@ def start_spark(arguments_dict: dict) -> None:
     cluster_names = arguments_dict["cluster_names"]
     # Get Cluster Names List.
     cluster_names_list = cluster_names.split(",")
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
     # Init Spark Starter Object.
     ss = SparkStarter(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         ss.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -350,7 +501,6 @@ def start_spark(arguments_dict: dict) -> None:
     # Parallel Start Spark Clusters.
     ss.parallel_start_spark_clusters(cluster_names_list)
     # Unbind Objects (Garbage Collector).
-    del cp
     del ss
     del logger
 
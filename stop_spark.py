@@ -1,12 +1,11 @@
 from argparse import ArgumentParser
 from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
 from pathlib import Path
 from typing import Any
+from util.cluster_inventory_util import ClusterInventory, InstanceRecord, load_cluster_inventory
 from util.logging_util import load_logger, log_message
-from util.os_util import check_if_file_exists, find_full_file_name_by_prefix
 from util.process_util import remotely_execute_command
-from util.sparking_cloud_util import parse_sparking_cloud_config_file
+from util.sparking_cloud_util import load_sparking_cloud_config_file
 
 
 class SparkStopper:
@@ -31,58 +30,24 @@ class SparkStopper:
                       attribute_name: str) -> Any:
         return getattr(self, attribute_name)
 
-    def read_instances_file(self,
-                            cluster_name: str) -> list:
-        instances_file_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        instances_file = Path(instances_file_root_folder).joinpath(cluster_name)
-        instances_list_parser = ConfigParser()
-        instances_list_parser.optionxform = str
-        instances_list_parser.read(filenames=instances_file,
-                                   encoding="utf-8")
-        instances_list = []
-        for section in instances_list_parser.sections():
-            if "Instance" in section:
-                instance_provider = instances_list_parser.get(section, "provider")
-                instance_name = instances_list_parser.get(section, "name")
-                instance_id = instances_list_parser.get(section, "id")
-                instance_key_name = instances_list_parser.get(section, "key_name")
-                instance_username = instances_list_parser.get(section, "username")
-                instance_public_ipv4_address = instances_list_parser.get(section, "public_ipv4_address")
-                instance_ssh_port = instances_list_parser.get(section, "ssh_port")
-                instance_dict = {"provider": instance_provider,
-                                 "name": instance_name,
-                                 "id": instance_id,
-                                 "key_name": instance_key_name,
-                                 "username": instance_username,
-                                 "public_ipv4_address": instance_public_ipv4_address,
-                                 "ssh_port": instance_ssh_port}
-                instances_list.append(instance_dict)
-        del instances_list_parser
-        return instances_list
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
 
     def stop_spark_on_master_instance(self,
-                                      instance_dict: dict) -> None:
+                                      instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -93,7 +58,10 @@ class SparkStopper:
         spark_home_directory = Path("\\$SPARK_HOME")
         spark_scripts_folder = spark_home_directory.joinpath("sbin")
         spark_stop_master_script_file = spark_scripts_folder.joinpath("stop-master.sh")
-        remote_command = "bash {0}".format(spark_stop_master_script_file)
+        # Stop the History Server Too (A No-Op If It Is Not Running).
+        spark_stop_history_server_script_file = spark_scripts_folder.joinpath("stop-history-server.sh")
+        remote_command = "bash {0}; bash {1}".format(spark_stop_history_server_script_file,
+                                                     spark_stop_master_script_file)
         remotely_execute_command(key_file=instance_key_file,
                                  username=instance_username,
                                  public_ipv4_address=instance_public_ipv4_address,
@@ -107,28 +75,15 @@ class SparkStopper:
                                  logger_level="DEBUG")
 
     def stop_spark_on_worker_instance(self,
-                                      instance_dict: dict) -> None:
+                                      instance: InstanceRecord) -> None:
         # Get Logger.
         logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
         max_tries = configuration_rules_settings["max_tries"]
@@ -154,18 +109,19 @@ class SparkStopper:
 
     def stop_spark_cluster_tasks(self,
                                  cluster_name: str) -> None:
-        # Read Cluster's Instances File.
-        instances_list = self.read_instances_file(cluster_name)
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Cluster's Inventory.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        cluster_inventory.check_key_files(logger)
         # Parallel Remotely Stop Spark on Instances (Masters and Workers).
         with ThreadPoolExecutor() as thread_pool_executor:
-            for instance_dict in instances_list:
-                instance_name = instance_dict["name"]
-                if "master" in instance_name.lower():
-                    thread_pool_executor.submit(self.stop_spark_on_master_instance,
-                                                instance_dict)
-                elif "worker" in instance_name.lower():
-                    thread_pool_executor.submit(self.stop_spark_on_worker_instance,
-                                                instance_dict)
+            for instance in cluster_inventory.get_masters():
+                thread_pool_executor.submit(self.stop_spark_on_master_instance,
+                                            instance)
+            for instance in cluster_inventory.get_workers():
+                thread_pool_executor.submit(self.stop_spark_on_worker_instance,
+                                            instance)
 
     def parallel_stop_spark_clusters(self,
                                      cluster_names: list) -> None:
@@ -188,14 +144,10 @@ def stop_spark(arguments_dict: dict) -> None:
     cluster_names = arguments_dict["cluster_names"]
     # Get Cluster Names List.
     cluster_names_list = cluster_names.split(",")
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
     # Init Spark Stopper Object.
     ss = SparkStopper(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         ss.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -208,7 +160,6 @@ def stop_spark(arguments_dict: dict) -> None:
     # Parallel Stop Spark Clusters.
     ss.parallel_stop_spark_clusters(cluster_names_list)
     # Unbind Objects (Garbage Collector).
-    del cp
     del ss
     del logger
 
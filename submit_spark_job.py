@@ -1,14 +1,27 @@
 from argparse import ArgumentParser
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
+from datetime import datetime
 from pathlib import Path
+from shlex import quote
+from time import monotonic, sleep
+from urllib.error import URLError
 from typing import Any
-from cloud_manager.ec2_manager import EC2Manager
+from cloud_manager.ec2_manager import get_ec2_manager
+from fetch_event_logs import SparkEventLogFetcher
 from util.aws_config_util import parse_aws_config_file
+from util.cluster_inventory_util import ClusterInventory, InstanceRecord, load_cluster_inventory
+from util.event_log_util import get_event_log_spark_properties, is_local_event_log_dir
+from util.job_queue_util import can_admit_job, get_job_cores_max, read_job_manifest, read_scheduler_pools, \
+    summarize_job_queue
 from util.logging_util import load_logger, log_message
-from util.os_util import check_if_file_exists, find_full_file_name_by_prefix
 from util.process_util import remotely_execute_command
-from util.sparking_cloud_util import parse_sparking_cloud_config_file
+from util.spark_job_util import generate_submission_id, is_submission_done, load_detached_submission_remote_command, \
+    load_spark_job_records, load_submission_status_remote_command, parse_submission_status
+from util.spark_master_util import fetch_spark_master_status, get_alive_workers
+from util.spark_metrics_util import get_config_hash, parse_event_log, save_job_metrics, summarize_job_metrics
+from util.spark_properties_util import read_spark_properties_file
+from util.sparking_cloud_util import load_sparking_cloud_config_file
 
 
 class SparkJobSubmitter:
@@ -23,6 +36,11 @@ class SparkJobSubmitter:
         self.spark_environment_settings = None
         # Other Attributes.
         self.logger = None
+        self.detached = False
+        self.wait_for_completion = False
+        self.submission_id = None
+        self.job_manifest_file = None
+        self.job_name = None
 
     def set_attribute(self,
                       attribute_name: str,
@@ -33,105 +51,122 @@ class SparkJobSubmitter:
                       attribute_name: str) -> Any:
         return getattr(self, attribute_name)
 
-    def read_instances_file(self,
-                            cluster_name: str) -> list:
-        instances_file_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        instances_file = Path(instances_file_root_folder).joinpath(cluster_name)
-        instances_list_parser = ConfigParser()
-        instances_list_parser.optionxform = str
-        instances_list_parser.read(filenames=instances_file,
-                                   encoding="utf-8")
-        instances_list = []
-        for section in instances_list_parser.sections():
-            if "Instance" in section:
-                instance_provider = instances_list_parser.get(section, "provider")
-                instance_name = instances_list_parser.get(section, "name")
-                instance_id = instances_list_parser.get(section, "id")
-                instance_key_name = instances_list_parser.get(section, "key_name")
-                instance_username = instances_list_parser.get(section, "username")
-                instance_public_ipv4_address = instances_list_parser.get(section, "public_ipv4_address")
-                instance_ssh_port = instances_list_parser.get(section, "ssh_port")
-                instance_dict = {"provider": instance_provider,
-                                 "name": instance_name,
-                                 "id": instance_id,
-                                 "key_name": instance_key_name,
-                                 "username": instance_username,
-                                 "public_ipv4_address": instance_public_ipv4_address,
-                                 "ssh_port": instance_ssh_port}
-                instances_list.append(instance_dict)
-        del instances_list_parser
-        return instances_list
-
-    def get_first_running_master_instance_dict(self,
-                                               instances_list: list) -> dict:
-        first_running_master_instance_dict = None
-        for instance_dict in instances_list:
-            instance_name = instance_dict["name"]
-            if "master" in instance_name.lower():
-                instance_provider = instance_dict["provider"]
-                if instance_provider == "AWS":
-                    # Parse AWS Config File.
-                    aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
-                    aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
-                    # Get AWS Service Setting (EC2).
-                    aws_service = self.get_attribute("aws_settings")["service"]
-                    # Init AWS EC2Manager Object.
-                    ec2m = EC2Manager(service_name=aws_service, region_name=aws_region)
-                    instance_id = instance_dict["id"]
-                    instance = ec2m.get_ec2_instance_from_id(instance_id)
-                    if ec2m.is_ec2_instance_running(instance):
-                        first_running_master_instance_dict = instance_dict
-                        del ec2m
-                        break
-        return first_running_master_instance_dict
+    def get_cluster_inventory(self,
+                              cluster_name: str) -> ClusterInventory:
+        # Get the Cluster's Inventory (Loaded Once and Shared Across Tasks and Stages).
+        general_settings = self.get_attribute("general_settings")
+        return load_cluster_inventory(general_settings["cluster_instances_root_folder"],
+                                      general_settings["key_root_folder"],
+                                      cluster_name)
 
-    def submit_spark_job_on_master_instance(self,
-                                            instance_dict: dict) -> None:
-        # Get Logger.
-        logger = self.get_attribute("logger")
-        # Get Key Root Folder.
-        key_root_folder = self.get_attribute("general_settings")["key_root_folder"]
-        # Get Instance Settings.
-        instance_name = instance_dict["name"]
-        instance_key_name = instance_dict["key_name"]
-        instance_full_key_name = find_full_file_name_by_prefix(key_root_folder,
-                                                               instance_key_name)
-        instance_key_file = Path(key_root_folder).joinpath(instance_full_key_name)
-        instance_key_file_exists = check_if_file_exists(instance_key_file)
-        if not instance_key_file_exists:
-            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
-                .format(instance_key_name,
-                        instance_name,
-                        key_root_folder)
-            log_message(logger, message, "INFO")
-            raise FileNotFoundError(message)
-        instance_username = instance_dict["username"]
-        instance_public_ipv4_address = instance_dict["public_ipv4_address"]
-        instance_ssh_port = instance_dict["ssh_port"]
+    def get_first_running_master_instance(self,
+                                          cluster_inventory: ClusterInventory) -> InstanceRecord:
+        # Parse AWS Config File.
+        aws_config_file_path = self.get_attribute("aws_settings")["config_file_path"]
+        aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
+        # Get AWS Service Setting (EC2).
+        aws_service = self.get_attribute("aws_settings")["service"]
+        # Get AWS EC2Manager Object (Pooled).
+        ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
+        return cluster_inventory.get_first_running_master(ec2m)
+
+    def get_job_spark_properties(self,
+                                 job: dict = None) -> dict:
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        job_properties = {}
+        if configuration_rules_settings["enable_event_logging"] or configuration_rules_settings["collect_job_metrics"]:
+            # The History Server and the Metrics Collector Read the Application's Event Log.
+            job_properties.update(get_event_log_spark_properties(configuration_rules_settings))
+        if job:
+            # A Queued Job Brings Its Own Pool, Cores Cap and Properties (Overriding the Properties File).
+            # The Cores Cap Is What Shares the Cluster Between Queued Jobs (Each One Is Its Own Application).
+            # The Pool Is Advisory: Spark Does Not Read It From the Configuration, and FAIR Pools Only Schedule
+            # Jobs Within One Application; the Application Applies It With sc.setLocalProperty, If It Wants To.
+            job_properties.update(job["properties"])
+            job_properties.update({"spark.scheduler.pool": job["pool"],
+                                   "spark.cores.max": job["cores_max"]})
+        return job_properties
+
+    def get_spark_job_config_hash(self,
+                                  cluster_name: str,
+                                  job: dict = None) -> str:
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        # The Properties Sent to the Cluster (Tuned for It, If Generated), Overridden by the Job's Own.
+        properties_file = Path(configuration_rules_settings["properties_file"])
+        tuned_properties_file = Path(cluster_instances_root_folder).joinpath(cluster_name, properties_file.name)
+        spark_properties = read_spark_properties_file(tuned_properties_file if tuned_properties_file.is_file()
+                                                      else properties_file)
+        spark_properties.update(self.get_job_spark_properties(job))
+        for ignored_property in ["spark.app.name", "spark.hadoop.fs.s3a.access.key", "spark.hadoop.fs.s3a.secret.key"]:
+            spark_properties.pop(ignored_property, None)
+        workers_types_list = [worker.type for worker in self.get_cluster_inventory(cluster_name).get_workers()]
+        return get_config_hash(spark_properties, workers_types_list)
+
+    def get_spark_submit_command(self,
+                                 instance: InstanceRecord,
+                                 spark_home_directory: Path,
+                                 job: dict = None) -> str:
         # Get Configuration Rules Settings.
         configuration_rules_settings = self.get_attribute("configuration_rules_settings")
-        max_tries = configuration_rules_settings["max_tries"]
-        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
         master_port = configuration_rules_settings["master_port"]
         properties_file = configuration_rules_settings["properties_file"]
         application_entry_point = configuration_rules_settings["application_entry_point"]
         application_arguments = configuration_rules_settings["application_arguments"]
-        message = "Launching the Spark application on the remote host {0} ({1})..." \
-            .format(instance_public_ipv4_address,
-                    instance_name)
-        log_message(logger, message, "INFO")
-        # Remotely Submit the Spark Application on Master.
-        spark_home_directory = Path("\\$SPARK_HOME")
+        if job:
+            application_entry_point = job["entry_point"]
+            application_arguments = job["arguments"]
+        job_properties = self.get_job_spark_properties(job)
+        # The Driver Runs on the Master and Talks to the Executors Over the Private Addresses.
+        instance_cluster_address = instance.get_cluster_address()
         spark_submit_script_folder = spark_home_directory.joinpath("bin")
         spark_submit_script_file = spark_submit_script_folder.joinpath("spark-submit")
-        master_url_option = "--master spark://{0}:{1}".format(instance_public_ipv4_address, master_port)
+        master_url_option = "--master spark://{0}:{1}".format(instance_cluster_address, master_port)
+        driver_host_option = "--conf spark.driver.host={0}".format(instance_cluster_address)
         properties_file_option = "--properties-file {0}".format(properties_file)
-        remote_command = "{0} {1} {2} {3} {4}" \
-            .format(spark_submit_script_file,
+        # Shell-Quote the Values (e.g., 'spark.executor.extraJavaOptions' Holds Spaces).
+        job_properties_options = " ".join("--conf {0}".format(quote("{0}={1}".format(key, value)))
+                                          for key, value in job_properties.items())
+        spark_submit_command = "SPARK_LOCAL_IP={0} {1} {2} {3} {4} {5} {6} {7}" \
+            .format(instance_cluster_address,
+                    spark_submit_script_file,
                     master_url_option,
+                    driver_host_option,
                     properties_file_option,
+                    job_properties_options,
                     application_entry_point,
                     application_arguments)
+        event_log_dir = job_properties.get("spark.eventLog.dir")
+        if event_log_dir and is_local_event_log_dir(event_log_dir):
+            # Spark Requires the Event Log Folder to Exist.
+            spark_submit_command = "mkdir -p {0} && {1}" \
+                .format(event_log_dir[len("file://"):],
+                        spark_submit_command)
+        return spark_submit_command
+
+    def submit_spark_job_on_master_instance(self,
+                                            instance: InstanceRecord) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Instance Settings (Key File Already Resolved by the Cluster Inventory).
+        instance_name = instance.name
+        instance_key_file = instance.key_file
+        instance_username = instance.username
+        instance_public_ipv4_address = instance.public_ipv4_address
+        instance_ssh_port = instance.ssh_port
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        message = "Launching the Spark application on the remote host {0} ({1})..." \
+            .format(instance_public_ipv4_address,
+                    instance_name)
+        log_message(logger, message, "INFO")
+        # Remotely Submit the Spark Application on Master.
+        remote_command = self.get_spark_submit_command(instance, Path("\\$SPARK_HOME"))
         remotely_execute_command(key_file=instance_key_file,
                                  username=instance_username,
                                  public_ipv4_address=instance_public_ipv4_address,
@@ -144,14 +179,324 @@ class SparkJobSubmitter:
                                  logger=logger,
                                  logger_level="DEBUG")
 
+    def submit_detached_spark_job_on_master_instance(self,
+                                                     cluster_name: str,
+                                                     instance: InstanceRecord,
+                                                     job: dict = None) -> dict:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        submission_id = generate_submission_id()
+        message = "Launching the Spark application '{0}' on the remote host {1} ({2}), detached..." \
+            .format(submission_id,
+                    instance.public_ipv4_address,
+                    instance.name)
+        log_message(logger, message, "INFO")
+        # Remotely Start the Driver Detached From the SSH Session (Headless, Returns Immediately).
+        spark_submit_command = self.get_spark_submit_command(instance, Path("$SPARK_HOME"), job)
+        remote_command = load_detached_submission_remote_command(submission_id, spark_submit_command)
+        remotely_execute_command(key_file=instance.key_file,
+                                 username=instance.username,
+                                 public_ipv4_address=instance.public_ipv4_address,
+                                 ssh_port=instance.ssh_port,
+                                 remote_command=remote_command,
+                                 on_new_windows=False,
+                                 request_tty=False,
+                                 max_tries=max_tries,
+                                 time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                 logger=logger,
+                                 logger_level="DEBUG")
+        # Record the Submission (Tracked Later by Its ID, Without Holding an SSH Session Open).
+        job_record = {"submission_id": submission_id,
+                      "cluster_name": cluster_name,
+                      "master_instance_id": instance.id,
+                      "name": job["name"] if job else self.get_attribute("job_name"),
+                      "application_entry_point": job["entry_point"] if job
+                      else configuration_rules_settings["application_entry_point"],
+                      "application_arguments": job["arguments"] if job
+                      else configuration_rules_settings["application_arguments"],
+                      "pool": job["pool"] if job else None,
+                      "cores_max": job["cores_max"] if job else None,
+                      "submitted_at": datetime.now().isoformat(timespec="seconds"),
+                      "state": "SUBMITTED",
+                      "application_id": None,
+                      "exit_code": None,
+                      "start_time": None,
+                      "end_time": None,
+                      "duration_in_seconds": None,
+                      "config_hash": self.get_spark_job_config_hash(cluster_name, job),
+                      "worker_instance_types": sorted(worker.type for worker
+                                                      in self.get_cluster_inventory(cluster_name)
+                                                      .get_instances(role="worker", state="running"))}
+        load_spark_job_records(cluster_instances_root_folder, cluster_name).add_job(job_record)
+        return job_record
+
+    def get_spark_job_status(self,
+                             cluster_name: str,
+                             submission_id: str) -> dict:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_tries = configuration_rules_settings["max_tries"]
+        time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+        # Finished Submissions Are Answered From the Job Records (No SSH Round Trip).
+        spark_job_records = load_spark_job_records(cluster_instances_root_folder, cluster_name)
+        job_record = spark_job_records.get_job(submission_id)
+        if job_record is None or is_submission_done(job_record["state"]):
+            return job_record
+        master_instance = self.get_cluster_inventory(cluster_name).get_instance(job_record["master_instance_id"])
+        if master_instance is None:
+            return spark_job_records.update_job(submission_id, {"state": "UNKNOWN"})
+        # Remotely Read the Submission's State (Single SSH Round Trip, Non-Blocking).
+        remote_command = load_submission_status_remote_command(submission_id)
+        process_stdout = remotely_execute_command(key_file=master_instance.key_file,
+                                                  username=master_instance.username,
+                                                  public_ipv4_address=master_instance.public_ipv4_address,
+                                                  ssh_port=master_instance.ssh_port,
+                                                  remote_command=remote_command,
+                                                  on_new_windows=False,
+                                                  request_tty=False,
+                                                  max_tries=max_tries,
+                                                  time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                                  logger=logger,
+                                                  logger_level="DEBUG")
+        job_record = spark_job_records.update_job(submission_id, parse_submission_status(process_stdout))
+        # Collect the Metrics of a Just Finished Job (Once, as Finished Jobs Are Not Queried Again).
+        if is_submission_done(job_record["state"]) and job_record["application_id"] \
+                and configuration_rules_settings["collect_job_metrics"]:
+            job_record = self.collect_spark_job_metrics(cluster_name, master_instance, job_record)
+        return job_record
+
+    def collect_spark_job_metrics(self,
+                                  cluster_name: str,
+                                  master_instance: InstanceRecord,
+                                  job_record: dict) -> dict:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        submission_id = job_record["submission_id"]
+        application_id = job_record["application_id"]
+        spark_job_records = load_spark_job_records(cluster_instances_root_folder, cluster_name)
+        # Fetch the Application's Event Log (Event Logging May Have Been Disabled for This Job).
+        elf = SparkEventLogFetcher(self.get_attribute("sparking_cloud_config_file"))
+        for attribute_name in ["general_settings", "aws_settings", "configuration_rules_settings", "logger"]:
+            elf.set_attribute(attribute_name, self.get_attribute(attribute_name))
+        local_event_log_file = elf.fetch_application_event_log(cluster_name, master_instance, application_id)
+        if local_event_log_file is None:
+            message = "No event log found for the Spark job '{0}' ({1}), its metrics were not collected!" \
+                .format(submission_id, application_id)
+            log_message(logger, message, "INFO")
+            return job_record
+        # Store the Task Metrics Columns, Keyed by Cluster, Config Hash and Job, and Their Summary.
+        try:
+            job_metrics = parse_event_log(local_event_log_file)
+        except ValueError as value_error:
+            message = "The Spark job '{0}' metrics were not collected: {1}".format(submission_id, value_error)
+            log_message(logger, message, "INFO")
+            return job_record
+        metrics_file = Path(cluster_instances_root_folder).joinpath(cluster_name,
+                                                                    "metrics",
+                                                                    job_record["config_hash"],
+                                                                    submission_id + ".npz")
+        save_job_metrics(metrics_file, job_metrics)
+        metrics_summary = summarize_job_metrics(job_metrics)
+        message = "Spark job '{0}' metrics: {1} tasks, {2} ms of CPU time, {3:.1%} GC, {4} bytes shuffled, " \
+                  "{5} bytes spilled to disk, max stage skew: {6}." \
+            .format(submission_id,
+                    metrics_summary["tasks"],
+                    metrics_summary["total_cpu_time_in_ms"],
+                    metrics_summary["gc_time_fraction"],
+                    metrics_summary["shuffle_write_bytes"],
+                    metrics_summary["disk_spilled_bytes"],
+                    metrics_summary["max_stage_skew"])
+        log_message(logger, message, "INFO")
+        return spark_job_records.update_job(submission_id,
+                                            {"metrics_file": str(metrics_file),
+                                             "metrics_summary": metrics_summary})
+
+    def wait_for_spark_job(self,
+                           cluster_name: str,
+                           submission_id: str) -> dict:
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        timeout_in_seconds = configuration_rules_settings["job_wait_timeout_in_seconds"]
+        poll_interval_in_seconds = configuration_rules_settings["job_status_poll_interval_in_seconds"]
+        # Poll the Submission's State Until It Is Done or the Deadline Passes (No Deadline If the Timeout is 0).
+        deadline = monotonic() + timeout_in_seconds
+        while True:
+            job_record = self.get_spark_job_status(cluster_name, submission_id)
+            if job_record is None or is_submission_done(job_record["state"]):
+                return job_record
+            if 0 < timeout_in_seconds and deadline <= monotonic():
+                return job_record
+            sleep(poll_interval_in_seconds)
+
+    def get_registered_cores(self,
+                             master_instance: InstanceRecord) -> int:
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        master_webui_port = configuration_rules_settings["master_webui_port"]
+        # Total Cores of the Workers Registered With the Master (0 If the Master Is Unreachable).
+        try:
+            master_status = fetch_spark_master_status(master_instance.public_ipv4_address, master_webui_port)
+        except (URLError, OSError, ValueError):
+            master_status = {}
+        return sum(worker.get("cores", 0) for worker in get_alive_workers(master_status))
+
+    def run_spark_job_queue(self,
+                            cluster_name: str,
+                            job_manifest_file: Path) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Clusters Instances Root Folder.
+        cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
+        # Get Configuration Rules Settings.
+        configuration_rules_settings = self.get_attribute("configuration_rules_settings")
+        max_concurrent_jobs = configuration_rules_settings["job_queue_max_concurrent_jobs"]
+        poll_interval_in_seconds = configuration_rules_settings["job_status_poll_interval_in_seconds"]
+        # Get Cluster's Inventory.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        cluster_inventory.check_key_files(logger)
+        # Get the First Running Master Instance and the Cores Registered With It.
+        first_running_master_instance = self.get_first_running_master_instance(cluster_inventory)
+        registered_cores = self.get_registered_cores(first_running_master_instance)
+        if registered_cores == 0:
+            message = "The Cluster '{0}' has no registered worker cores, the job queue was not run!" \
+                .format(cluster_name)
+            log_message(logger, message, "INFO")
+            return
+        # Read the Job Manifest (Pools Checked Against the Scheduler Allocation File).
+        scheduler_pools = read_scheduler_pools(configuration_rules_settings["pool_properties_file"])
+        job_defaults = {"entry_point": configuration_rules_settings["application_entry_point"],
+                        "arguments": configuration_rules_settings["application_arguments"],
+                        "pool": configuration_rules_settings["job_queue_default_pool"],
+                        "cores_max": configuration_rules_settings["job_queue_default_cores_max"]}
+        pending_jobs = deque(read_job_manifest(job_manifest_file, job_defaults, scheduler_pools))
+        for job in pending_jobs:
+            job["cores_max"] = get_job_cores_max(job, registered_cores, max_concurrent_jobs)
+        message = "Running {0} queued job(s) on the Cluster '{1}' ({2} registered cores, at most {3} concurrent " \
+                  "job(s))...".format(len(pending_jobs), cluster_name, registered_cores, max_concurrent_jobs or "N")
+        log_message(logger, message, "INFO")
+        # Submit Detached Jobs While Their Cores Fit, Refreshing the Running Ones' States Between Rounds.
+        spark_job_records = load_spark_job_records(cluster_instances_root_folder, cluster_name)
+        queue_start_time = monotonic()
+        running_jobs = {}
+        submission_ids = []
+        while pending_jobs or running_jobs:
+            for submission_id in list(running_jobs):
+                job_record = self.get_spark_job_status(cluster_name, submission_id)
+                if is_submission_done(job_record["state"]):
+                    del running_jobs[submission_id]
+                    self.log_spark_job_status(cluster_name, submission_id, job_record)
+            while pending_jobs and can_admit_job(pending_jobs[0]["cores_max"],
+                                                 list(running_jobs.values()),
+                                                 registered_cores,
+                                                 max_concurrent_jobs):
+                job = pending_jobs.popleft()
+                job_record = self.submit_detached_spark_job_on_master_instance(cluster_name,
+                                                                               first_running_master_instance,
+                                                                               job)
+                submission_id = job_record["submission_id"]
+                spark_job_records.update_job(submission_id,
+                                             {"queue_wait_in_seconds": round(monotonic() - queue_start_time)})
+                running_jobs[submission_id] = job["cores_max"]
+                submission_ids.append(submission_id)
+            if pending_jobs or running_jobs:
+                sleep(poll_interval_in_seconds)
+        # Summarize the Batch's Timings.
+        job_queue_summary = summarize_job_queue([spark_job_records.get_job(submission_id)
+                                                 for submission_id in submission_ids])
+        message = "Job queue of the Cluster '{0}' done: {1} job(s) {2}, makespan: {3} seconds, total job " \
+                  "duration: {4} seconds, longest queue wait: {5} seconds." \
+            .format(cluster_name,
+                    job_queue_summary["jobs"],
+                    job_queue_summary["states"],
+                    job_queue_summary["makespan_in_seconds"],
+                    job_queue_summary["total_job_duration_in_seconds"],
+                    job_queue_summary["max_queue_wait_in_seconds"])
+        log_message(logger, message, "INFO")
+
+    def log_spark_job_status(self,
+                             cluster_name: str,
+                             submission_id: str,
+                             job_record: dict) -> None:
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        if job_record is None:
+            message = "The Cluster '{0}' has no record of the Spark job '{1}'!".format(cluster_name, submission_id)
+        else:
+            message = "Spark job '{0}' of the Cluster '{1}': {2} (application ID: {3}, exit code: {4}, " \
+                      "duration: {5} seconds)." \
+                .format(submission_id,
+                        cluster_name,
+                        job_record["state"],
+                        job_record["application_id"],
+                        job_record["exit_code"],
+                        job_record["duration_in_seconds"])
+        # Print the Status (Headless Callers Get It Even With Logging Disabled).
+        print(message)
+        log_message(logger, message, "INFO")
+
     def submit_spark_job_tasks(self,
                                cluster_name: str) -> None:
-        # Read Cluster's Instances File.
-        instances_list = self.read_instances_file(cluster_name)
+        # Get Logger.
+        logger = self.get_attribute("logger")
+        # Get Cluster's Inventory.
+        cluster_inventory = self.get_cluster_inventory(cluster_name)
+        cluster_inventory.check_key_files(logger)
         # Get the First Running Master Instance.
-        first_running_master_instance_dict = self.get_first_running_master_instance_dict(instances_list)
-        # Submit the Spark Job on the Master Instance.
-        self.submit_spark_job_on_master_instance(first_running_master_instance_dict)
+        first_running_master_instance = self.get_first_running_master_instance(cluster_inventory)
+        # Submit the Spark Job on the Master Instance (In a New Terminal Window, Unless Detached).
+        if not self.get_attribute("detached"):
+            self.submit_spark_job_on_master_instance(first_running_master_instance)
+            return
+        job_record = self.submit_detached_spark_job_on_master_instance(cluster_name,
+                                                                       first_running_master_instance)
+        submission_id = job_record["submission_id"]
+        # Print the Submission ID (The Handle to Track the Detached Job, Even With Logging Disabled).
+        message = "Submission ID of the Spark job on the Cluster '{0}': {1}".format(cluster_name, submission_id)
+        print(message, flush=True)
+        log_message(logger, message, "INFO")
+        if self.get_attribute("wait_for_completion"):
+            job_record = self.wait_for_spark_job(cluster_name, submission_id)
+        self.log_spark_job_status(cluster_name, submission_id, job_record)
+
+    def track_spark_job_tasks(self,
+                              cluster_name: str,
+                              submission_id: str) -> None:
+        # Get the Submission's Current State, or Wait for It to Finish.
+        if self.get_attribute("wait_for_completion"):
+            job_record = self.wait_for_spark_job(cluster_name, submission_id)
+        else:
+            job_record = self.get_spark_job_status(cluster_name, submission_id)
+        self.log_spark_job_status(cluster_name, submission_id, job_record)
+
+    def parallel_track_spark_jobs(self,
+                                  cluster_names: list,
+                                  submission_id: str) -> None:
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for cluster_name in cluster_names:
+                thread_pool_executor.submit(self.track_spark_job_tasks,
+                                            cluster_name,
+                                            submission_id)
+
+    def parallel_run_spark_job_queues(self,
+                                      cluster_names: list,
+                                      job_manifest_file: Path) -> None:
+        with ThreadPoolExecutor() as thread_pool_executor:
+            for cluster_name in cluster_names:
+                thread_pool_executor.submit(self.run_spark_job_queue,
+                                            cluster_name,
+                                            job_manifest_file)
 
     def parallel_submit_spark_jobs(self,
                                    cluster_names: list) -> None:
@@ -172,16 +517,17 @@ def submit_spark_job(arguments_dict: dict) -> None:
     # Get Arguments.
     sparking_cloud_config_file = arguments_dict["sparking_cloud_config_file"]
     cluster_names = arguments_dict["cluster_names"]
+    detached = arguments_dict["detached"]
+    wait_for_completion = arguments_dict["wait_for_completion"]
+    submission_id = arguments_dict["submission_id"]
+    job_manifest_file = arguments_dict["job_manifest_file"]
+    job_name = arguments_dict["job_name"]
     # Get Cluster Names List.
     cluster_names_list = cluster_names.split(",")
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
     # Init Spark Job Submitter Object.
     sjs = SparkJobSubmitter(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         sjs.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -191,10 +537,20 @@ def submit_spark_job(arguments_dict: dict) -> None:
     # Instantiate and Set Logger.
     logger = load_logger(enable_logging, logging_settings)
     sjs.set_attribute("logger", logger)
-    # Parallel Submit Spark Jobs.
-    sjs.parallel_submit_spark_jobs(cluster_names_list)
+    # Set Submission Mode.
+    sjs.set_attribute("detached", detached)
+    sjs.set_attribute("wait_for_completion", wait_for_completion)
+    sjs.set_attribute("job_name", job_name)
+    if job_manifest_file:
+        # Run the Job Manifest's Queue on Each Cluster (Detached Submissions, Core-Aware Concurrency).
+        sjs.parallel_run_spark_job_queues(cluster_names_list, job_manifest_file)
+    elif submission_id:
+        # Get the State of a Previously Detached Spark Job (Or Wait for It).
+        sjs.parallel_track_spark_jobs(cluster_names_list, submission_id)
+    else:
+        # Parallel Submit Spark Jobs.
+        sjs.parallel_submit_spark_jobs(cluster_names_list)
     # Unbind Objects (Garbage Collector).
-    del cp
     del sjs
     del logger
 
@@ -212,10 +568,37 @@ if __name__ == "__main__":
                     type=str,
                     required=True,
                     help="Cluster Names (no default)")
+    ag.add_argument("--detached",
+                    action="store_true",
+                    help="Submit Headless, Detached From the SSH Session, and Print the Submission ID "
+                         "(default: False)")
+    ag.add_argument("--wait",
+                    action="store_true",
+                    help="Wait for the Detached Spark Job to Finish (default: False)")
+    ag.add_argument("--submission_id",
+                    type=str,
+                    required=False,
+                    default=None,
+                    help="Get the State of a Detached Spark Job Instead of Submitting One (default: None)")
+    ag.add_argument("--job_manifest_file",
+                    type=Path,
+                    required=False,
+                    default=None,
+                    help="Run the Jobs of a Manifest File as a Queue (default: None)")
+    ag.add_argument("--job_name",
+                    type=str,
+                    required=False,
+                    default=None,
+                    help="Name Recorded for a Detached Spark Job, to Plan Its Cluster Shape (default: None)")
     parsed_args = ag.parse_args()
     # Generate Arguments Dict.
     args_dict = {"sparking_cloud_config_file": Path(parsed_args.sparking_cloud_config_file),
-                 "cluster_names": str(parsed_args.cluster_names)}
+                 "cluster_names": str(parsed_args.cluster_names),
+                 "detached": bool(parsed_args.detached),
+                 "wait_for_completion": bool(parsed_args.wait),
+                 "submission_id": parsed_args.submission_id,
+                 "job_manifest_file": parsed_args.job_manifest_file,
+                 "job_name": parsed_args.job_name}
     # Submit Spark Job.
     submit_spark_job(args_dict)
     # Unbind Objects (Garbage Collector).
@@ -1,13 +1,13 @@
 from argparse import ArgumentParser
 from concurrent.futures import ThreadPoolExecutor, wait
-from configparser import ConfigParser
 from pathlib import Path
 from typing import Any
-from cloud_manager.ec2_manager import EC2Manager
+from cloud_manager.ec2_manager import EC2Manager, get_ec2_manager
 from util.aws_config_util import parse_aws_config_file
 from util.logging_util import load_logger, log_message
-from util.sparking_cloud_util import parse_sparking_cloud_config_file, read_instances_file, \
-    generate_cluster_instances_summary, print_cluster_instances_summary
+from util.instance_registry_util import load_instance_registry
+from util.sparking_cloud_util import load_sparking_cloud_config_file, generate_cluster_instances_summary, \
+    print_cluster_instances_summary
 
 
 class ClusterTerminator:
@@ -54,18 +54,30 @@ class ClusterTerminator:
                     .format(number_of_active_ec2_instances, cluster_name)
             log_message(logger, message, "INFO")
 
+    def delete_placement_groups(self,
+                                cluster_name: str,
+                                ec2m: EC2Manager) -> None:
+        # Delete the Cluster's Placement Groups (One Per Strategy, Created by the Builder on Demand).
+        placement_groups_names_list = [ec2m.get_placement_group_name(cluster_name, placement_strategy)
+                                       for placement_strategy in ["cluster", "spread", "partition"]]
+        deleted_placement_groups_names_list = ec2m.delete_placement_groups(placement_groups_names_list)
+        if deleted_placement_groups_names_list:
+            logger = self.get_attribute("logger")
+            message = "Placement Group(s) of '{0}' deleted: {1}." \
+                .format(cluster_name, ", ".join(deleted_placement_groups_names_list))
+            log_message(logger, message, "INFO")
+
     def terminate_cluster_tasks(self,
                                 cluster_name: str,
                                 ec2m: EC2Manager) -> None:
         # Get Clusters Instances Root Folder.
         cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-        # Get Cluster Instances File.
-        cluster_instances_file = Path(cluster_instances_root_folder).joinpath(cluster_name)
-        # Read Cluster's Instances File.
-        instances_list = read_instances_file(cluster_instances_file)
+        # Read Cluster's Registered Instances.
+        instances_list = load_instance_registry(cluster_instances_root_folder).get_instances(cluster_name)
         # Terminate EC2 Instances (If Any Belongs to the Cluster).
         if ec2m:
             self.terminate_ec2_instances(cluster_name, instances_list, ec2m)
+            self.delete_placement_groups(cluster_name, ec2m)
 
     def parallel_terminate_clusters(self,
                                     cluster_names: list) -> None:
@@ -79,16 +91,14 @@ class ClusterTerminator:
             aws_region, aws_output = parse_aws_config_file(aws_config_file_path)
             # Get AWS Service Setting (EC2).
             aws_service = self.get_attribute("aws_settings")["service"]
-            # Init AWS EC2Manager Object.
-            ec2m = EC2Manager(service_name=aws_service, region_name=aws_region)
+            # Get AWS EC2Manager Object (Pooled).
+            ec2m = get_ec2_manager(service_name=aws_service, region_name=aws_region)
         with ThreadPoolExecutor() as thread_pool_executor:
             for cluster_name in cluster_names:
                 # Get Logger.
                 logger = self.get_attribute("logger")
                 # Get Clusters Instances Root Folder.
                 cluster_instances_root_folder = self.get_attribute("general_settings")["cluster_instances_root_folder"]
-                # Get Cluster Instances File.
-                cluster_instances_file = Path(cluster_instances_root_folder).joinpath(cluster_name)
                 message = "Terminating the Cluster '{0}'...".format(cluster_name)
                 log_message(logger, message, "INFO")
                 future = thread_pool_executor.submit(self.terminate_cluster_tasks,
@@ -97,10 +107,13 @@ class ClusterTerminator:
                 wait([future])
                 message = "The Cluster '{0}' was terminated successfully!".format(cluster_name)
                 log_message(logger, message, "INFO")
-                # Read the Cluster's Instances File.
-                instances_list = read_instances_file(cluster_instances_file)
+                # Read the Cluster's Registered Instances.
+                instance_registry = load_instance_registry(cluster_instances_root_folder)
+                instances_list = instance_registry.get_instances(cluster_name)
                 # Generate the Cluster Instances Summary (All Providers).
                 cluster_instances_summary = generate_cluster_instances_summary(instances_list, ec2m)
+                # Batch Update the Registered Instances' States.
+                instance_registry.update_instances(cluster_instances_summary)
                 # Print the Recently Terminated Cluster Instances Summary.
                 print_cluster_instances_summary(cluster_name,
                                                 cluster_instances_summary)
@@ -114,14 +127,10 @@ def terminate_cluster(arguments_dict: dict) -> None:
     cluster_names = arguments_dict["cluster_names"]
     # Get Cluster Names List.
     cluster_names_list = cluster_names.split(",")
-    # Init Config Parser Object.
-    cp = ConfigParser()
-    cp.optionxform = str
-    cp.read(filenames=sparking_cloud_config_file, encoding="utf-8")
     # Init Cluster Terminator Object.
     ct = ClusterTerminator(sparking_cloud_config_file)
-    # Parse Sparking Cloud Config File and Set Attributes.
-    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(cp)
+    # Load Sparking Cloud Config File (Validated and Cached) and Set Attributes.
+    sparking_cloud_settings_dict = load_sparking_cloud_config_file(sparking_cloud_config_file)
     for k, v in sparking_cloud_settings_dict.items():
         ct.set_attribute(k, v)
     # Check if Logging is Enabled.
@@ -134,7 +143,6 @@ def terminate_cluster(arguments_dict: dict) -> None:
     # Parallel Terminate Clusters.
     ct.parallel_terminate_clusters(cluster_names_list)
     # Unbind Objects (Garbage Collector).
-    del cp
     del ct
     del logger
 
@@ -0,0 +1,151 @@
+from unittest import TestCase, main
+from util.autoscaler_util import decide_scaling_action, load_autoscaler_state, observe_master_status
+
+
+def load_autoscaling_settings(**overrides) -> dict:
+    autoscaling_settings = {"autoscale_min_workers": 1,
+                            "autoscale_max_workers": 4,
+                            "autoscale_scale_out_utilization": 0.8,
+                            "autoscale_scale_in_utilization": 0.3,
+                            "autoscale_sustained_observations": 3,
+                            "autoscale_scale_out_step": 1,
+                            "autoscale_scale_in_step": 1,
+                            "autoscale_scale_out_cooldown_in_seconds": 300,
+                            "autoscale_scale_in_cooldown_in_seconds": 600,
+                            "enable_external_shuffle_service": True}
+    autoscaling_settings.update(overrides)
+    return autoscaling_settings
+
+
+def load_master_status(workers_cores_used: list,
+                       applications_states: list = ()) -> dict:
+    # Simulated Master Status: One Alive 4-Core Worker Per Entry, Using the Given Number of Cores.
+    return {"workers": [{"host": "10.0.0.{0}".format(index),
+                         "webuiaddress": "http://10.0.0.{0}:8081".format(index),
+                         "state": "ALIVE",
+                         "cores": 4,
+                         "coresused": cores_used}
+                        for index, cores_used in enumerate(workers_cores_used)],
+            "activeapps": [{"state": application_state} for application_state in applications_states]}
+
+
+class DecideScalingActionTests(TestCase):
+
+    def decide(self,
+               observations: list,
+               autoscaling_settings: dict,
+               autoscaler_state: dict = None,
+               start_time: float = 0.0,
+               poll_interval_in_seconds: float = 30.0) -> tuple:
+        # Feed the Observations, One Per Poll, and Return the Actions and the Last State.
+        autoscaler_state = autoscaler_state or load_autoscaler_state()
+        actions = []
+        for index, observation in enumerate(observations):
+            action, number_of_workers, reason, autoscaler_state = \
+                decide_scaling_action(observation,
+                                      autoscaler_state,
+                                      autoscaling_settings,
+                                      start_time + index * poll_interval_in_seconds)
+            actions.append((action, number_of_workers))
+        return actions, autoscaler_state
+
+    def test_observe_master_status(self) -> None:
+        observation = observe_master_status(load_master_status([4, 0], ["RUNNING", "WAITING"]), 3)
+        self.assertEqual(observation["alive_workers"], 2)
+        self.assertEqual(observation["pending_workers"], 1)
+        self.assertEqual(observation["utilization"], 0.5)
+        self.assertEqual(observation["waiting_applications"], 1)
+        self.assertEqual(observation["active_applications"], 2)
+        self.assertEqual([worker["host"] for worker in observation["idle_workers"]], ["10.0.0.1"])
+
+    def test_scale_out_requires_sustained_high_load(self) -> None:
+        busy = observe_master_status(load_master_status([4, 4], ["RUNNING"]), 2)
+        quiet = observe_master_status(load_master_status([2, 2], ["RUNNING"]), 2)
+        # A Single Quiet Observation Resets the Hysteresis Counter.
+        actions, _ = self.decide([busy, busy, quiet, busy, busy, busy], load_autoscaling_settings())
+        self.assertEqual(actions, [(None, 0)] * 5 + [("out", 1)])
+
+    def test_scale_in_requires_sustained_low_load(self) -> None:
+        idle = observe_master_status(load_master_status([0, 0]), 2)
+        busy = observe_master_status(load_master_status([4, 4], ["RUNNING"]), 2)
+        actions, _ = self.decide([idle, idle, busy, idle, idle, idle], load_autoscaling_settings())
+        self.assertEqual(actions, [(None, 0)] * 5 + [("in", 1)])
+
+    def test_scale_out_cooldown(self) -> None:
+        busy = observe_master_status(load_master_status([4, 4], ["WAITING"]), 2)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1)
+        actions, autoscaler_state = self.decide([busy] * 11, autoscaling_settings)
+        # Out at 0 s, Then Cooling Down Until 300 s.
+        self.assertEqual(actions, [("out", 1)] + [(None, 0)] * 9 + [("out", 1)])
+        self.assertEqual(autoscaler_state["last_scale_out_time"], 300.0)
+
+    def test_scale_in_cooldown_follows_any_scaling(self) -> None:
+        idle = observe_master_status(load_master_status([0, 0, 0]), 3)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1)
+        autoscaler_state = load_autoscaler_state()
+        autoscaler_state["last_scale_out_time"] = 0.0
+        actions, _ = self.decide([idle] * 21, autoscaling_settings, autoscaler_state)
+        # Scaling In Waits 600 s After the Previous Scaling Out.
+        self.assertEqual(actions, [(None, 0)] * 20 + [("in", 1)])
+
+    def test_scale_out_stops_at_the_maximum(self) -> None:
+        busy = observe_master_status(load_master_status([4, 4, 4], ["WAITING"]), 3)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1,
+                                                         autoscale_max_workers=3)
+        actions, _ = self.decide([busy] * 3, autoscaling_settings)
+        self.assertEqual(actions, [(None, 0)] * 3)
+
+    def test_pending_workers_count_against_the_maximum(self) -> None:
+        busy = observe_master_status(load_master_status([4, 4], ["WAITING"]), 4)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1)
+        actions, _ = self.decide([busy] * 20, autoscaling_settings)
+        self.assertEqual(actions, [(None, 0)] * 20)
+
+    def test_scale_in_stops_at_the_minimum(self) -> None:
+        idle = observe_master_status(load_master_status([0, 0]), 2)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1,
+                                                         autoscale_min_workers=2)
+        actions, _ = self.decide([idle] * 3, autoscaling_settings)
+        self.assertEqual(actions, [(None, 0)] * 3)
+
+    def test_below_the_minimum_waits_for_the_cooldown(self) -> None:
+        # No Worker Ever Registers: The Launches Are Spaced by the Cooldown and Bounded by the Maximum.
+        autoscaling_settings = load_autoscaling_settings(autoscale_min_workers=2,
+                                                         autoscale_max_workers=3)
+        autoscaler_state = load_autoscaler_state()
+        launched_workers = 0
+        launches = []
+        for poll_time in range(0, 1200, 30):
+            observation = observe_master_status(load_master_status([]), launched_workers)
+            action, number_of_workers, _, autoscaler_state = decide_scaling_action(observation,
+                                                                                   autoscaler_state,
+                                                                                   autoscaling_settings,
+                                                                                   poll_time)
+            if action == "out":
+                launches.append((poll_time, number_of_workers))
+                launched_workers += number_of_workers
+        self.assertEqual(launches, [(0, 2), (300, 1)])
+
+    def test_scale_in_removes_only_idle_workers(self) -> None:
+        lightly_loaded = observe_master_status(load_master_status([1, 1, 1, 1]), 4)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1)
+        actions, _ = self.decide([lightly_loaded] * 3, autoscaling_settings)
+        self.assertEqual(actions, [(None, 0)] * 3)
+        partly_idle = observe_master_status(load_master_status([1, 0, 1, 0]), 4)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1,
+                                                         autoscale_scale_in_step=3)
+        actions, _ = self.decide([partly_idle], autoscaling_settings)
+        self.assertEqual(actions, [("in", 2)])
+
+    def test_scale_in_waits_for_active_applications_with_shuffle_service(self) -> None:
+        idle = observe_master_status(load_master_status([0, 0], ["RUNNING"]), 2)
+        actions, _ = self.decide([idle] * 3, load_autoscaling_settings(autoscale_sustained_observations=1))
+        self.assertEqual(actions, [(None, 0)] * 3)
+        autoscaling_settings = load_autoscaling_settings(autoscale_sustained_observations=1,
+                                                         enable_external_shuffle_service=False)
+        actions, _ = self.decide([idle], autoscaling_settings)
+        self.assertEqual(actions, [("in", 1)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from util.cluster_inventory_util import load_cluster_inventory, unload_cluster_inventory
+from util.instance_registry_util import load_instance_registry
+
+
+class PooledInventoryStatesTests(TestCase):
+
+    def setUp(self) -> None:
+        self.temporary_folder = TemporaryDirectory()
+        self.cluster_instances_root_folder = Path(self.temporary_folder.name)
+        self.instance_registry = load_instance_registry(self.cluster_instances_root_folder)
+        self.instance_registry.insert_instances("cluster",
+                                                [{"provider": "AWS", "name": "cluster-master", "id": "i-1"},
+                                                 {"provider": "AWS", "name": "cluster-worker-1", "id": "i-2"}])
+
+    def tearDown(self) -> None:
+        unload_cluster_inventory(self.cluster_instances_root_folder, "cluster")
+        self.instance_registry.close()
+        self.temporary_folder.cleanup()
+
+    def test_states_refreshed_when_handed_out(self) -> None:
+        cluster_inventory = load_cluster_inventory(self.cluster_instances_root_folder, Path("keys"), "cluster")
+        self.assertEqual(len(cluster_inventory.get_instances(state="running")), 2)
+        # Another Task Stops the Worker After the Inventory Was Pooled.
+        self.instance_registry.update_instances([{"id": "i-2", "state": "stopped"}])
+        cluster_inventory = load_cluster_inventory(self.cluster_instances_root_folder, Path("keys"), "cluster")
+        self.assertEqual([instance.id for instance in cluster_inventory.get_instances(state="running")], ["i-1"])
+        self.assertEqual([instance.id for instance in cluster_inventory.get_instances(role="worker",
+                                                                                      state="stopped")], ["i-2"])
+
+
+if __name__ == "__main__":
+    main()
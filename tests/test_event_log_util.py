@@ -0,0 +1,61 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from util.event_log_util import find_event_log_name, get_event_log_files, get_finished_event_log_names, \
+    read_event_log_lines
+
+
+class EventLogNamesTests(TestCase):
+
+    def test_plain_logs_in_progress_are_skipped(self) -> None:
+        event_log_paths = ["app-20240101000000-0000.zstd", "app-20240101000000-0001.zstd.inprogress"]
+        self.assertEqual(get_finished_event_log_names(event_log_paths), ["app-20240101000000-0000.zstd"])
+
+    def test_rolling_logs_in_progress_are_skipped(self) -> None:
+        # The Running Application's Folder Has No '.inprogress' Suffix, Only Its Status Marker Has.
+        event_log_paths = ["eventlog_v2_app-20240101000000-0000",
+                           "eventlog_v2_app-20240101000000-0000/events_1_app-20240101000000-0000.zstd",
+                           "eventlog_v2_app-20240101000000-0000/appstatus_app-20240101000000-0000",
+                           "eventlog_v2_app-20240101000000-0001",
+                           "eventlog_v2_app-20240101000000-0001/events_1_app-20240101000000-0001.zstd",
+                           "eventlog_v2_app-20240101000000-0001/appstatus_app-20240101000000-0001.inprogress"]
+        self.assertEqual(get_finished_event_log_names(event_log_paths), ["eventlog_v2_app-20240101000000-0000"])
+
+    def test_find_event_log_name(self) -> None:
+        event_log_names = ["app-20240101000000-0000.inprogress",
+                           "app-20240101000000-0001.lz4",
+                           "eventlog_v2_app-20240101000000-0002"]
+        self.assertIsNone(find_event_log_name(event_log_names, "app-20240101000000-0000"))
+        self.assertEqual(find_event_log_name(event_log_names, "app-20240101000000-0001"),
+                         "app-20240101000000-0001.lz4")
+        self.assertEqual(find_event_log_name(event_log_names, "app-20240101000000-0002"),
+                         "eventlog_v2_app-20240101000000-0002")
+
+
+class EventLogFilesTests(TestCase):
+
+    def test_rolling_files_are_read_in_index_order(self) -> None:
+        with TemporaryDirectory() as temporary_folder:
+            event_log_folder = Path(temporary_folder).joinpath("eventlog_v2_app-20240101000000-0000")
+            event_log_folder.mkdir()
+            for index in [10, 2, 1]:
+                event_log_folder.joinpath("events_{0}_app-20240101000000-0000".format(index)) \
+                    .write_text("{{\"Index\": {0}}}\n".format(index), encoding="utf-8")
+            event_log_folder.joinpath("appstatus_app-20240101000000-0000").write_text("", encoding="utf-8")
+            self.assertEqual([event_log_file.name for event_log_file in get_event_log_files(event_log_folder)],
+                             ["events_1_app-20240101000000-0000",
+                              "events_2_app-20240101000000-0000",
+                              "events_10_app-20240101000000-0000"])
+            self.assertEqual([line.strip() for line in read_event_log_lines(event_log_folder)],
+                             ["{\"Index\": 1}", "{\"Index\": 2}", "{\"Index\": 10}"])
+
+    def test_unreadable_codecs_are_reported(self) -> None:
+        with TemporaryDirectory() as temporary_folder:
+            event_log_file = Path(temporary_folder).joinpath("app-20240101000000-0000.lz4")
+            event_log_file.write_bytes(b"")
+            with self.assertRaises(ValueError):
+                list(read_event_log_lines(event_log_file))
+
+
+if __name__ == "__main__":
+    main()
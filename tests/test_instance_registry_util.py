@@ -0,0 +1,64 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main
+from util.instance_registry_util import InstanceRegistry, instance_registry_file_name, \
+    migrate_legacy_instances_files
+
+
+class InstanceRegistryTests(TestCase):
+
+    def setUp(self) -> None:
+        self.temporary_folder = TemporaryDirectory()
+        self.cluster_instances_root_folder = Path(self.temporary_folder.name)
+        self.registry_file = self.cluster_instances_root_folder.joinpath(instance_registry_file_name)
+
+    def tearDown(self) -> None:
+        self.temporary_folder.cleanup()
+
+    def test_incomplete_legacy_file_left_untouched(self) -> None:
+        self.cluster_instances_root_folder.joinpath("broken").write_text("[Instance 1]\nname = a\nrole = worker\n")
+        self.cluster_instances_root_folder.joinpath("cluster").write_text("[Instance 1]\nprovider = AWS\n"
+                                                                          "name = cluster-master\nid = i-1\n")
+        instance_registry = InstanceRegistry(self.registry_file)
+        try:
+            self.assertEqual(migrate_legacy_instances_files(self.cluster_instances_root_folder, instance_registry),
+                             ["cluster"])
+            self.assertTrue(self.cluster_instances_root_folder.joinpath("broken").is_file())
+            self.assertEqual(instance_registry.get_instances("broken"), [])
+            self.assertEqual([instance_dict["role"] for instance_dict in instance_registry.get_instances("cluster")],
+                             ["master"])
+        finally:
+            instance_registry.close()
+
+    def test_concurrent_inserts(self) -> None:
+        # Threads Sharing One Registry and Registries Opened Separately (Like Other Processes) Insert Concurrently.
+        shared_instance_registry = InstanceRegistry(self.registry_file)
+        instance_registries = [shared_instance_registry] + [InstanceRegistry(self.registry_file) for _ in range(3)]
+
+        def insert_workers(instance_registry: InstanceRegistry,
+                           thread_number: int) -> None:
+            for worker_number in range(10):
+                instance_registry.insert_instances("cluster",
+                                                   [{"provider": "AWS",
+                                                     "name": "cluster-worker-{0}-{1}".format(thread_number,
+                                                                                             worker_number),
+                                                     "id": "i-{0}-{1}".format(thread_number, worker_number)}])
+
+        threads = [Thread(target=insert_workers, args=(instance_registries[thread_number % 4], thread_number))
+                   for thread_number in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            instances_list = shared_instance_registry.get_instances("cluster", role="worker")
+            self.assertEqual(len(instances_list), 160)
+            self.assertEqual(len({instance_dict["id"] for instance_dict in instances_list}), 160)
+        finally:
+            for instance_registry in instance_registries:
+                instance_registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import find_spec
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main, skipUnless
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+
+class LocalS3Handler(BaseHTTPRequestHandler):
+    # Local S3 Stand-In (Path-Style Requests): ListObjectsV2 (Paginated), HeadObject and GetObject.
+    objects = {}
+    max_keys = 2
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def get_bucket_and_key(self) -> tuple:
+        path = urlsplit(self.path).path
+        bucket_name, _, object_key = path.lstrip("/").partition("/")
+        return bucket_name, unquote(object_key)
+
+    def send_object_headers(self,
+                            body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "binary/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", "\"{0}\"".format(abs(hash(body))))
+        self.send_header("Last-Modified", formatdate(usegmt=True))
+        self.end_headers()
+
+    def do_HEAD(self) -> None:
+        bucket_name, object_key = self.get_bucket_and_key()
+        body = self.objects.get((bucket_name, object_key))
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_object_headers(body)
+
+    def do_GET(self) -> None:
+        bucket_name, object_key = self.get_bucket_and_key()
+        if object_key:
+            body = self.objects.get((bucket_name, object_key))
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_object_headers(body)
+            self.wfile.write(body)
+            return
+        query = parse_qs(urlsplit(self.path).query)
+        prefix = query.get("prefix", [""])[0]
+        start_after = query.get("continuation-token", [""])[0]
+        keys = sorted(key for bucket, key in self.objects if bucket == bucket_name and key.startswith(prefix))
+        keys = [key for key in keys if key > start_after]
+        page, is_truncated = keys[:self.max_keys], len(keys) > self.max_keys
+        contents = "".join("<Contents><Key>{0}</Key><Size>{1}</Size></Contents>"
+                           .format(escape(key), len(self.objects[(bucket_name, key)])) for key in page)
+        continuation = "<NextContinuationToken>{0}</NextContinuationToken>".format(quote(page[-1])) \
+            if is_truncated else ""
+        body = ("<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+                "<ListBucketResult xmlns=\"http://s3.amazonaws.com/doc/2006-03-01/\">"
+                "<Name>{0}</Name><Prefix>{1}</Prefix><KeyCount>{2}</KeyCount><MaxKeys>{3}</MaxKeys>"
+                "<IsTruncated>{4}</IsTruncated>{5}{6}</ListBucketResult>"
+                .format(bucket_name, escape(prefix), len(page), self.max_keys, str(is_truncated).lower(),
+                        continuation, contents)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@skipUnless(find_spec("boto3"), "boto3 is not installed")
+class S3ManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        LocalS3Handler.objects = {("logs", "spark/app-20240101000000-0000.zstd"): b"finished",
+                                  ("logs", "spark/eventlog_v2_app-20240101000000-0001/events_1_app"): b"one",
+                                  ("logs", "spark/eventlog_v2_app-20240101000000-0001/events_2_app"): b"two",
+                                  ("logs", "other/app-20240101000000-0002"): b"other"}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), LocalS3Handler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        for variable, value in [("AWS_ACCESS_KEY_ID", "test"), ("AWS_SECRET_ACCESS_KEY", "test")]:
+            environ.setdefault(variable, value)
+        from cloud_manager.s3_manager import S3Manager
+        endpoint_url = "http://127.0.0.1:{0}".format(self.server.server_address[1])
+        self.s3m = S3Manager(region_name="us-east-1", endpoint_url=endpoint_url)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_list_object_keys_follows_the_pagination(self) -> None:
+        self.assertEqual(self.s3m.list_object_keys("logs", "spark/"),
+                         ["spark/app-20240101000000-0000.zstd",
+                          "spark/eventlog_v2_app-20240101000000-0001/events_1_app",
+                          "spark/eventlog_v2_app-20240101000000-0001/events_2_app"])
+
+    def test_download_object(self) -> None:
+        with TemporaryDirectory() as temporary_folder:
+            local_file = Path(temporary_folder).joinpath("eventlog_v2_app-20240101000000-0001", "events_2_app")
+            self.s3m.download_object("logs", "spark/eventlog_v2_app-20240101000000-0001/events_2_app", local_file)
+            self.assertEqual(local_file.read_bytes(), b"two")
+
+
+@skipUnless(find_spec("boto3"), "boto3 is not installed")
+class SparkEventLogFetcherTests(TestCase):
+
+    def setUp(self) -> None:
+        # A Finished Plain Log, a Finished Rolling Log and a Running Application's Rolling Log.
+        LocalS3Handler.objects = {("logs", "spark/app-20240101000000-0000.zstd"): b"finished",
+                                  ("logs", "spark/app-20240101000000-0003.zstd.inprogress"): b"running",
+                                  ("logs", "spark/eventlog_v2_app-20240101000000-0001/events_1_app"): b"one",
+                                  ("logs", "spark/eventlog_v2_app-20240101000000-0001/appstatus_app"): b"",
+                                  ("logs", "spark/eventlog_v2_app-20240101000000-0002/events_1_app"): b"partial",
+                                  ("logs", "spark/eventlog_v2_app-20240101000000-0002/appstatus_app.inprogress"): b""}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), LocalS3Handler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        for variable, value in [("AWS_ACCESS_KEY_ID", "test"), ("AWS_SECRET_ACCESS_KEY", "test")]:
+            environ.setdefault(variable, value)
+        self.temporary_folder = TemporaryDirectory()
+        root_folder = Path(self.temporary_folder.name)
+        aws_config_file = root_folder.joinpath("aws_config")
+        aws_config_file.write_text("[default]\nregion = us-east-1\noutput = json\n", encoding="utf-8")
+        properties_file = root_folder.joinpath("spark_defaults.conf")
+        properties_file.write_text("spark.hadoop.fs.s3a.endpoint = http://127.0.0.1:{0}\n"
+                                   .format(self.server.server_address[1]), encoding="utf-8")
+        from fetch_event_logs import SparkEventLogFetcher
+        self.elf = SparkEventLogFetcher(root_folder.joinpath("sparking_cloud.cfg"))
+        self.elf.set_attribute("general_settings", {"cluster_instances_root_folder": str(root_folder)})
+        self.elf.set_attribute("aws_settings", {"config_file_path": aws_config_file})
+        self.elf.set_attribute("configuration_rules_settings", {"max_tries": 1,
+                                                                "time_between_retries_in_seconds": 0,
+                                                                "properties_file": str(properties_file),
+                                                                "spark_event_log_dir": "s3a://logs/spark/",
+                                                                "spark_event_log_folder": "/tmp/spark-events"})
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.temporary_folder.cleanup()
+
+    def test_running_applications_are_not_listed(self) -> None:
+        self.assertEqual(self.elf.list_remote_event_logs("cluster", None),
+                         ["app-20240101000000-0000.zstd", "eventlog_v2_app-20240101000000-0001"])
+        self.assertIsNone(self.elf.fetch_application_event_log("cluster", None, "app-20240101000000-0002"))
+
+    def test_fetch_rolling_event_log(self) -> None:
+        event_log_path = self.elf.fetch_application_event_log("cluster", None, "app-20240101000000-0001")
+        self.assertEqual(event_log_path.name, "eventlog_v2_app-20240101000000-0001")
+        self.assertEqual(event_log_path.joinpath("events_1_app").read_bytes(), b"one")
+
+
+if __name__ == "__main__":
+    main()
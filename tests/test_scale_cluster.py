@@ -0,0 +1,93 @@
+from http.server import ThreadingHTTPServer
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main, skipUnless
+from unittest.mock import patch
+from tests.test_autoscaler_util import load_autoscaling_settings
+from tests.test_spark_master_util import FakeMasterHandler
+from util.cluster_inventory_util import unload_cluster_inventory
+from util.instance_registry_util import load_instance_registry
+
+
+class FakeEC2Manager:
+    # Every Instance Is Running; Terminations Are Recorded.
+
+    def __init__(self) -> None:
+        self.terminated_ids = []
+
+    @staticmethod
+    def get_ec2_instance_from_id(instance_id: str) -> str:
+        return instance_id
+
+    @staticmethod
+    def is_ec2_instance_running(ec2_instance: str) -> bool:
+        return True
+
+    def terminate_ec2_instances_list(self,
+                                     instances_ids_list: list) -> None:
+        self.terminated_ids.extend(instances_ids_list)
+
+
+@skipUnless(find_spec("boto3"), "boto3 is not installed")
+class AutoscaleClusterTests(TestCase):
+
+    def setUp(self) -> None:
+        from scale_cluster import ClusterScaler
+        # A Master Without Any Registered Worker (Below the Minimum of 1 Worker).
+        FakeMasterHandler.statuses = [{"workers": [], "activeapps": []}]
+        FakeMasterHandler.requests_served = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeMasterHandler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.temporary_folder = TemporaryDirectory()
+        self.cluster_instances_root_folder = Path(self.temporary_folder.name)
+        self.instance_registry = load_instance_registry(self.cluster_instances_root_folder)
+        self.instance_registry.insert_instance("cluster", {"provider": "AWS", "name": "cluster-master", "id": "i-m",
+                                                           "public_ipv4_address": "127.0.0.1"})
+        self.ec2m = FakeEC2Manager()
+        self.cs = ClusterScaler(Path("sparking_cloud.cfg"))
+        self.cs.set_attribute("general_settings", {"cluster_instances_root_folder": self.cluster_instances_root_folder,
+                                                   "key_root_folder": self.cluster_instances_root_folder})
+        self.cs.set_attribute("instances_settings", {"AWS-workers": {}})
+        configuration_rules_settings = load_autoscaling_settings(autoscale_scale_out_cooldown_in_seconds=0)
+        configuration_rules_settings.update({"master_webui_port": self.server.server_address[1],
+                                             "autoscale_poll_interval_in_seconds": 0})
+        self.cs.set_attribute("configuration_rules_settings", configuration_rules_settings)
+        self.launches = 0
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        unload_cluster_inventory(self.cluster_instances_root_folder, "cluster")
+        self.temporary_folder.cleanup()
+
+    def launch_failing_worker(self,
+                              cluster_name: str,
+                              worker_instances_settings: str,
+                              number_of_new_worker_instances: int) -> tuple:
+        # Each Launched Worker Is Registered, Then Fails to Be Configured.
+        self.launches += 1
+        worker_dict = {"provider": "AWS", "name": "cluster-worker-{0}".format(self.launches),
+                       "id": "i-w{0}".format(self.launches), "role": "worker"}
+        self.instance_registry.insert_instance(cluster_name, worker_dict)
+        worker = self.cs.get_cluster_inventory(cluster_name).add_instance(worker_dict)
+        return [], {worker: RuntimeError("configuration failed")}
+
+    def test_failed_scale_out_keeps_polling(self) -> None:
+        with patch.object(self.cs, "get_ec2_manager", return_value=self.ec2m), \
+                patch.object(self.cs, "launch_and_configure_workers", side_effect=self.launch_failing_worker), \
+                patch("scale_cluster.sleep", side_effect=[None, KeyboardInterrupt]):
+            # Ctrl+C (Simulated) After the Second Poll.
+            with self.assertRaises(KeyboardInterrupt):
+                self.cs.autoscale_cluster("cluster", "AWS-workers")
+        # The First Failure Did Not End the Loop, and Each Failed Worker Was Terminated and Deregistered.
+        self.assertEqual(self.launches, 2)
+        self.assertEqual(FakeMasterHandler.requests_served, 2)
+        self.assertEqual(self.ec2m.terminated_ids, ["i-w1", "i-w2"])
+        self.assertEqual(self.instance_registry.get_instances("cluster", role="worker"), [])
+        self.assertEqual(self.cs.get_cluster_inventory("cluster").get_workers(), [])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from socket import socket
+from threading import Thread
+from unittest import TestCase, main
+from util.spark_master_util import get_missing_workers, wait_for_spark_workers_registration
+
+
+def load_worker(host: str,
+                cores: int = 4,
+                memory: int = 8192,
+                state: str = "ALIVE") -> dict:
+    return {"host": host,
+            "webuiaddress": "http://{0}:8081".format(host),
+            "state": state,
+            "cores": cores,
+            "memory": memory}
+
+
+class FakeMasterHandler(BaseHTTPRequestHandler):
+    # Local Stand-In for the Master's Web UI: Serves the Next Status of the Sequence (the Last One Repeats).
+    statuses = []
+    requests_served = 0
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path != "/json/":
+            self.send_response(404)
+            self.end_headers()
+            return
+        status_index = min(FakeMasterHandler.requests_served, len(self.statuses) - 1)
+        FakeMasterHandler.requests_served += 1
+        body = dumps(self.statuses[status_index]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class WorkersRegistrationTests(TestCase):
+
+    expected_workers = {"cluster-worker-1": ["10.0.0.1", "54.0.0.1"],
+                        "cluster-worker-2": ["10.0.0.2", "54.0.0.2"]}
+
+    def setUp(self) -> None:
+        FakeMasterHandler.requests_served = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeMasterHandler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def wait_for_registration(self,
+                              timeout_in_seconds: float) -> tuple:
+        return wait_for_spark_workers_registration(master_address="127.0.0.1",
+                                                   master_webui_port=self.server.server_address[1],
+                                                   expected_workers=self.expected_workers,
+                                                   expected_cores=8,
+                                                   expected_memory_in_mb=16384,
+                                                   timeout_in_seconds=timeout_in_seconds,
+                                                   poll_interval_in_seconds=0.01)
+
+    def test_get_missing_workers(self) -> None:
+        master_status = {"workers": [load_worker("10.0.0.1"), load_worker("10.0.0.2", state="DEAD")]}
+        self.assertEqual(get_missing_workers(master_status, self.expected_workers), ["cluster-worker-2"])
+
+    def test_workers_registered(self) -> None:
+        # The Second Worker Registers on the Third Poll.
+        FakeMasterHandler.statuses = [{"workers": []},
+                                      {"workers": [load_worker("10.0.0.1")]},
+                                      {"workers": [load_worker("10.0.0.1"), load_worker("10.0.0.2")]}]
+        registered, master_status, missing_workers = self.wait_for_registration(timeout_in_seconds=5)
+        self.assertTrue(registered)
+        self.assertEqual(missing_workers, [])
+        self.assertEqual(FakeMasterHandler.requests_served, 3)
+
+    def test_worker_missing_at_the_timeout(self) -> None:
+        FakeMasterHandler.statuses = [{"workers": [load_worker("10.0.0.1")]}]
+        registered, master_status, missing_workers = self.wait_for_registration(timeout_in_seconds=0.2)
+        self.assertFalse(registered)
+        self.assertEqual(missing_workers, ["cluster-worker-2"])
+        self.assertEqual(len(master_status["workers"]), 1)
+
+    def test_resources_short_at_the_timeout(self) -> None:
+        # Both Workers Registered, but Offering Fewer Cores Than Expected.
+        FakeMasterHandler.statuses = [{"workers": [load_worker("10.0.0.1", cores=2), load_worker("10.0.0.2")]}]
+        registered, _, missing_workers = self.wait_for_registration(timeout_in_seconds=0.2)
+        self.assertFalse(registered)
+        self.assertEqual(missing_workers, [])
+
+    def test_unreachable_master_times_out(self) -> None:
+        # Nothing Listens on a Port Once Its Socket Is Closed.
+        with socket() as closed_socket:
+            closed_socket.bind(("127.0.0.1", 0))
+            closed_port = closed_socket.getsockname()[1]
+        registered, master_status, missing_workers = \
+            wait_for_spark_workers_registration(master_address="127.0.0.1",
+                                                master_webui_port=closed_port,
+                                                expected_workers=self.expected_workers,
+                                                expected_cores=8,
+                                                expected_memory_in_mb=16384,
+                                                timeout_in_seconds=0.2,
+                                                poll_interval_in_seconds=0.01)
+        self.assertFalse(registered)
+        self.assertEqual(master_status, {})
+        self.assertEqual(missing_workers, ["cluster-worker-1", "cluster-worker-2"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from util.spark_master_util import get_alive_workers
+
+
+def observe_master_status(master_status: dict,
+                          launched_workers: int = 0) -> dict:
+    # Summarize the Master's Status Into the Autoscaler's Inputs.
+    # Launched Workers (From the Cluster's Inventory) Not Yet Registered With the Master Are Pending.
+    alive_workers = get_alive_workers(master_status)
+    total_cores = sum(worker.get("cores", 0) for worker in alive_workers)
+    used_cores = sum(worker.get("coresused", 0) for worker in alive_workers)
+    waiting_applications = [application for application in master_status.get("activeapps", [])
+                            if application.get("state") == "WAITING"]
+    return {"alive_workers": len(alive_workers),
+            "pending_workers": max(launched_workers - len(alive_workers), 0),
+            "total_cores": total_cores,
+            "used_cores": used_cores,
+            "utilization": used_cores / total_cores if total_cores else 0.0,
+            "waiting_applications": len(waiting_applications),
+            "active_applications": len(master_status.get("activeapps", [])),
+            "idle_workers": [worker for worker in alive_workers if worker.get("coresused", 0) == 0]}
+
+
+def load_autoscaler_state() -> dict:
+    return {"consecutive_high_observations": 0,
+            "consecutive_low_observations": 0,
+            "last_scale_out_time": None,
+            "last_scale_in_time": None}
+
+
+def decide_scaling_action(observation: dict,
+                          autoscaler_state: dict,
+                          autoscaling_settings: dict,
+                          now: float) -> tuple:
+    # Decide Whether to Scale the Worker Pool Out, In or Not at All (No Side Effects).
+    # Hysteresis: The Load Must Stay Beyond a Threshold for Consecutive Observations Before Acting.
+    # Cooldowns: Scaling Out (In) Waits After Any Previous Scaling Out (Any Scaling Action).
+    # Bounds: Pending Workers (Launched, Not Yet Registered) Count Against the Maximum.
+    # Scale In: Only Idle Workers, and, With the External Shuffle Service, Only Without Active Applications (Their
+    # Shuffle Files Outlive the Executors on Otherwise Idle Workers).
+    # Returns the Action ('out', 'in' or None), the Number of Workers, the Reason and the New State.
+    min_workers = autoscaling_settings["autoscale_min_workers"]
+    max_workers = autoscaling_settings["autoscale_max_workers"]
+    sustained_observations = autoscaling_settings["autoscale_sustained_observations"]
+    new_state = dict(autoscaler_state)
+    alive_workers = observation["alive_workers"]
+    launched_workers = alive_workers + observation.get("pending_workers", 0)
+    high_load = observation["waiting_applications"] > 0 \
+        or observation["utilization"] >= autoscaling_settings["autoscale_scale_out_utilization"]
+    low_load = observation["waiting_applications"] == 0 \
+        and observation["utilization"] <= autoscaling_settings["autoscale_scale_in_utilization"]
+    new_state["consecutive_high_observations"] = autoscaler_state["consecutive_high_observations"] + 1 \
+        if high_load else 0
+    new_state["consecutive_low_observations"] = autoscaler_state["consecutive_low_observations"] + 1 \
+        if low_load else 0
+    # Seconds Since the Last Scaling Out and Since the Last Scaling Action (Infinite If Never).
+    scaling_times = [autoscaler_state["last_scale_out_time"], autoscaler_state["last_scale_in_time"]]
+    elapsed_since_scale_out = float("inf") if scaling_times[0] is None else now - scaling_times[0]
+    elapsed_since_scaling = min([now - scaling_time for scaling_time in scaling_times if scaling_time is not None],
+                                default=float("inf"))
+    scale_out_cooling_down = elapsed_since_scale_out < autoscaling_settings["autoscale_scale_out_cooldown_in_seconds"]
+    # Keep the Pool Within Bounds Regardless of the Load (Workers That Fail to Register Are Not Replaced Beyond
+    # the Maximum, and Not Before the Scaling Out Cooldown).
+    if alive_workers < min_workers:
+        if launched_workers >= max_workers:
+            return None, 0, "below the minimum of {0} worker(s), but {1} worker(s) were already launched" \
+                .format(min_workers, launched_workers), new_state
+        if scale_out_cooling_down:
+            return None, 0, "below the minimum of {0} worker(s), but scaling out is cooling down" \
+                .format(min_workers), new_state
+        new_state["last_scale_out_time"] = now
+        return "out", min(min_workers - alive_workers, max_workers - launched_workers), \
+            "below the minimum of {0} worker(s)".format(min_workers), new_state
+    if new_state["consecutive_high_observations"] >= sustained_observations and launched_workers < max_workers:
+        if scale_out_cooling_down:
+            return None, 0, "high load, but scaling out is cooling down", new_state
+        number_of_workers = min(autoscaling_settings["autoscale_scale_out_step"], max_workers - launched_workers)
+        new_state["consecutive_high_observations"] = 0
+        new_state["last_scale_out_time"] = now
+        return "out", number_of_workers, "{0:.0%} of the cores used, {1} waiting application(s)" \
+            .format(observation["utilization"], observation["waiting_applications"]), new_state
+    if new_state["consecutive_low_observations"] >= sustained_observations and alive_workers > min_workers:
+        if elapsed_since_scaling < autoscaling_settings["autoscale_scale_in_cooldown_in_seconds"]:
+            return None, 0, "low load, but scaling in is cooling down", new_state
+        if autoscaling_settings["enable_external_shuffle_service"] and observation["active_applications"] > 0:
+            return None, 0, "low load, but {0} active application(s) may hold shuffle files on idle workers" \
+                .format(observation["active_applications"]), new_state
+        # Only Idle Workers Are Removed.
+        number_of_workers = min(autoscaling_settings["autoscale_scale_in_step"],
+                                alive_workers - min_workers,
+                                len(observation["idle_workers"]))
+        if number_of_workers == 0:
+            return None, 0, "low load, but no idle worker to remove", new_state
+        new_state["consecutive_low_observations"] = 0
+        new_state["last_scale_in_time"] = now
+        return "in", number_of_workers, "{0:.0%} of the cores used, {1} idle worker(s)" \
+            .format(observation["utilization"], len(observation["idle_workers"])), new_state
+    return None, 0, "{0:.0%} of the cores used, {1} waiting application(s)" \
+        .format(observation["utilization"], observation["waiting_applications"]), new_state
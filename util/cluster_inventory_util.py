@@ -0,0 +1,212 @@
+from logging import Logger
+from os import listdir
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional
+from util.instance_registry_util import load_instance_registry
+from util.logging_util import log_message
+
+# Instance States Recorded Once an Instance Is Gone (Kept in the Registry for the Summaries).
+ended_instance_states = ["shutting-down", "terminated", "deleted_entry"]
+
+
+class InstanceRecord:
+
+    __slots__ = ("provider", "name", "id", "role", "type", "market_type", "key_name", "username",
+                 "public_ipv4_address", "ssh_port", "state", "private_ipv4_address", "private_dns_name", "key_file",
+                 "facts")
+
+    def __init__(self,
+                 instance_dict: dict,
+                 key_file: Optional[Path]) -> None:
+        self.provider = instance_dict["provider"]
+        self.name = instance_dict["name"]
+        self.id = str(instance_dict["id"])
+        self.role = instance_dict["role"]
+        self.type = instance_dict.get("type")
+        self.market_type = instance_dict.get("market_type")
+        self.key_name = instance_dict.get("key_name")
+        self.username = instance_dict.get("username")
+        self.public_ipv4_address = instance_dict.get("public_ipv4_address")
+        self.ssh_port = instance_dict.get("ssh_port")
+        self.state = instance_dict.get("state", "running")
+        self.private_ipv4_address = instance_dict.get("private_ipv4_address")
+        self.private_dns_name = instance_dict.get("private_dns_name")
+        self.key_file = key_file
+        self.facts = instance_dict.get("facts")
+
+    def get_cluster_address(self) -> str:
+        # Intra-Cluster Traffic Uses the Private Address (Instances Registered Before It Was Recorded Use the Public).
+        return self.private_ipv4_address or self.public_ipv4_address
+
+    def get_addresses(self) -> list:
+        return [address for address in [self.public_ipv4_address, self.private_ipv4_address, self.private_dns_name]
+                if address]
+
+    def to_dict(self) -> dict:
+        return {attribute_name: getattr(self, attribute_name) for attribute_name in self.__slots__}
+
+
+class ClusterInventory:
+
+    def __init__(self,
+                 cluster_name: str,
+                 key_root_folder: Path) -> None:
+        self.cluster_name = cluster_name
+        self.key_root_folder = key_root_folder
+        self.inventory_lock = Lock()
+        # Instances (In Registration Order) and Their Indexes.
+        self.instances = []
+        self.instances_by_id = {}
+        self.instances_by_role = {}
+        self.instances_by_provider = {}
+        self.instances_by_state = {}
+        # Key Files Resolved Once Per Key Name (Single Listing of the Key Root Folder).
+        self.key_files = {}
+        self.key_root_folder_file_names = None
+
+    def resolve_key_file(self,
+                         key_name: str) -> Optional[Path]:
+        if not key_name:
+            return None
+        if key_name not in self.key_files:
+            if self.key_root_folder_file_names is None:
+                key_root_folder = Path(self.key_root_folder)
+                self.key_root_folder_file_names = listdir(key_root_folder) if key_root_folder.is_dir() else []
+            key_file = None
+            for file_name in self.key_root_folder_file_names:
+                if file_name.startswith(key_name):
+                    key_file = Path(self.key_root_folder).joinpath(file_name)
+                    break
+            self.key_files[key_name] = key_file
+        return self.key_files[key_name]
+
+    @staticmethod
+    def index_instance(index: dict,
+                       index_key: Any,
+                       instance: InstanceRecord) -> None:
+        if index_key not in index:
+            index[index_key] = []
+        index[index_key].append(instance)
+
+    def add_instance(self,
+                     instance_dict: dict) -> InstanceRecord:
+        with self.inventory_lock:
+            instance_id = str(instance_dict["id"])
+            if instance_id not in self.instances_by_id:
+                key_file = self.resolve_key_file(instance_dict.get("key_name"))
+                instance = InstanceRecord(instance_dict, key_file)
+                self.instances.append(instance)
+                self.instances_by_id[instance_id] = instance
+                self.index_instance(self.instances_by_role, instance.role, instance)
+                self.index_instance(self.instances_by_provider, instance.provider, instance)
+                self.index_instance(self.instances_by_state, instance.state, instance)
+            return self.instances_by_id[instance_id]
+
+    def remove_instance(self,
+                        instance_id: str) -> None:
+        with self.inventory_lock:
+            instance = self.instances_by_id.pop(str(instance_id), None)
+            if instance is not None:
+                self.instances.remove(instance)
+                self.instances_by_role[instance.role].remove(instance)
+                self.instances_by_provider[instance.provider].remove(instance)
+                self.instances_by_state[instance.state].remove(instance)
+
+    def refresh_states(self,
+                       instance_dicts: list) -> None:
+        # The Registry Records State Changes (Stop, Start, Termination) Made After the Inventory Was Built:
+        # Re-Index the Known Instances Whose State Changed.
+        with self.inventory_lock:
+            for instance_dict in instance_dicts:
+                instance = self.instances_by_id.get(str(instance_dict["id"]))
+                state = instance_dict.get("state", "running")
+                if instance is not None and instance.state != state:
+                    self.instances_by_state[instance.state].remove(instance)
+                    instance.state = state
+                    self.index_instance(self.instances_by_state, instance.state, instance)
+
+    def get_instance(self,
+                     instance_id: str) -> Optional[InstanceRecord]:
+        return self.instances_by_id.get(str(instance_id))
+
+    def get_instances(self,
+                      role: str = None,
+                      provider: str = None,
+                      state: str = None) -> list:
+        # Start From the Smallest Selected Index and Filter the Remaining Criteria.
+        candidate_lists = [self.instances]
+        if role is not None:
+            candidate_lists.append(self.instances_by_role.get(role, []))
+        if provider is not None:
+            candidate_lists.append(self.instances_by_provider.get(provider, []))
+        if state is not None:
+            candidate_lists.append(self.instances_by_state.get(state, []))
+        candidates = min(candidate_lists, key=len)
+        return [instance for instance in candidates
+                if (role is None or instance.role == role)
+                and (provider is None or instance.provider == provider)
+                and (state is None or instance.state == state)]
+
+    def get_masters(self) -> list:
+        return self.get_instances(role="master")
+
+    def get_workers(self) -> list:
+        return self.get_instances(role="worker")
+
+    def check_key_files(self,
+                        logger: Logger) -> None:
+        check_instances_key_files(self.instances,
+                                  self.key_root_folder,
+                                  logger)
+
+    def get_first_running_master(self,
+                                 ec2m: Any) -> Optional[InstanceRecord]:
+        for instance in self.get_masters():
+            if instance.provider == "AWS" and ec2m:
+                ec2_instance = ec2m.get_ec2_instance_from_id(instance.id)
+                if ec2m.is_ec2_instance_running(ec2_instance):
+                    return instance
+        return None
+
+
+def check_instances_key_files(instances_list: list,
+                              key_root_folder: Path,
+                              logger: Logger) -> None:
+    for instance in instances_list:
+        if instance.key_file is None:
+            message = "The key '{0}' of instance '{1}' could not be found in the '{2}' folder!" \
+                .format(instance.key_name,
+                        instance.name,
+                        key_root_folder)
+            log_message(logger, message, "INFO")
+            raise FileNotFoundError(message)
+
+
+# ClusterInventory Objects Pool (One Per Cluster, Shared Across Tasks and Stages).
+cluster_inventories_pool = {}
+cluster_inventories_pool_lock = Lock()
+
+
+def load_cluster_inventory(cluster_instances_root_folder: Path,
+                           key_root_folder: Path,
+                           cluster_name: str) -> ClusterInventory:
+    with cluster_inventories_pool_lock:
+        cluster_inventory_key = (str(cluster_instances_root_folder), cluster_name)
+        instance_registry = load_instance_registry(cluster_instances_root_folder)
+        instance_dicts = instance_registry.get_instances(cluster_name)
+        if cluster_inventory_key not in cluster_inventories_pool:
+            cluster_inventory = ClusterInventory(cluster_name, key_root_folder)
+            for instance_dict in instance_dicts:
+                cluster_inventory.add_instance(instance_dict)
+            cluster_inventories_pool[cluster_inventory_key] = cluster_inventory
+        else:
+            # Hand Out the Pooled Inventory With Its States Synchronized to the Registry.
+            cluster_inventories_pool[cluster_inventory_key].refresh_states(instance_dicts)
+        return cluster_inventories_pool[cluster_inventory_key]
+
+
+def unload_cluster_inventory(cluster_instances_root_folder: Path,
+                             cluster_name: str) -> None:
+    with cluster_inventories_pool_lock:
+        cluster_inventories_pool.pop((str(cluster_instances_root_folder), cluster_name), None)
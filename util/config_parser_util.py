@@ -1,54 +1,99 @@
 from configparser import ConfigParser
-from re import findall
+from re import compile
+from typing import Any, Callable
 
+# Compiled Value Patterns.
+boolean_true_pattern = compile(r"^(?:True|Yes)$")
+boolean_false_pattern = compile(r"^(?:False|No)$")
+integer_pattern = compile(r"^[+-]?\d+$")
+float_pattern = compile(r"^[+-]?(?:\d+\.?\d*|\.\d+)$")
+list_pattern = compile(r"^\[(.*)]$")
+list_separator_pattern = compile(r"\s*,\s*")
 
-def parse_config_section(config_parser: ConfigParser,
-                         section_name: str) -> dict:
-    parsed_section = {key: value for key, value in config_parser[section_name].items()}
-    for key, value in parsed_section.items():
+# Marker of Settings Without Default Value (Must Be Present in the Config Section).
+REQUIRED = object()
+
+
+def parse_string(value: str) -> str:
+    return value
+
+
+def parse_boolean(value: str) -> bool:
+    if boolean_true_pattern.match(value):
+        return True
+    if boolean_false_pattern.match(value):
+        return False
+    raise ValueError("expected a boolean (True, Yes, False, No), got '{0}'".format(value))
+
+
+def parse_integer(value: str) -> int:
+    if integer_pattern.match(value):
+        return int(value)
+    raise ValueError("expected an integer, got '{0}'".format(value))
+
+
+def parse_float(value: str) -> float:
+    if float_pattern.match(value):
+        return float(value)
+    raise ValueError("expected a number, got '{0}'".format(value))
+
+
+def parse_string_list(value: str) -> list:
+    match_list = list_pattern.match(value.strip())
+    if not match_list:
+        raise ValueError("expected a list (e.g., [item1, item2]), got '{0}'".format(value))
+    items = match_list.groups()[0].strip()
+    return list_separator_pattern.split(items) if items else []
+
+
+def parse_choice(choices: list) -> Callable:
+    def parse_choice_value(value: str) -> str:
+        if value in choices:
+            return value
+        raise ValueError("expected one of {0}, got '{1}'".format(choices, value))
+    return parse_choice_value
+
+
+def parse_integer_or_literal(literal: str) -> Callable:
+    def parse_integer_or_literal_value(value: str) -> Any:
+        if value == literal:
+            return value
+        if integer_pattern.match(value):
+            return int(value)
+        raise ValueError("expected an integer or '{0}', got '{1}'".format(literal, value))
+    return parse_integer_or_literal_value
+
+
+def parse_optional(parser: Callable) -> Callable:
+    def parse_optional_value(value: str) -> Any:
         if value == "None":
-            parsed_section[key] = None
-        elif value in ["True", "Yes"]:
-            parsed_section[key] = True
-        elif value in ["False", "No"]:
-            parsed_section[key] = False
-        elif value.isdigit():
-            parsed_section[key] = int(value)
-        elif value.replace(".", "", 1).isdigit():
-            parsed_section[key] = float(value)
-        elif not findall(r"%\(.*?\)s+", value) and findall(r"\[.*?]+", value):
-            aux_list = value.replace("[", "").replace("]", "").replace(" ", "").split(",")
-            for index, item in enumerate(aux_list):
-                if item.isdigit():
-                    aux_list[index] = int(item)
-                elif item.replace(".", "", 1).isdigit():
-                    aux_list[index] = float(item)
-            parsed_section[key] = aux_list
-        elif not findall(r"%\(.*?\)s+", value) and findall(r"\(.*?\)+", value):
-            aux_list = value.replace("(", "").replace(")", "").replace(" ", "").split(",")
-            for index, item in enumerate(aux_list):
-                if item.isdigit():
-                    aux_list[index] = int(item)
-                elif item.replace(".", "", 1).isdigit():
-                    aux_list[index] = float(item)
-            parsed_section[key] = tuple(aux_list)
-        elif not findall(r"%\(.*?\)s+", value) and findall(r"\{.*?}+", value):
-            aux_dict = {}
-            aux_list = value.replace("{", "").replace("}", "").replace(" ", "").split(",")
-            for item in aux_list:
-                pair_item = item.split(":")
-                pair_key = pair_item[0]
-                pair_value = pair_item[1]
-                if pair_value == "None":
-                    pair_value = None
-                elif pair_value in ["True", "Yes"]:
-                    pair_value = True
-                elif pair_value in ["False", "No"]:
-                    pair_value = False
-                elif pair_value.isdigit():
-                    pair_value = int(value)
-                elif pair_value.replace(".", "", 1).isdigit():
-                    pair_value = float(value)
-                aux_dict.update({pair_key: pair_value})
-            parsed_section[key] = aux_dict
+            return None
+        return parser(value)
+    return parse_optional_value
+
+
+def parse_config_section(config_parser: ConfigParser,
+                         section_name: str,
+                         section_schema: dict,
+                         errors_list: list) -> dict:
+    # Parse the Section's Settings Through the Schema's Parsers, Collecting Every Error Found.
+    parsed_section = {}
+    if not config_parser.has_section(section_name):
+        errors_list.append("[{0}] section is missing".format(section_name))
+        return parsed_section
+    section = config_parser[section_name]
+    for key, (parser, default) in section_schema.items():
+        if key not in section:
+            if default is REQUIRED:
+                errors_list.append("[{0}] '{1}' is required".format(section_name, key))
+            else:
+                parsed_section[key] = default
+            continue
+        try:
+            parsed_section[key] = parser(section[key].strip())
+        except ValueError as value_error:
+            errors_list.append("[{0}] '{1}': {2}".format(section_name, key, value_error))
+    for key in section:
+        if key not in section_schema:
+            errors_list.append("[{0}] '{1}' is not a known setting".format(section_name, key))
     return parsed_section
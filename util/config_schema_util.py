@@ -0,0 +1,143 @@
+from util.config_parser_util import REQUIRED, parse_boolean, parse_choice, parse_float, parse_integer, \
+    parse_integer_or_literal, parse_string, parse_string_list
+
+# Sparking Cloud's Config File Schema (Setting: (Parser, Default Value)).
+# Bump the version whenever a schema changes, so previously cached settings are discarded.
+config_schema_version = 14
+
+general_settings_schema = {
+    "enable_logging": (parse_boolean, REQUIRED),
+    "cluster_names": (parse_string_list, REQUIRED),
+    "cluster_instances_root_folder": (parse_string, REQUIRED),
+    "key_root_folder": (parse_string, REQUIRED),
+    "cloud_provider_names": (parse_string_list, REQUIRED),
+    "configuration_rules": (parse_string, REQUIRED)
+}
+
+logging_settings_schema = {
+    "log_to_file": (parse_boolean, REQUIRED),
+    "log_to_console": (parse_boolean, REQUIRED),
+    "file_name": (parse_string, REQUIRED),
+    "file_mode": (parse_choice(["a", "w"]), "a"),
+    "encoding": (parse_string, "utf-8"),
+    "level": (parse_choice(["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]), REQUIRED),
+    "format": (parse_string, REQUIRED),
+    "date_format": (parse_string, REQUIRED)
+}
+
+aws_settings_schema = {
+    "config_file_path": (parse_string, REQUIRED),
+    "credentials_file_path": (parse_string, REQUIRED),
+    "service": (parse_string, "ec2")
+}
+
+cluster_settings_schema = {
+    "master_instances_settings": (parse_string_list, REQUIRED),
+    "worker_instances_settings": (parse_string_list, REQUIRED)
+}
+
+instances_settings_schema = {
+    "number_of_master_instances": (parse_integer, 0),
+    "number_of_worker_instances": (parse_integer, 0),
+    "ami_id": (parse_string, REQUIRED),
+    "operating_system": (parse_string, REQUIRED),
+    "username": (parse_string, REQUIRED),
+    "ssh_port": (parse_integer, 22),
+    "type": (parse_string, REQUIRED),
+    "key_name": (parse_string, REQUIRED),
+    "security_group_ids": (parse_string_list, REQUIRED),
+    "prefix_name": (parse_string, REQUIRED),
+    "market_type": (parse_choice(["spot", "on-demand"]), REQUIRED),
+    "spot_max_price": (parse_string, "Current_EC2_Spot_Instance_Price"),
+    "spot_type": (parse_choice(["one-time", "persistent"]), "one-time"),
+    "spot_interruption_behavior": (parse_choice(["hibernate", "stop", "terminate"]), "terminate"),
+    "placement": (parse_string, REQUIRED),
+    "placement_strategy": (parse_choice(["none", "cluster", "spread", "partition"]), "none"),
+    "placement_partition_count": (parse_integer, 2),
+    "subnet_id": (parse_string, REQUIRED)
+}
+
+configuration_rules_settings_schema = {
+    "max_tries": (parse_integer, REQUIRED),
+    "time_between_retries_in_seconds": (parse_integer, REQUIRED),
+    "verbose_scripts": (parse_boolean, False),
+    "store_remote_host_public_key_to_guest_known_hosts": (parse_boolean, True),
+    "store_remote_host_public_key_script_file": (parse_string, REQUIRED),
+    "key_types": (parse_string, "ecdsa"),
+    "known_hosts_file": (parse_string, "~/.ssh/known_hosts"),
+    "gather_node_facts_script_file": (parse_string, "script/gather_node_facts.sh"),
+    "install_hadoop": (parse_boolean, REQUIRED),
+    "hadoop_setup_on_master_script_file": (parse_string, REQUIRED),
+    "hadoop_setup_on_worker_script_file": (parse_string, REQUIRED),
+    "hadoop_version": (parse_string, REQUIRED),
+    "install_spark": (parse_boolean, REQUIRED),
+    "spark_setup_on_master_script_file": (parse_string, REQUIRED),
+    "spark_setup_on_worker_script_file": (parse_string, REQUIRED),
+    "spark_version": (parse_string, REQUIRED),
+    "master_port": (parse_integer, 7077),
+    "master_webui_port": (parse_integer, 8080),
+    "worker_cores": (parse_integer_or_literal("maximum"), "maximum"),
+    "worker_memory": (parse_integer_or_literal("maximum"), "maximum"),
+    "worker_memory_unit": (parse_choice(["KB", "MB", "GB", "TB"]), "KB"),
+    "worker_port": (parse_integer, 7078),
+    "worker_webui_port": (parse_integer, 8081),
+    "enable_external_shuffle_service": (parse_boolean, True),
+    "shuffle_service_port": (parse_integer, 7337),
+    "configure_local_storage": (parse_boolean, True),
+    "local_storage_mount_point": (parse_string, "/mnt/spark_local_storage"),
+    "local_storage_filesystem": (parse_choice(["ext4", "xfs"]), "ext4"),
+    "worker_registration_timeout_in_seconds": (parse_integer, 120),
+    "worker_registration_poll_interval_in_seconds": (parse_integer, 2),
+    "autoscale_min_workers": (parse_integer, 1),
+    "autoscale_max_workers": (parse_integer, 10),
+    "autoscale_scale_out_utilization": (parse_float, 0.8),
+    "autoscale_scale_in_utilization": (parse_float, 0.3),
+    "autoscale_sustained_observations": (parse_integer, 3),
+    "autoscale_scale_out_step": (parse_integer, 1),
+    "autoscale_scale_in_step": (parse_integer, 1),
+    "autoscale_scale_out_cooldown_in_seconds": (parse_integer, 300),
+    "autoscale_scale_in_cooldown_in_seconds": (parse_integer, 600),
+    "autoscale_poll_interval_in_seconds": (parse_integer, 30),
+    "tune_spark_properties": (parse_boolean, True),
+    "reserved_cores_per_worker": (parse_integer, 1),
+    "reserved_memory_fraction": (parse_float, 0.1),
+    "min_reserved_memory_in_mb": (parse_integer, 1024),
+    "max_executor_cores": (parse_integer, 5),
+    "executor_memory_overhead_fraction": (parse_float, 0.1),
+    "parallelism_per_core": (parse_integer, 2),
+    "enable_dynamic_allocation": (parse_boolean, True),
+    "dynamic_allocation_idle_timeout_in_seconds": (parse_integer, 60),
+    "dynamic_allocation_cached_idle_timeout_in_seconds": (parse_integer, 600),
+    "tune_s3a_properties": (parse_boolean, True),
+    "s3a_committer": (parse_choice(["magic", "directory"]), "magic"),
+    "s3a_fast_upload_buffer": (parse_choice(["disk", "bytebuffer"]), "disk"),
+    "s3a_multipart_size": (parse_string, "128M"),
+    "s3a_threads_per_executor_core": (parse_integer, 8),
+    "s3a_input_fadvise": (parse_choice(["normal", "sequential", "random"]), "normal"),
+    "s3a_readahead_range": (parse_string, "1M"),
+    "properties_file": (parse_string, REQUIRED),
+    "pool_properties_file": (parse_string, REQUIRED),
+    "application_folder": (parse_string, REQUIRED),
+    "application_entry_point": (parse_string, REQUIRED),
+    "application_arguments": (parse_string, ""),
+    "job_wait_timeout_in_seconds": (parse_integer, 0),
+    "job_status_poll_interval_in_seconds": (parse_integer, 10),
+    "job_queue_max_concurrent_jobs": (parse_integer, 4),
+    "job_queue_default_pool": (parse_string, "fair_pool"),
+    "job_queue_default_cores_max": (parse_integer, 0),
+    "collect_job_metrics": (parse_boolean, True),
+    "spark_event_log_folder": (parse_string, "/tmp/spark-events"),
+    "enable_event_logging": (parse_boolean, True),
+    "spark_event_log_dir": (parse_string, ""),
+    "event_log_compression_codec": (parse_choice(["none", "lz4", "lzf", "snappy", "zstd"]), "zstd"),
+    "event_log_rolling": (parse_boolean, False),
+    "event_log_rolling_max_file_size": (parse_string, "128m"),
+    "start_history_server": (parse_boolean, True),
+    "history_server_webui_port": (parse_integer, 18080),
+    "stage_dependency_jars": (parse_boolean, True),
+    "dependency_jars_packages": (parse_string_list, []),
+    "dependency_jars_repository": (parse_string, "https://repo1.maven.org/maven2"),
+    "dependency_jars_folder": (parse_string, "/opt/spark_dependency_jars"),
+    "send_local_input_folder": (parse_boolean, False),
+    "input_folder": (parse_string, "")
+}
@@ -0,0 +1,110 @@
+from threading import Lock
+from urllib.request import urlopen
+
+# Dependency Jars Staging Script: Downloads Each Jar Into the Shared Folder, Unless Already There (Same SHA-1).
+# Nodes Download From the Repository Themselves (In-Region), Instead of Being Uploaded From the Operator's Host.
+dependency_jars_staging_script_template = """\
+set -e
+jars_folder="{dependency_jars_folder}"
+sudo mkdir -p "$jars_folder"
+sudo chown "$(id -u):$(id -g)" "$jars_folder"
+stage_jar() {{
+  jar_file="$jars_folder/$1"
+  if [ -f "$jar_file" ] && [ -z "$3" -o "$(sha1sum "$jar_file" | cut -d ' ' -f 1)" = "$3" ]; then return 0; fi
+  wget -q -O "$jar_file.tmp" "$2" || return 1
+  if [ -n "$3" ] && [ "$(sha1sum "$jar_file.tmp" | cut -d ' ' -f 1)" != "$3" ]; then
+    rm -f "$jar_file.tmp"
+    echo "Checksum mismatch: $1" >&2
+    return 1
+  fi
+  mv "$jar_file.tmp" "$jar_file"
+}}
+{stage_jar_commands}
+"""
+
+
+def parse_maven_coordinate(coordinate: str) -> tuple:
+    # 'group:artifact:version' (As in 'spark.jars.packages').
+    coordinate_parts = coordinate.strip().split(":")
+    if len(coordinate_parts) != 3 or not all(coordinate_parts):
+        message = "Invalid Maven coordinate '{0}'! Expected 'group:artifact:version'.".format(coordinate)
+        raise ValueError(message)
+    return tuple(coordinate_parts)
+
+
+def get_dependency_jars_coordinates(configuration_rules_settings: dict,
+                                    spark_properties: dict) -> list:
+    # The Configured Coordinates, Plus the Ones the Properties File Would Have Resolved at Every Submit.
+    coordinates = list(configuration_rules_settings["dependency_jars_packages"])
+    spark_jars_packages = spark_properties.get("spark.jars.packages", "")
+    coordinates.extend(coordinate.strip() for coordinate in spark_jars_packages.split(",")
+                       if coordinate.strip() and coordinate.strip() not in coordinates)
+    return coordinates
+
+
+def resolve_dependency_jars(repository_url: str,
+                            coordinates: list,
+                            dependency_jars_folder: str) -> list:
+    # Resolve Each Coordinate to Its Jar's URL and SHA-1 (Published Beside the Jar). Transitive Dependencies Are
+    # Not Followed: List Every Jar the Jobs Need (e.g., hadoop-aws and the Matching aws-java-sdk-bundle).
+    dependency_jars = []
+    for coordinate in coordinates:
+        group_id, artifact_id, version = parse_maven_coordinate(coordinate)
+        jar_file_name = "{0}-{1}.jar".format(artifact_id, version)
+        jar_url = "{0}/{1}/{2}/{3}/{4}".format(repository_url.rstrip("/"),
+                                               group_id.replace(".", "/"),
+                                               artifact_id,
+                                               version,
+                                               jar_file_name)
+        try:
+            with urlopen(jar_url + ".sha1", timeout=30) as response:
+                jar_sha1 = response.read().decode("ascii").split()[0].strip().lower()
+        except (OSError, IndexError):
+            # No Checksum Published (or the Repository Is Unreachable From Here): Checked by Presence Only.
+            jar_sha1 = ""
+        dependency_jars.append({"coordinate": coordinate,
+                                "file_name": jar_file_name,
+                                "url": jar_url,
+                                "sha1": jar_sha1,
+                                "path": "{0}/{1}".format(dependency_jars_folder.rstrip("/"), jar_file_name)})
+    return dependency_jars
+
+
+def load_dependency_jars_staging_script(dependency_jars_folder: str,
+                                        dependency_jars: list) -> str:
+    stage_jar_commands = "\n".join("stage_jar {0} {1} {2}".format(dependency_jar["file_name"],
+                                                                  dependency_jar["url"],
+                                                                  dependency_jar["sha1"] or "''")
+                                   for dependency_jar in dependency_jars)
+    return dependency_jars_staging_script_template.format(dependency_jars_folder=dependency_jars_folder.rstrip("/"),
+                                                          stage_jar_commands=stage_jar_commands)
+
+
+def get_dependency_jars_spark_properties(spark_properties: dict,
+                                         dependency_jars: list) -> dict:
+    # Swap the Ivy Resolution ('spark.jars.packages') for the Staged Jars ('local:' Paths Exist on Every Node,
+    # so Neither the Driver Nor the Executors Download Anything).
+    spark_properties = dict(spark_properties)
+    spark_properties.pop("spark.jars.packages", None)
+    spark_jars = [spark_jar for spark_jar in spark_properties.get("spark.jars", "").split(",") if spark_jar.strip()]
+    spark_jars.extend("local:{0}".format(dependency_jar["path"]) for dependency_jar in dependency_jars
+                      if "local:{0}".format(dependency_jar["path"]) not in spark_jars)
+    spark_properties["spark.jars"] = ",".join(spark_jars)
+    return spark_properties
+
+
+# Resolved Dependency Jars Pool (Resolved Once Per Repository, Coordinates and Folder, Shared Across Nodes).
+dependency_jars_pool = {}
+dependency_jars_pool_lock = Lock()
+
+
+def load_dependency_jars(repository_url: str,
+                         coordinates: list,
+                         dependency_jars_folder: str) -> list:
+    with dependency_jars_pool_lock:
+        dependency_jars_key = (repository_url, tuple(coordinates), dependency_jars_folder)
+        if dependency_jars_key not in dependency_jars_pool:
+            dependency_jars_pool[dependency_jars_key] = resolve_dependency_jars(repository_url,
+                                                                                coordinates,
+                                                                                dependency_jars_folder)
+        return dependency_jars_pool[dependency_jars_key]
@@ -0,0 +1,151 @@
+from pathlib import Path
+from re import compile
+from typing import Iterator
+
+# Event Log Compression Codecs (Spark's), 'none' Disabling the Compression.
+event_log_compression_codecs = ["none", "lz4", "lzf", "snappy", "zstd"]
+
+# Remote Folder Holding the History Server's Properties File (Relative to the User's Home).
+remote_history_server_folder = "spark_history"
+
+# Rolling Event Log Folder ('eventlog_v2_<Application ID>') and Its Files ('events_<Index>_<Application ID>').
+rolling_event_log_folder_prefix = "eventlog_v2_"
+rolling_event_log_file_pattern = compile(r"^events_(\d+)_")
+
+# History Server Start Script: Writes Its Properties File, Then Starts It Unless Already Running.
+history_server_start_script_template = """\
+history_folder="$HOME/{remote_history_server_folder}"
+mkdir -p "$history_folder"
+cat > "$history_folder/history.conf" << 'SPARKING_CLOUD_HISTORY'
+{history_server_properties}
+SPARKING_CLOUD_HISTORY
+{create_local_folder_command}
+if ! pgrep -f '[o]rg.apache.spark.deploy.history.HistoryServer' > /dev/null; then
+  bash "$SPARK_HOME/sbin/start-history-server.sh" --properties-file "$history_folder/history.conf"
+fi
+"""
+
+
+def get_event_log_dir(configuration_rules_settings: dict) -> str:
+    # A Shared Location (e.g., an S3A Prefix) Outlives the Cluster; the Default Is the Master's Disk.
+    spark_event_log_dir = configuration_rules_settings["spark_event_log_dir"].rstrip("/")
+    return spark_event_log_dir or "file://{0}".format(configuration_rules_settings["spark_event_log_folder"])
+
+
+def is_local_event_log_dir(event_log_dir: str) -> bool:
+    return event_log_dir.startswith("file://")
+
+
+def split_s3a_event_log_dir(event_log_dir: str) -> tuple:
+    # 's3a://bucket/prefix' -> ('bucket', 'prefix/').
+    bucket_name, _, prefix = event_log_dir[len("s3a://"):].partition("/")
+    return bucket_name, prefix.strip("/") + "/" if prefix.strip("/") else ""
+
+
+def get_event_log_spark_properties(configuration_rules_settings: dict) -> dict:
+    compression_codec = configuration_rules_settings["event_log_compression_codec"]
+    event_log_properties = {"spark.eventLog.enabled": "true",
+                            "spark.eventLog.dir": get_event_log_dir(configuration_rules_settings),
+                            "spark.eventLog.compress": "false" if compression_codec == "none" else "true"}
+    if compression_codec != "none":
+        event_log_properties["spark.eventLog.compression.codec"] = compression_codec
+    if configuration_rules_settings["event_log_rolling"]:
+        # Long-Running Applications Write Bounded Files, so the History Server Can Compact Them.
+        event_log_properties.update({"spark.eventLog.rolling.enabled": "true",
+                                     "spark.eventLog.rolling.maxFileSize":
+                                         configuration_rules_settings["event_log_rolling_max_file_size"]})
+    return event_log_properties
+
+
+def get_history_server_properties(configuration_rules_settings: dict,
+                                  spark_properties: dict) -> dict:
+    # The History Server Reads the Event Logs Where the Drivers Write Them (Plus the S3A Settings, If Shared).
+    history_server_properties = {"spark.history.fs.logDirectory": get_event_log_dir(configuration_rules_settings),
+                                 "spark.history.ui.port": configuration_rules_settings["history_server_webui_port"]}
+    if not is_local_event_log_dir(history_server_properties["spark.history.fs.logDirectory"]):
+        history_server_properties.update({key: value for key, value in spark_properties.items()
+                                          if key.startswith("spark.hadoop.fs.s3a.")})
+    return history_server_properties
+
+
+def load_history_server_start_script(configuration_rules_settings: dict,
+                                     spark_properties: dict) -> str:
+    event_log_dir = get_event_log_dir(configuration_rules_settings)
+    history_server_properties = get_history_server_properties(configuration_rules_settings, spark_properties)
+    create_local_folder_command = "mkdir -p {0}".format(event_log_dir[len("file://"):]) \
+        if is_local_event_log_dir(event_log_dir) else ""
+    return history_server_start_script_template \
+        .format(remote_history_server_folder=remote_history_server_folder,
+                history_server_properties="\n".join("{0} = {1}".format(key, value)
+                                                    for key, value in history_server_properties.items()),
+                create_local_folder_command=create_local_folder_command)
+
+
+def get_finished_event_log_names(event_log_paths: list) -> list:
+    # Event Log Paths Relative to the Event Log Location: '<Name>', or '<Folder>/<File>' Inside a Rolling Log.
+    # Running Applications Write '<ID>.inprogress' Files, or Rolling Folders Holding an 'appstatus_<ID>.inprogress'
+    # Marker (Renamed Once the Application Ends): Both Are Skipped.
+    event_log_names = set()
+    in_progress_event_log_names = set()
+    for event_log_path in event_log_paths:
+        event_log_name, _, file_name = event_log_path.strip("/").partition("/")
+        if not event_log_name:
+            continue
+        if event_log_name.endswith(".inprogress") \
+                or (file_name.startswith("appstatus_") and file_name.endswith(".inprogress")):
+            in_progress_event_log_names.add(event_log_name)
+        event_log_names.add(event_log_name)
+    return sorted(event_log_names - in_progress_event_log_names)
+
+
+def find_event_log_name(event_log_names: list,
+                        application_id: str) -> str:
+    # The Application's Finished Event Log: Plain ('<ID>'), Compressed ('<ID>.<Codec>') or Rolling (Folder).
+    for event_log_name in event_log_names:
+        if event_log_name.endswith(".inprogress"):
+            continue
+        if event_log_name in [application_id, rolling_event_log_folder_prefix + application_id] \
+                or event_log_name.startswith(application_id + "."):
+            return event_log_name
+    return None
+
+
+def get_event_log_files(event_log_path: Path) -> list:
+    # A Rolling Event Log Is a Folder of Files Read in Their Index Order.
+    event_log_path = Path(event_log_path)
+    if not event_log_path.is_dir():
+        return [event_log_path]
+    event_log_files = [event_log_file for event_log_file in event_log_path.iterdir()
+                       if rolling_event_log_file_pattern.match(event_log_file.name)]
+    return sorted(event_log_files,
+                  key=lambda event_log_file: int(rolling_event_log_file_pattern.match(event_log_file.name).group(1)))
+
+
+def read_event_log_lines(event_log_path: Path) -> Iterator[str]:
+    # Plain and Zstandard-Compressed Logs Are Read Here; Spark's LZ4, LZF and Snappy Streams Use Java-Specific
+    # Framing (Read Them Through the History Server Instead).
+    for event_log_file in get_event_log_files(event_log_path):
+        codec = event_log_file.suffix[1:] if event_log_file.suffix[1:] in event_log_compression_codecs else "none"
+        if codec == "none":
+            with open(file=event_log_file, mode="r", encoding="utf-8") as event_log:
+                yield from event_log
+        elif codec == "zstd":
+            try:
+                from zstandard import ZstdDecompressor
+            except ImportError:
+                message = "Reading the '{0}' event log requires the 'zstandard' package!".format(event_log_file)
+                raise ValueError(message)
+            with open(file=event_log_file, mode="rb") as event_log:
+                with ZstdDecompressor().stream_reader(event_log, read_across_frames=True) as reader:
+                    pending_bytes = b""
+                    for chunk in iter(lambda: reader.read(1048576), b""):
+                        lines = (pending_bytes + chunk).split(b"\n")
+                        pending_bytes = lines.pop()
+                        for line in lines:
+                            yield line.decode("utf-8")
+                    if pending_bytes:
+                        yield pending_bytes.decode("utf-8")
+        else:
+            message = "The '{0}' event log is compressed with '{1}', which cannot be read locally!" \
+                .format(event_log_file, codec)
+            raise ValueError(message)
@@ -0,0 +1,89 @@
+from json import dump, load
+from os import replace
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any
+
+# Instance Price Cache's File Name (Stored in the Cluster Instances Root Folder).
+instance_price_cache_file_name = "instance_prices.json"
+
+
+class InstancePriceCache:
+
+    def __init__(self,
+                 cache_file: Path) -> None:
+        self.cache_file = cache_file
+        self.cache_lock = Lock()
+        # Hourly Prices (USD), Per Region and Market ({Region: {Market: {Type: {'price', 'fetched_at'}}}}).
+        # The Market Is 'on-demand' or 'spot/<Availability Zone>' (Spot Prices Vary Across Zones).
+        self.cache = self.read_cache_file()
+
+    def read_cache_file(self) -> dict:
+        cache = {}
+        if self.cache_file.is_file():
+            try:
+                with open(file=self.cache_file, mode="r", encoding="utf-8") as cache_file:
+                    cache = load(cache_file)
+            except ValueError:
+                # Corrupted Cache File, Rebuilt on the Next Fetch.
+                cache = {}
+        return cache
+
+    def write_cache_file(self) -> None:
+        # Write to a Temporary File First, so Readers Never See a Partially Written Cache.
+        temporary_cache_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(file=temporary_cache_file, mode="w", encoding="utf-8") as cache_file:
+            dump(self.cache, cache_file, indent=4, sort_keys=True)
+        replace(temporary_cache_file, self.cache_file)
+
+    @staticmethod
+    def get_market(market_type: str,
+                   availability_zone: str) -> str:
+        return "spot/{0}".format(availability_zone) if market_type == "spot" else "on-demand"
+
+    def get_instance_price(self,
+                           region_name: str,
+                           market_type: str,
+                           availability_zone: str,
+                           instance_type: str,
+                           operating_system: str,
+                           max_age_in_seconds: int,
+                           ec2m: Any = None) -> float:
+        # Serve the Cached Price While Fresh, Otherwise Fetch It (If an EC2Manager Is Given) and Cache It.
+        market = self.get_market(market_type, availability_zone)
+        with self.cache_lock:
+            cached_price = self.cache.get(region_name, {}).get(market, {}).get(instance_type)
+            if cached_price and (ec2m is None or time() - cached_price["fetched_at"] <= max_age_in_seconds):
+                return cached_price["price"]
+            if ec2m is None:
+                return None
+            if market_type == "spot":
+                price = ec2m.fetch_current_ec2_spot_instance_price(availability_zone=availability_zone,
+                                                                   instance_types=[instance_type],
+                                                                   product_descriptions=[operating_system])
+            else:
+                price = ec2m.fetch_ec2_on_demand_instance_price(instance_type, operating_system)
+            price = float(price)
+            if not price:
+                # No Price Offered (e.g., Type Unavailable in the Zone): Not Cached, Retried Next Time.
+                return None
+            price_dict = {"price": price,
+                          "fetched_at": time()}
+            self.cache.setdefault(region_name, {}).setdefault(market, {})[instance_type] = price_dict
+            self.write_cache_file()
+            return price
+
+
+# InstancePriceCache Objects Pool (One Per Cache File, Shared Across Tasks and Stages).
+instance_price_caches_pool = {}
+instance_price_caches_pool_lock = Lock()
+
+
+def load_instance_price_cache(cluster_instances_root_folder: Path) -> InstancePriceCache:
+    with instance_price_caches_pool_lock:
+        cache_file = Path(cluster_instances_root_folder).joinpath(instance_price_cache_file_name)
+        if cache_file not in instance_price_caches_pool:
+            Path(cluster_instances_root_folder).mkdir(parents=True, exist_ok=True)
+            instance_price_caches_pool[cache_file] = InstancePriceCache(cache_file)
+        return instance_price_caches_pool[cache_file]
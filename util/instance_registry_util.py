@@ -0,0 +1,243 @@
+from configparser import ConfigParser, Error as ConfigParserError
+from json import dumps, loads
+from os import listdir
+from pathlib import Path
+from sqlite3 import connect
+from threading import Lock
+
+# Instance Registry's File Name (Stored in the Cluster Instances Root Folder).
+instance_registry_file_name = "sparking_cloud_instances.db"
+
+# Instance Fields Stored by the Registry (In Addition to the Cluster Name and the Sequence Number).
+instance_fields = ["provider", "name", "id", "role", "type", "market_type", "key_name", "username",
+                   "public_ipv4_address", "ssh_port", "state", "private_ipv4_address", "private_dns_name"]
+
+# Fields Every Registered Instance Must Have (Legacy Sections Missing One Are Not Instances).
+required_instance_fields = ["provider", "name", "id"]
+
+# Columns Added After the First Schema Version (Added to Existing Registries on Open).
+added_instance_columns = {"facts": "TEXT",
+                          "private_ipv4_address": "TEXT",
+                          "private_dns_name": "TEXT"}
+
+
+class InstanceRegistry:
+
+    def __init__(self,
+                 registry_file: Path) -> None:
+        self.registry_file = registry_file
+        self.registry_lock = Lock()
+        # One Connection Shared by All Threads (Serialized by the Lock).
+        # Other Processes Are Serialized by SQLite's File Locking (Waiting Up to the Timeout).
+        self.connection = connect(database=str(registry_file),
+                                  timeout=60,
+                                  isolation_level=None,
+                                  check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.create_schema()
+
+    def create_schema(self) -> None:
+        with self.registry_lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                # The Sequence Number Keeps the Append Order and Is Never Reused or Renumbered.
+                self.connection.execute("CREATE TABLE IF NOT EXISTS instances ("
+                                        "number INTEGER PRIMARY KEY AUTOINCREMENT, "
+                                        "cluster_name TEXT NOT NULL, "
+                                        "provider TEXT NOT NULL, "
+                                        "name TEXT NOT NULL, "
+                                        "id TEXT NOT NULL UNIQUE, "
+                                        "role TEXT NOT NULL, "
+                                        "type TEXT, "
+                                        "market_type TEXT, "
+                                        "key_name TEXT, "
+                                        "username TEXT, "
+                                        "public_ipv4_address TEXT, "
+                                        "ssh_port INTEGER, "
+                                        "state TEXT)")
+                # Columns Added After the First Schema Version (Added to Existing Registries as Well).
+                columns = [row[1] for row in self.connection.execute("PRAGMA table_info(instances)").fetchall()]
+                for column, column_type in added_instance_columns.items():
+                    if column not in columns:
+                        self.connection.execute("ALTER TABLE instances ADD COLUMN {0} {1}".format(column,
+                                                                                                  column_type))
+                self.connection.execute("CREATE INDEX IF NOT EXISTS instances_by_role "
+                                        "ON instances (cluster_name, role)")
+                self.connection.execute("CREATE INDEX IF NOT EXISTS instances_by_provider "
+                                        "ON instances (cluster_name, provider)")
+                self.connection.execute("CREATE INDEX IF NOT EXISTS instances_by_state "
+                                        "ON instances (cluster_name, state)")
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def get_instance_role(instance_dict: dict) -> str:
+        # Instances Registered Without Explicit Role (e.g., Legacy Files) Are Identified by Name.
+        instance_role = instance_dict.get("role")
+        if not instance_role:
+            instance_role = "master" if "master" in instance_dict["name"].lower() else "worker"
+        return instance_role
+
+    def insert_instances(self,
+                         cluster_name: str,
+                         instances_list: list) -> None:
+        rows = []
+        for instance_dict in instances_list:
+            row_dict = {field: instance_dict.get(field) for field in instance_fields}
+            row_dict["id"] = str(instance_dict["id"])
+            row_dict["role"] = self.get_instance_role(instance_dict)
+            row_dict["state"] = instance_dict.get("state", "running")
+            rows.append([cluster_name] + [row_dict[field] for field in instance_fields])
+        query = "INSERT OR IGNORE INTO instances (cluster_name, {0}) VALUES ({1})" \
+            .format(", ".join(instance_fields),
+                    ", ".join("?" * (len(instance_fields) + 1)))
+        with self.registry_lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Already Registered Instances (Same ID) Are Kept as Is.
+                self.connection.executemany(query, rows)
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def insert_instance(self,
+                        cluster_name: str,
+                        instance_dict: dict) -> None:
+        self.insert_instances(cluster_name, [instance_dict])
+
+    def update_instances(self,
+                         instances_list: list) -> None:
+        # Update the Registered Fields Present on Each Instance Dict (Matched by Instance ID).
+        with self.registry_lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                for instance_dict in instances_list:
+                    fields = [field for field in instance_fields if field in instance_dict and field != "id"]
+                    if fields:
+                        assignments = ", ".join("{0} = ?".format(field) for field in fields)
+                        values = [instance_dict[field] for field in fields] + [str(instance_dict["id"])]
+                        self.connection.execute("UPDATE instances SET {0} WHERE id = ?".format(assignments),
+                                                values)
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def set_instance_facts(self,
+                           instance_id: str,
+                           instance_facts: dict) -> None:
+        # Cache the Facts Gathered From the Instance (Stored as JSON).
+        with self.registry_lock:
+            self.connection.execute("UPDATE instances SET facts = ? WHERE id = ?",
+                                    [dumps(instance_facts), str(instance_id)])
+
+    def get_instances(self,
+                      cluster_name: str,
+                      role: str = None,
+                      provider: str = None,
+                      state: str = None) -> list:
+        conditions = ["cluster_name = ?"]
+        values = [cluster_name]
+        for field, value in (("role", role), ("provider", provider), ("state", state)):
+            if value is not None:
+                conditions.append("{0} = ?".format(field))
+                values.append(value)
+        query = "SELECT {0}, facts FROM instances WHERE {1} ORDER BY number" \
+            .format(", ".join(instance_fields),
+                    " AND ".join(conditions))
+        with self.registry_lock:
+            rows = self.connection.execute(query, values).fetchall()
+        instances_list = []
+        for row in rows:
+            instance_dict = dict(zip(instance_fields, row[:-1]))
+            instance_dict["facts"] = loads(row[-1]) if row[-1] else None
+            instances_list.append(instance_dict)
+        return instances_list
+
+    def has_cluster(self,
+                    cluster_name: str) -> bool:
+        with self.registry_lock:
+            row = self.connection.execute("SELECT 1 FROM instances WHERE cluster_name = ? LIMIT 1",
+                                          [cluster_name]).fetchone()
+        return row is not None
+
+    def delete_cluster(self,
+                       cluster_name: str) -> None:
+        with self.registry_lock:
+            self.connection.execute("DELETE FROM instances WHERE cluster_name = ?",
+                                    [cluster_name])
+
+    def delete_instances(self,
+                         instances_ids_list: list) -> None:
+        with self.registry_lock:
+            self.connection.executemany("DELETE FROM instances WHERE id = ?",
+                                        [[str(instance_id)] for instance_id in instances_ids_list])
+
+    def close(self) -> None:
+        with self.registry_lock:
+            self.connection.close()
+
+
+def read_legacy_instances_file(instances_file: Path) -> list:
+    instances_list_parser = ConfigParser()
+    instances_list_parser.optionxform = str
+    instances_list_parser.read(filenames=instances_file,
+                               encoding="utf-8")
+    instances_list = []
+    for section in instances_list_parser.sections():
+        if "Instance" in section:
+            instance_dict = {field: instances_list_parser.get(section, field)
+                             for field in instance_fields if instances_list_parser.has_option(section, field)}
+            missing_fields = [field for field in required_instance_fields if not instance_dict.get(field)]
+            if missing_fields:
+                message = "The section '{0}' of '{1}' misses the {2} field(s)!" \
+                    .format(section,
+                            instances_file,
+                            ", ".join(missing_fields))
+                raise ValueError(message)
+            if "ssh_port" in instance_dict:
+                instance_dict["ssh_port"] = int(instance_dict["ssh_port"])
+            instances_list.append(instance_dict)
+    del instances_list_parser
+    return instances_list
+
+
+def migrate_legacy_instances_files(cluster_instances_root_folder: Path,
+                                   instance_registry: InstanceRegistry) -> list:
+    # Import Each Legacy INI Instances File (Named After Its Cluster) Into the Registry.
+    # Imported Files Are Renamed With the '.migrated' Suffix, so They Are Imported Only Once.
+    migrated_cluster_names = []
+    for file_name in sorted(listdir(cluster_instances_root_folder)):
+        instances_file = Path(cluster_instances_root_folder).joinpath(file_name)
+        if not instances_file.is_file() or instances_file.suffix or file_name.startswith("."):
+            continue
+        try:
+            instances_list = read_legacy_instances_file(instances_file)
+        except (ConfigParserError, UnicodeDecodeError, ValueError):
+            # Not an Instances File (e.g., a Stray README or an Incomplete Section): Left Untouched.
+            continue
+        if instances_list:
+            instance_registry.insert_instances(file_name, instances_list)
+            instances_file.rename(instances_file.with_name(file_name + ".migrated"))
+            migrated_cluster_names.append(file_name)
+    return migrated_cluster_names
+
+
+# InstanceRegistry Objects Pool (One Per Registry File, Shared Across Threads and Tasks).
+instance_registries_pool = {}
+instance_registries_pool_lock = Lock()
+
+
+def load_instance_registry(cluster_instances_root_folder: Path) -> InstanceRegistry:
+    with instance_registries_pool_lock:
+        registry_file = Path(cluster_instances_root_folder).joinpath(instance_registry_file_name)
+        if registry_file not in instance_registries_pool:
+            Path(cluster_instances_root_folder).mkdir(parents=True, exist_ok=True)
+            instance_registry = InstanceRegistry(registry_file)
+            migrate_legacy_instances_files(cluster_instances_root_folder, instance_registry)
+            instance_registries_pool[registry_file] = instance_registry
+        return instance_registries_pool[registry_file]
@@ -0,0 +1,94 @@
+from json import dump, load
+from os import replace
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional
+
+# Instance Type Catalog's File Name (Stored in the Cluster Instances Root Folder).
+instance_type_catalog_file_name = "instance_types_catalog.json"
+
+
+class InstanceTypeCatalog:
+
+    def __init__(self,
+                 catalog_file: Path) -> None:
+        self.catalog_file = catalog_file
+        self.catalog_lock = Lock()
+        # Instance Types Hardware Specs, Per Region ({Region: {Type: Specs Dict}}).
+        self.catalog = self.read_catalog_file()
+
+    def read_catalog_file(self) -> dict:
+        catalog = {}
+        if self.catalog_file.is_file():
+            try:
+                with open(file=self.catalog_file, mode="r", encoding="utf-8") as catalog_file:
+                    catalog = load(catalog_file)
+            except ValueError:
+                # Corrupted Catalog File, Rebuilt on the Next Fetch.
+                catalog = {}
+        return catalog
+
+    def write_catalog_file(self) -> None:
+        # Write to a Temporary File First, so Readers Never See a Partially Written Catalog.
+        temporary_catalog_file = self.catalog_file.with_name(self.catalog_file.name + ".tmp")
+        with open(file=temporary_catalog_file, mode="w", encoding="utf-8") as catalog_file:
+            dump(self.catalog, catalog_file, indent=4, sort_keys=True)
+        replace(temporary_catalog_file, self.catalog_file)
+
+    @staticmethod
+    def parse_instance_type_info(instance_type_info: dict) -> dict:
+        # Keep Only the Hardware Specs Used to Size the Spark Daemons.
+        vcpu_info = instance_type_info.get("VCpuInfo", {})
+        memory_info = instance_type_info.get("MemoryInfo", {})
+        instance_storage_info = instance_type_info.get("InstanceStorageInfo", {})
+        network_info = instance_type_info.get("NetworkInfo", {})
+        processor_info = instance_type_info.get("ProcessorInfo", {})
+        return {"vcpus": vcpu_info.get("DefaultVCpus"),
+                "cores": vcpu_info.get("DefaultCores"),
+                "threads_per_core": vcpu_info.get("DefaultThreadsPerCore"),
+                "architectures": processor_info.get("SupportedArchitectures", []),
+                "memory_in_mib": memory_info.get("SizeInMiB"),
+                "instance_storage_in_gb": instance_storage_info.get("TotalSizeInGB", 0),
+                "instance_storage_disks": sum(disk.get("Count", 0)
+                                              for disk in instance_storage_info.get("Disks", [])),
+                "instance_storage_nvme_support": instance_storage_info.get("NvmeSupport", "unsupported"),
+                "network_performance": network_info.get("NetworkPerformance")}
+
+    def fetch_instance_types(self,
+                             region_name: str,
+                             instance_types_list: list,
+                             ec2m: Any) -> None:
+        # Describe Only the Instance Types Missing From the Catalog (Batched Requests).
+        with self.catalog_lock:
+            region_catalog = self.catalog.setdefault(region_name, {})
+            missing_instance_types_list = sorted({instance_type for instance_type in instance_types_list
+                                                  if instance_type and instance_type not in region_catalog})
+            if not missing_instance_types_list:
+                return
+            for instance_type_info in ec2m.describe_ec2_instance_types(missing_instance_types_list):
+                region_catalog[instance_type_info["InstanceType"]] = \
+                    self.parse_instance_type_info(instance_type_info)
+            self.write_catalog_file()
+
+    def get_instance_type(self,
+                          region_name: str,
+                          instance_type: str,
+                          ec2m: Any = None) -> Optional[dict]:
+        if ec2m is not None:
+            self.fetch_instance_types(region_name, [instance_type], ec2m)
+        with self.catalog_lock:
+            return self.catalog.get(region_name, {}).get(instance_type)
+
+
+# InstanceTypeCatalog Objects Pool (One Per Catalog File, Shared Across Tasks and Stages).
+instance_type_catalogs_pool = {}
+instance_type_catalogs_pool_lock = Lock()
+
+
+def load_instance_type_catalog(cluster_instances_root_folder: Path) -> InstanceTypeCatalog:
+    with instance_type_catalogs_pool_lock:
+        catalog_file = Path(cluster_instances_root_folder).joinpath(instance_type_catalog_file_name)
+        if catalog_file not in instance_type_catalogs_pool:
+            Path(cluster_instances_root_folder).mkdir(parents=True, exist_ok=True)
+            instance_type_catalogs_pool[catalog_file] = InstanceTypeCatalog(catalog_file)
+        return instance_type_catalogs_pool[catalog_file]
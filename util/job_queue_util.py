@@ -0,0 +1,74 @@
+from json import load
+from pathlib import Path
+from xml.etree.ElementTree import parse
+
+
+def read_scheduler_pools(pool_properties_file: Path) -> list:
+    # Pool Names Defined by the Spark Scheduler Allocation File ('default' Always Exists).
+    pools = ["default"]
+    for pool in parse(pool_properties_file).getroot().iter("pool"):
+        if pool.get("name") and pool.get("name") not in pools:
+            pools.append(pool.get("name"))
+    return pools
+
+
+def read_job_manifest(job_manifest_file: Path,
+                      job_defaults: dict,
+                      scheduler_pools: list) -> list:
+    # Manifest: {"jobs": [{"name", "entry_point", "arguments", "pool", "cores_max", "properties"}, ...]}.
+    # The Pool Is Advisory (Passed as 'spark.scheduler.pool' for the Application to Apply to Its Own Jobs).
+    # Missing Fields Take the Defaults; "cores_max" Stays None Until the Cluster's Cores Are Known.
+    with open(file=job_manifest_file, mode="r", encoding="utf-8") as manifest_file:
+        job_manifest = load(manifest_file)
+    jobs = []
+    for job_index, job in enumerate(job_manifest.get("jobs", [])):
+        job_name = job.get("name", "job-{0}".format(job_index))
+        job_pool = job.get("pool", job_defaults["pool"])
+        if job_pool not in scheduler_pools:
+            message = "The job '{0}' uses the pool '{1}', which is not defined! Defined pools: {2}." \
+                .format(job_name, job_pool, scheduler_pools)
+            raise ValueError(message)
+        jobs.append({"name": job_name,
+                     "entry_point": job.get("entry_point", job_defaults["entry_point"]),
+                     "arguments": job.get("arguments", job_defaults["arguments"]),
+                     "pool": job_pool,
+                     "cores_max": job.get("cores_max", job_defaults["cores_max"] or None),
+                     "properties": dict(job.get("properties", {}))})
+    return jobs
+
+
+def get_job_cores_max(job: dict,
+                      registered_cores: int,
+                      max_concurrent_jobs: int) -> int:
+    # Jobs Without a Cap Get an Equal Share of the Cluster's Cores; No Job May Ask for More Than the Cluster Has.
+    if job["cores_max"]:
+        return max(min(job["cores_max"], registered_cores), 1)
+    return max(registered_cores // max(max_concurrent_jobs, 1), 1)
+
+
+def can_admit_job(job_cores_max: int,
+                  running_jobs_cores: list,
+                  registered_cores: int,
+                  max_concurrent_jobs: int) -> bool:
+    # Admit the Next Job Only If Its Cores Fit Beside the Running Jobs' (Never Oversubscribing the Cluster).
+    if max_concurrent_jobs and len(running_jobs_cores) >= max_concurrent_jobs:
+        return False
+    return not running_jobs_cores or sum(running_jobs_cores) + job_cores_max <= registered_cores
+
+
+def summarize_job_queue(job_records: list) -> dict:
+    # Batch Timings (Remote Clock, Epoch Seconds): Makespan, Busy Time and the Time Jobs Waited in the Queue.
+    start_times = [job_record["start_time"] for job_record in job_records if job_record.get("start_time")]
+    end_times = [job_record["end_time"] for job_record in job_records if job_record.get("end_time")]
+    durations = [job_record["duration_in_seconds"] for job_record in job_records
+                 if job_record.get("duration_in_seconds") is not None]
+    queue_waits = [job_record["queue_wait_in_seconds"] for job_record in job_records
+                   if job_record.get("queue_wait_in_seconds") is not None]
+    states = {}
+    for job_record in job_records:
+        states[job_record["state"]] = states.get(job_record["state"], 0) + 1
+    return {"jobs": len(job_records),
+            "states": states,
+            "makespan_in_seconds": max(end_times) - min(start_times) if start_times and end_times else None,
+            "total_job_duration_in_seconds": sum(durations),
+            "max_queue_wait_in_seconds": max(queue_waits, default=None)}
@@ -0,0 +1,73 @@
+# Spark's Scratch Folders (Shuffle and Spill Files, Executors' Work Folders) Under the Local Storage Mount Point.
+spark_local_dirs_folder_name = "spark_local"
+spark_worker_dir_folder_name = "spark_work"
+
+# Local Storage Setup Script: Finds the Unmounted Instance-Store Devices (Whole Disks, No Partition, No File System),
+# Stripes Them Into a RAID0 Array When There Are Several, Then Formats and Mounts the Result. Idempotent: Nothing
+# Is Touched Once the Mount Point Is Mounted.
+local_storage_setup_script_template = """\
+set -e
+mount_point="{local_storage_mount_point}"
+if ! mountpoint -q "$mount_point"; then
+  devices=""
+  for device in $(lsblk -d -n -p -o NAME,TYPE | awk '$2 == "disk" {{print $1}}'); do
+    model="$(lsblk -d -n -o MODEL "$device" | sed 's/ *$//')"
+    case "$model" in
+      *"Elastic Block Store"*) continue ;;
+    esac
+    if [ "$(lsblk -n -o NAME "$device" | wc -l)" -ne 1 ]; then
+      continue
+    fi
+    if [ -n "$(lsblk -n -o MOUNTPOINT,FSTYPE "$device" | tr -d ' ')" ]; then
+      continue
+    fi
+    devices="$devices $device"
+  done
+  set -- $devices
+  if [ "$#" -eq 0 ]; then
+    echo "No unmounted instance-store device found." >&2
+    exit 0
+  fi
+  if [ "$#" -gt 1 ]; then
+    command -v mdadm > /dev/null || (sudo apt-get update -q && sudo apt-get install -y -q mdadm)
+    sudo mdadm --create {raid_device} --run --level=0 --raid-devices="$#" "$@"
+    target_device={raid_device}
+  else
+    target_device="$1"
+  fi
+  sudo {mkfs_command} "$target_device"
+  sudo mkdir -p "$mount_point"
+  sudo mount -o defaults,noatime "$target_device" "$mount_point"
+fi
+for spark_folder in "$mount_point/{spark_local_dirs_folder_name}" "$mount_point/{spark_worker_dir_folder_name}"; do
+  sudo mkdir -p "$spark_folder"
+  sudo chown "$(id -u):$(id -g)" "$spark_folder"
+done
+"""
+
+# RAID0 Device Assembled From Several Instance-Store Devices.
+local_storage_raid_device = "/dev/md0"
+
+# Format Commands by File System (Skipping the Discard Pass, Since Instance-Store Devices Come Blank).
+local_storage_mkfs_commands = {"ext4": "mkfs.ext4 -q -F -E nodiscard",
+                               "xfs": "mkfs.xfs -q -f -K"}
+
+
+def load_local_storage_setup_script(local_storage_mount_point: str,
+                                    local_storage_filesystem: str) -> str:
+    return local_storage_setup_script_template \
+        .format(local_storage_mount_point=local_storage_mount_point.rstrip("/"),
+                raid_device=local_storage_raid_device,
+                mkfs_command=local_storage_mkfs_commands[local_storage_filesystem],
+                spark_local_dirs_folder_name=spark_local_dirs_folder_name,
+                spark_worker_dir_folder_name=spark_worker_dir_folder_name)
+
+
+def load_local_storage_environment_command(local_storage_mount_point: str) -> str:
+    # Point the Worker's Scratch Folders at the Local Storage Only While It Is Mounted (Instance-Store Volumes
+    # Vanish on Stop/Start), Else Keep Spark's Defaults.
+    local_storage_mount_point = local_storage_mount_point.rstrip("/")
+    return "if mountpoint -q {0}; then export SPARK_LOCAL_DIRS={0}/{1} SPARK_WORKER_DIR={0}/{2}; fi; " \
+        .format(local_storage_mount_point,
+                spark_local_dirs_folder_name,
+                spark_worker_dir_folder_name)
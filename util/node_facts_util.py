@@ -0,0 +1,75 @@
+from base64 import b64encode
+from logging import Logger
+from pathlib import Path
+from util.cluster_inventory_util import InstanceRecord
+from util.instance_registry_util import load_instance_registry
+from util.logging_util import log_message
+from util.process_util import remotely_execute_command
+
+# Node Facts Parsed as Integers (The Remaining Facts Are Kept as Strings).
+integer_node_facts = ["vcpus", "sockets", "cores_per_socket", "threads_per_core", "numa_nodes", "memory_in_kb"]
+
+
+def load_node_facts_remote_command(gather_node_facts_script_file: Path) -> str:
+    # Pipe the Base64-Encoded Script to the Remote Shell (No Upload, No Cleanup, No Quoting Issues).
+    with open(file=gather_node_facts_script_file, mode="rb") as script_file:
+        encoded_script = b64encode(script_file.read()).decode("ascii")
+    return "echo {0} | base64 -d | bash".format(encoded_script)
+
+
+def parse_node_facts(process_stdout: list) -> dict:
+    node_facts = {"block_devices": []}
+    for line in process_stdout:
+        for fact_line in line.splitlines():
+            if "=" not in fact_line:
+                continue
+            key, value = fact_line.split("=", 1)
+            key = key.strip()
+            value = value.strip()
+            if key == "block_device":
+                name, size, device_type, mount_point = (value.split(",", 3) + ["", "", ""])[:4]
+                node_facts["block_devices"].append({"name": name,
+                                                    "size_in_bytes": int(size) if size.isdigit() else None,
+                                                    "type": device_type,
+                                                    "mount_point": mount_point or None})
+            elif key in integer_node_facts:
+                node_facts[key] = int(value) if value.isdigit() else None
+            else:
+                node_facts[key] = value or None
+    return node_facts
+
+
+def gather_instance_facts(instance: InstanceRecord,
+                          cluster_instances_root_folder: Path,
+                          configuration_rules_settings: dict,
+                          logger: Logger,
+                          refresh: bool = False) -> dict:
+    # Return the Cached Facts, Unless Missing or a Refresh is Requested.
+    if instance.facts and not refresh:
+        return instance.facts
+    max_tries = configuration_rules_settings["max_tries"]
+    time_between_retries_in_seconds = configuration_rules_settings["time_between_retries_in_seconds"]
+    gather_node_facts_script_file = configuration_rules_settings["gather_node_facts_script_file"]
+    message = "Gathering the facts of the remote host {0} ({1})..." \
+        .format(instance.public_ipv4_address,
+                instance.name)
+    log_message(logger, message, "DEBUG")
+    # Remotely Execute the Gather Node Facts Script (Single SSH Round Trip).
+    remote_command = load_node_facts_remote_command(gather_node_facts_script_file)
+    process_stdout = remotely_execute_command(key_file=instance.key_file,
+                                              username=instance.username,
+                                              public_ipv4_address=instance.public_ipv4_address,
+                                              ssh_port=instance.ssh_port,
+                                              remote_command=remote_command,
+                                              on_new_windows=False,
+                                              request_tty=False,
+                                              max_tries=max_tries,
+                                              time_between_retries_in_seconds=time_between_retries_in_seconds,
+                                              logger=logger,
+                                              logger_level="DEBUG")
+    instance_facts = parse_node_facts(process_stdout)
+    # Cache the Facts on the Inventory's Record and on the Instance Registry.
+    instance.facts = instance_facts
+    instance_registry = load_instance_registry(cluster_instances_root_folder)
+    instance_registry.set_instance_facts(instance.id, instance_facts)
+    return instance_facts
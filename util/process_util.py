@@ -3,6 +3,28 @@ from pathlib import Path
 from subprocess import PIPE, Popen
 from time import sleep
 from util.logging_util import log_message
+from util.tracing_util import trace_span
+
+# SSH Connection Sharing Options (Empty Unless Enabled by a Long-Lived Process, e.g., the Deployer).
+ssh_connection_sharing_options = ""
+
+# Commands Are Truncated to This Length in the Trace Spans' Attributes.
+trace_command_length = 200
+
+
+def enable_ssh_connection_sharing(control_sockets_folder: Path,
+                                  control_persist_in_seconds: int) -> None:
+    # Reuse One Master SSH Connection Per Remote Host, Skipping the Handshake on Subsequent Commands.
+    global ssh_connection_sharing_options
+    control_sockets_folder.mkdir(parents=True, exist_ok=True)
+    ssh_connection_sharing_options = "-o ControlMaster=auto -o ControlPath={0} -o ControlPersist={1}" \
+        .format(control_sockets_folder.joinpath("%C"),
+                control_persist_in_seconds)
+
+
+def load_rsync_remote_shell(key_file: Path) -> str:
+    # Transfers Reuse the Shared SSH Connections Too (Read at Call Time, Since the Deployer Enables Them at Runtime).
+    return " ".join(filter(None, ["ssh", ssh_connection_sharing_options, "-i", str(key_file)]))
 
 
 def launch_process(commands_string: str) -> tuple:
@@ -18,6 +40,10 @@ def launch_process(commands_string: str) -> tuple:
     return return_code, process_stdout
 
 
+def get_stdout_size_in_bytes(process_stdout: list) -> int:
+    return sum(len(line) + 1 for line in process_stdout) if process_stdout else 0
+
+
 def execute_command(command: str,
                     on_new_windows: bool,
                     max_tries: int,
@@ -33,17 +59,21 @@ def execute_command(command: str,
     current_try = 1
     return_code = None
     process_stdout = None
-    while current_try < max_tries:
-        return_code, process_stdout = launch_process(commands_string=commands_string)
-        if return_code == 0:
-            message = "The command '{0}' was successfully executed locally!".format(command)
-            log_message(logger, message, logger_level)
-            break
-        else:
-            message = "Error while trying to execute the command '{0}' locally! Retrying...".format(command)
-            log_message(logger, message, logger_level)
-            current_try = current_try + 1
-            sleep(time_between_retries_in_seconds)
+    with trace_span("local_command", command=command[:trace_command_length]) as span:
+        while current_try < max_tries:
+            return_code, process_stdout = launch_process(commands_string=commands_string)
+            if return_code == 0:
+                message = "The command '{0}' was successfully executed locally!".format(command)
+                log_message(logger, message, logger_level)
+                break
+            else:
+                message = "Error while trying to execute the command '{0}' locally! Retrying...".format(command)
+                log_message(logger, message, logger_level)
+                current_try = current_try + 1
+                sleep(time_between_retries_in_seconds)
+        span.set_attribute("retries", current_try - 1)
+        span.set_attribute("return_code", return_code)
+        span.set_attribute("bytes", get_stdout_size_in_bytes(process_stdout))
     if return_code != 0:
         message = "Fatal Error! Exiting..."
         log_message(logger, message, logger_level)
@@ -68,8 +98,9 @@ def remotely_execute_command(key_file: Path,
     tty = ""
     if request_tty:
         tty = "-t"
-    commands_string = commands_string + "ssh {0} -i {1} {2}@{3} -p {4} \"{5}\"" \
+    commands_string = commands_string + "ssh {0} {1} -i {2} {3}@{4} -p {5} \"{6}\"" \
         .format(tty,
+                ssh_connection_sharing_options,
                 key_file,
                 username,
                 public_ipv4_address,
@@ -82,21 +113,26 @@ def remotely_execute_command(key_file: Path,
     current_try = 1
     return_code = None
     process_stdout = None
-    while current_try < max_tries:
-        return_code, process_stdout = launch_process(commands_string=commands_string)
-        if return_code == 0:
-            message = "The command '{0}' was successfully executed on the remote host '{1}'!" \
-                .format(remote_command,
-                        public_ipv4_address)
-            log_message(logger, message, logger_level)
-            break
-        else:
-            message = "Error while trying to execute the command '{0}' on the remote host '{1}'! Retrying..." \
-                .format(remote_command,
-                        public_ipv4_address)
-            log_message(logger, message, logger_level)
-            current_try = current_try + 1
-            sleep(time_between_retries_in_seconds)
+    with trace_span("remote_command", host=public_ipv4_address,
+                    command=remote_command[:trace_command_length]) as span:
+        while current_try < max_tries:
+            return_code, process_stdout = launch_process(commands_string=commands_string)
+            if return_code == 0:
+                message = "The command '{0}' was successfully executed on the remote host '{1}'!" \
+                    .format(remote_command,
+                            public_ipv4_address)
+                log_message(logger, message, logger_level)
+                break
+            else:
+                message = "Error while trying to execute the command '{0}' on the remote host '{1}'! Retrying..." \
+                    .format(remote_command,
+                            public_ipv4_address)
+                log_message(logger, message, logger_level)
+                current_try = current_try + 1
+                sleep(time_between_retries_in_seconds)
+        span.set_attribute("retries", current_try - 1)
+        span.set_attribute("return_code", return_code)
+        span.set_attribute("bytes", get_stdout_size_in_bytes(process_stdout))
     if return_code != 0:
         message = "Fatal Error! Exiting..."
         log_message(logger, message, logger_level)
@@ -0,0 +1,110 @@
+from math import ceil
+
+# Shape Planner Objectives: Fastest Run, Cheapest Run, or Fastest Run Within a Per-Run Budget.
+shape_planner_objectives = ["time", "cost", "time_under_budget"]
+
+
+def get_job_runs(job_records: list,
+                 job_name: str,
+                 types_vcpus: dict) -> list:
+    # Finished Runs of the Named Job, With Their Workers' Total vCPUs (Runs on Unknown Types Are Skipped).
+    job_runs = []
+    for job_record in job_records:
+        if job_record.get("name") != job_name or job_record.get("state") != "FINISHED":
+            continue
+        worker_instance_types = job_record.get("worker_instance_types") or []
+        duration_in_seconds = job_record.get("duration_in_seconds")
+        if not worker_instance_types or not duration_in_seconds:
+            continue
+        if any(not types_vcpus.get(instance_type) for instance_type in worker_instance_types):
+            continue
+        job_runs.append({"submission_id": job_record["submission_id"],
+                         "worker_instance_types": worker_instance_types,
+                         "worker_vcpus": sum(types_vcpus[instance_type] for instance_type in worker_instance_types),
+                         "duration_in_seconds": duration_in_seconds})
+    return job_runs
+
+
+def fit_scaling_model(job_runs: list) -> dict:
+    # Amdahl-Style Model: Runtime = Serial Time + Parallel Work / Worker vCPUs (Least Squares on 1 / vCPUs).
+    # A Single Cluster Size Cannot Tell Both Terms Apart, so the Job Is Then Assumed to Scale Linearly.
+    if not job_runs:
+        raise ValueError("No finished runs to fit the scaling model!")
+    inverse_vcpus = [1 / job_run["worker_vcpus"] for job_run in job_runs]
+    durations = [job_run["duration_in_seconds"] for job_run in job_runs]
+    number_of_runs = len(job_runs)
+    mean_inverse_vcpus = sum(inverse_vcpus) / number_of_runs
+    mean_duration = sum(durations) / number_of_runs
+    variance = sum((x - mean_inverse_vcpus) ** 2 for x in inverse_vcpus)
+    if variance > 0:
+        parallel_work = sum((x - mean_inverse_vcpus) * (y - mean_duration)
+                            for x, y in zip(inverse_vcpus, durations)) / variance
+        serial_time = mean_duration - parallel_work * mean_inverse_vcpus
+    else:
+        parallel_work, serial_time = None, -1
+    if serial_time < 0:
+        # Superlinear (or Unknown) Scaling: Fit Through the Origin Instead.
+        serial_time = 0
+        parallel_work = sum(x * y for x, y in zip(inverse_vcpus, durations)) / sum(x * x for x in inverse_vcpus)
+    if parallel_work < 0:
+        # Runtime Grows With vCPUs (Noise or Overheads Dominating): Treat the Job as Non-Scaling.
+        serial_time, parallel_work = mean_duration, 0
+    residuals = [y - (serial_time + parallel_work * x) for x, y in zip(inverse_vcpus, durations)]
+    return {"serial_time_in_seconds": serial_time,
+            "parallel_work_in_vcpu_seconds": parallel_work,
+            "runs": number_of_runs,
+            "distinct_worker_vcpus": len({job_run["worker_vcpus"] for job_run in job_runs}),
+            "rms_error_in_seconds": (sum(r * r for r in residuals) / number_of_runs) ** 0.5}
+
+
+def predict_runtime_in_seconds(scaling_model: dict,
+                               worker_vcpus: int) -> float:
+    return scaling_model["serial_time_in_seconds"] + scaling_model["parallel_work_in_vcpu_seconds"] / worker_vcpus
+
+
+def recommend_cluster_shape(scaling_model: dict,
+                            candidate_types: dict,
+                            master_hourly_price: float,
+                            min_workers: int,
+                            max_workers: int,
+                            objective: str,
+                            budget_in_usd: float = None) -> list:
+    # Score Every (Type, Worker Count) Shape; Candidate Types: {Type: {'vcpus', 'hourly_price'}}.
+    # The Master's Price Is Paid for the Whole Run, Whatever the Workers' Shape.
+    if objective not in shape_planner_objectives:
+        message = "Invalid objective '{0}'! Supported objectives: {1}.".format(objective, shape_planner_objectives)
+        raise ValueError(message)
+    shapes = []
+    for instance_type, type_specs in candidate_types.items():
+        for number_of_workers in range(max(min_workers, 1), max_workers + 1):
+            runtime_in_seconds = predict_runtime_in_seconds(scaling_model, type_specs["vcpus"] * number_of_workers)
+            hourly_price = type_specs["hourly_price"] * number_of_workers + master_hourly_price
+            shapes.append({"type": instance_type,
+                           "number_of_worker_instances": number_of_workers,
+                           "worker_vcpus": type_specs["vcpus"] * number_of_workers,
+                           "predicted_runtime_in_seconds": ceil(runtime_in_seconds),
+                           "hourly_price_in_usd": round(hourly_price, 4),
+                           "predicted_cost_in_usd": round(hourly_price * runtime_in_seconds / 3600, 4)})
+    if objective == "time_under_budget":
+        shapes = [shape for shape in shapes if shape["predicted_cost_in_usd"] <= budget_in_usd]
+        if not shapes:
+            message = "No candidate shape runs the job within the budget of {0} USD!".format(budget_in_usd)
+            raise ValueError(message)
+    # Ties Go to the Other Criterion, Then to Fewer Workers (Fewer Instances to Launch and Lose).
+    if objective == "cost":
+        sort_key = (lambda shape: (shape["predicted_cost_in_usd"], shape["predicted_runtime_in_seconds"],
+                                   shape["number_of_worker_instances"]))
+    else:
+        sort_key = (lambda shape: (shape["predicted_runtime_in_seconds"], shape["predicted_cost_in_usd"],
+                                   shape["number_of_worker_instances"]))
+    return sorted(shapes, key=sort_key)
+
+
+def render_settings_section(section_name: str,
+                            raw_settings: dict,
+                            header_lines: list) -> str:
+    # Config File Section Text (Header Lines as Comments), Ready to Paste Into 'sparking_cloud.cfg'.
+    lines = ["# {0}".format(header_line) for header_line in header_lines]
+    lines.append("[{0} Settings]".format(section_name))
+    lines.extend("{0} = {1}".format(key, value) for key, value in raw_settings.items())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,170 @@
+from base64 import b64encode
+from datetime import datetime
+from json import dump, load
+from os import replace
+from pathlib import Path
+from re import compile
+from threading import Lock
+from uuid import uuid4
+
+# Spark Job Records' File Name (Stored in the Cluster's Folder, Under the Cluster Instances Root Folder).
+spark_job_records_file_name = "spark_jobs.json"
+
+# Remote Folder Holding One Subfolder Per Detached Submission (Relative to the User's Home).
+remote_spark_jobs_folder = "spark_jobs"
+
+# Application ID Pattern, as Logged by the Driver Once Connected to the Standalone Master.
+application_id_pattern = compile(r"app-\d{14}-\d{4,}")
+
+# Detached Submission Script: Runs the Driver Under 'setsid' and 'nohup', Detached From the SSH Session.
+# The Job Folder Records the Driver's PID, Its Log, Exit Code and Start/End Times (Remote Clock, Epoch Seconds).
+detached_submission_script_template = """\
+job_folder="$HOME/{remote_spark_jobs_folder}/{submission_id}"
+mkdir -p "$job_folder"
+cat > "$job_folder/run.sh" << 'SPARKING_CLOUD_JOB'
+job_folder="$(dirname "$0")"
+date +%s > "$job_folder/start_time"
+{spark_submit_command} > "$job_folder/driver.log" 2>&1
+echo $? > "$job_folder/exit_code"
+date +%s > "$job_folder/end_time"
+SPARKING_CLOUD_JOB
+cd "$HOME"
+nohup setsid bash "$job_folder/run.sh" > /dev/null 2>&1 < /dev/null &
+echo $! > "$job_folder/pid"
+echo "submitted={submission_id}"
+"""
+
+# Status Script: Prints the Submission's State as 'key=value' Lines (Single SSH Round Trip, No Blocking).
+submission_status_script_template = """\
+job_folder="$HOME/{remote_spark_jobs_folder}/{submission_id}"
+if [ ! -f "$job_folder/pid" ]; then echo "state=UNKNOWN"; exit 0; fi
+if [ -f "$job_folder/exit_code" ]; then
+  echo "exit_code=$(cat "$job_folder/exit_code")"
+  echo "end_time=$(cat "$job_folder/end_time" 2> /dev/null)"
+elif kill -0 "$(cat "$job_folder/pid")" 2> /dev/null; then
+  echo "state=RUNNING"
+else
+  echo "state=LOST"
+fi
+echo "start_time=$(cat "$job_folder/start_time" 2> /dev/null)"
+echo "application_id=$(grep -o -m 1 -E 'app-[0-9]{{14}}-[0-9]{{4,}}' "$job_folder/driver.log" 2> /dev/null)"
+"""
+
+
+def generate_submission_id() -> str:
+    return "job-{0}-{1}".format(datetime.now().strftime("%Y%m%d%H%M%S"), uuid4().hex[:6])
+
+
+def encode_remote_script(script: str) -> str:
+    # Pipe the Base64-Encoded Script to the Remote Shell (No Upload, No Quoting Issues).
+    encoded_script = b64encode(script.encode("utf-8")).decode("ascii")
+    return "echo {0} | base64 -d | bash".format(encoded_script)
+
+
+def load_detached_submission_remote_command(submission_id: str,
+                                            spark_submit_command: str) -> str:
+    return encode_remote_script(detached_submission_script_template
+                                .format(remote_spark_jobs_folder=remote_spark_jobs_folder,
+                                        submission_id=submission_id,
+                                        spark_submit_command=spark_submit_command))
+
+
+def load_submission_status_remote_command(submission_id: str) -> str:
+    return encode_remote_script(submission_status_script_template
+                                .format(remote_spark_jobs_folder=remote_spark_jobs_folder,
+                                        submission_id=submission_id))
+
+
+def parse_submission_status(process_stdout: list) -> dict:
+    # Derive the Submission's State (RUNNING, FINISHED, FAILED, LOST or UNKNOWN), Exit Code and Duration.
+    raw_status = {}
+    for line in process_stdout:
+        for status_line in line.splitlines():
+            if "=" in status_line:
+                key, value = status_line.split("=", 1)
+                raw_status[key.strip()] = value.strip()
+    exit_code = int(raw_status["exit_code"]) if raw_status.get("exit_code", "").lstrip("-").isdigit() else None
+    start_time = int(raw_status["start_time"]) if raw_status.get("start_time", "").isdigit() else None
+    end_time = int(raw_status["end_time"]) if raw_status.get("end_time", "").isdigit() else None
+    state = raw_status.get("state")
+    if exit_code is not None:
+        state = "FINISHED" if exit_code == 0 else "FAILED"
+    duration_in_seconds = end_time - start_time if start_time is not None and end_time is not None else None
+    application_id_match = application_id_pattern.search(raw_status.get("application_id", ""))
+    return {"state": state,
+            "exit_code": exit_code,
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration_in_seconds": duration_in_seconds,
+            "application_id": application_id_match.group(0) if application_id_match else None}
+
+
+def is_submission_done(submission_state: str) -> bool:
+    return submission_state in ["FINISHED", "FAILED", "LOST", "UNKNOWN"]
+
+
+class SparkJobRecords:
+
+    def __init__(self,
+                 records_file: Path) -> None:
+        self.records_file = records_file
+        self.records_lock = Lock()
+        # Spark Job Records, In Submission Order ({Submission ID: Record Dict}).
+        self.records = self.read_records_file()
+
+    def read_records_file(self) -> dict:
+        records = {}
+        if self.records_file.is_file():
+            try:
+                with open(file=self.records_file, mode="r", encoding="utf-8") as records_file:
+                    records = load(records_file)
+            except ValueError:
+                # Corrupted Records File, Rewritten on the Next Update.
+                records = {}
+        return records
+
+    def write_records_file(self) -> None:
+        # Write to a Temporary File First, so Readers Never See Partially Written Records.
+        temporary_records_file = self.records_file.with_name(self.records_file.name + ".tmp")
+        with open(file=temporary_records_file, mode="w", encoding="utf-8") as records_file:
+            dump(self.records, records_file, indent=4)
+        replace(temporary_records_file, self.records_file)
+
+    def add_job(self,
+                job_record: dict) -> None:
+        with self.records_lock:
+            self.records[job_record["submission_id"]] = dict(job_record)
+            self.write_records_file()
+
+    def update_job(self,
+                   submission_id: str,
+                   job_fields: dict) -> dict:
+        with self.records_lock:
+            self.records[submission_id].update(job_fields)
+            self.write_records_file()
+            return dict(self.records[submission_id])
+
+    def get_job(self,
+                submission_id: str) -> dict:
+        with self.records_lock:
+            job_record = self.records.get(submission_id)
+            return dict(job_record) if job_record else None
+
+    def get_jobs(self) -> list:
+        with self.records_lock:
+            return [dict(job_record) for job_record in self.records.values()]
+
+
+# SparkJobRecords Objects Pool (One Per Cluster, Shared Across Tasks and Stages).
+spark_job_records_pool = {}
+spark_job_records_pool_lock = Lock()
+
+
+def load_spark_job_records(cluster_instances_root_folder: Path,
+                           cluster_name: str) -> SparkJobRecords:
+    with spark_job_records_pool_lock:
+        records_file = Path(cluster_instances_root_folder).joinpath(cluster_name, spark_job_records_file_name)
+        if records_file not in spark_job_records_pool:
+            records_file.parent.mkdir(parents=True, exist_ok=True)
+            spark_job_records_pool[records_file] = SparkJobRecords(records_file)
+        return spark_job_records_pool[records_file]
@@ -0,0 +1,61 @@
+from json import loads
+from time import monotonic, sleep
+from urllib.error import URLError
+from urllib.request import urlopen
+
+
+def fetch_spark_master_status(master_address: str,
+                              master_webui_port: int,
+                              timeout_in_seconds: float = 5) -> dict:
+    # The Master Web UI Serves Its Status (Workers, Cores, Memory, Applications) as JSON.
+    master_status_url = "http://{0}:{1}/json/".format(master_address, master_webui_port)
+    with urlopen(master_status_url, timeout=timeout_in_seconds) as response:
+        return loads(response.read().decode("utf-8"))
+
+
+def get_alive_workers(master_status: dict) -> list:
+    return [worker for worker in master_status.get("workers", []) if worker.get("state") == "ALIVE"]
+
+
+def get_worker_addresses(worker: dict) -> set:
+    # A Registered Worker Is Identified by Its Host and by Its Web UI Address' Host.
+    return {worker.get("host"), worker.get("webuiaddress", "").split("//")[-1].split(":")[0]}
+
+
+def get_missing_workers(master_status: dict,
+                        expected_workers: dict) -> list:
+    # Expected Workers: {Worker Name: [Addresses the Worker May Register With]}.
+    registered_addresses = set()
+    for worker in get_alive_workers(master_status):
+        registered_addresses.update(get_worker_addresses(worker))
+    return [worker_name for worker_name, worker_addresses in expected_workers.items()
+            if not registered_addresses.intersection(worker_addresses)]
+
+
+def wait_for_spark_workers_registration(master_address: str,
+                                        master_webui_port: int,
+                                        expected_workers: dict,
+                                        expected_cores: int,
+                                        expected_memory_in_mb: int,
+                                        timeout_in_seconds: int,
+                                        poll_interval_in_seconds: float) -> tuple:
+    # Poll the Master Until the Expected Workers, Cores and Memory Are Registered or the Deadline Passes.
+    # Returns Whether Registration Completed, the Last Master Status and the Missing Workers' Names.
+    deadline = monotonic() + timeout_in_seconds
+    master_status = {}
+    while True:
+        try:
+            master_status = fetch_spark_master_status(master_address, master_webui_port)
+        except (URLError, OSError, ValueError):
+            # The Master Is Not Serving Its Status Yet.
+            master_status = {}
+        alive_workers = get_alive_workers(master_status)
+        registered_cores = sum(worker.get("cores", 0) for worker in alive_workers)
+        registered_memory_in_mb = sum(worker.get("memory", 0) for worker in alive_workers)
+        if len(alive_workers) >= len(expected_workers) \
+                and registered_cores >= expected_cores \
+                and registered_memory_in_mb >= expected_memory_in_mb:
+            return True, master_status, []
+        if monotonic() >= deadline:
+            return False, master_status, get_missing_workers(master_status, expected_workers)
+        sleep(poll_interval_in_seconds)
@@ -0,0 +1,139 @@
+from hashlib import sha256
+from json import dumps, loads
+from pathlib import Path
+from typing import Any
+from util.event_log_util import read_event_log_lines
+
+# Per-Task Metrics Columns Read From the Event Log (Times in Milliseconds, Sizes in Bytes).
+task_metrics_columns = ["stage_id", "host_index", "launch_time", "duration", "executor_run_time",
+                        "executor_cpu_time", "gc_time", "input_bytes", "shuffle_read_bytes", "shuffle_fetch_wait_time",
+                        "shuffle_write_bytes", "memory_spilled_bytes", "disk_spilled_bytes"]
+
+
+def load_numpy() -> Any:
+    # NumPy Is Only Needed to Collect the Jobs' Metrics (Optional Dependency, Imported on First Use).
+    try:
+        import numpy
+    except ImportError:
+        message = "Collecting the jobs' metrics requires the 'numpy' package!"
+        raise ValueError(message)
+    return numpy
+
+
+def get_config_hash(spark_properties: dict,
+                    instance_types_list: list) -> str:
+    # Jobs Run With the Same Spark Properties on the Same Instance Types Share a Config Hash.
+    config = {"spark_properties": {key: str(value) for key, value in spark_properties.items()},
+              "instance_types": sorted(instance_types_list)}
+    return sha256(dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def parse_event_log(event_log_file: Path) -> dict:
+    # Read the Application's Event Log (One JSON Event Per Line) Into Columnar Task Metrics.
+    np = load_numpy()
+    columns = {column: [] for column in task_metrics_columns}
+    hosts = []
+    executor_cores = {}
+    application_start_time = application_end_time = None
+    for line in read_event_log_lines(event_log_file):
+        if not line.strip():
+            continue
+        event = loads(line)
+        event_type = event.get("Event")
+        if event_type == "SparkListenerApplicationStart":
+            application_start_time = event.get("Timestamp")
+        elif event_type == "SparkListenerApplicationEnd":
+            application_end_time = event.get("Timestamp")
+        elif event_type == "SparkListenerExecutorAdded":
+            executor_cores[event.get("Executor ID")] = event.get("Executor Info", {}).get("Total Cores", 0)
+        elif event_type == "SparkListenerTaskEnd" and event.get("Task Metrics"):
+            task_info = event["Task Info"]
+            task_metrics = event["Task Metrics"]
+            shuffle_read_metrics = task_metrics.get("Shuffle Read Metrics", {})
+            shuffle_write_metrics = task_metrics.get("Shuffle Write Metrics", {})
+            if task_info["Host"] not in hosts:
+                hosts.append(task_info["Host"])
+            columns["stage_id"].append(event["Stage ID"])
+            columns["host_index"].append(hosts.index(task_info["Host"]))
+            columns["launch_time"].append(task_info["Launch Time"])
+            columns["duration"].append(task_info["Finish Time"] - task_info["Launch Time"])
+            columns["executor_run_time"].append(task_metrics.get("Executor Run Time", 0))
+            # The Executor CPU Time Is Logged in Nanoseconds.
+            columns["executor_cpu_time"].append(task_metrics.get("Executor CPU Time", 0) // 1000000)
+            columns["gc_time"].append(task_metrics.get("JVM GC Time", 0))
+            columns["input_bytes"].append(task_metrics.get("Input Metrics", {}).get("Bytes Read", 0))
+            columns["shuffle_read_bytes"].append(shuffle_read_metrics.get("Remote Bytes Read", 0)
+                                                 + shuffle_read_metrics.get("Local Bytes Read", 0))
+            columns["shuffle_fetch_wait_time"].append(shuffle_read_metrics.get("Fetch Wait Time", 0))
+            columns["shuffle_write_bytes"].append(shuffle_write_metrics.get("Shuffle Bytes Written", 0))
+            columns["memory_spilled_bytes"].append(task_metrics.get("Memory Bytes Spilled", 0))
+            columns["disk_spilled_bytes"].append(task_metrics.get("Disk Bytes Spilled", 0))
+    job_metrics = {column: np.array(values, dtype=np.int64) for column, values in columns.items()}
+    job_metrics["hosts"] = np.array(hosts, dtype=np.str_)
+    job_metrics["executor_cores"] = np.int64(sum(executor_cores.values()))
+    application_duration = application_end_time - application_start_time \
+        if application_start_time and application_end_time else 0
+    job_metrics["application_duration"] = np.int64(application_duration)
+    return job_metrics
+
+
+def save_job_metrics(metrics_file: Path,
+                     job_metrics: dict) -> None:
+    np = load_numpy()
+    Path(metrics_file).parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(metrics_file, **job_metrics)
+
+
+def load_job_metrics(metrics_file: Path) -> dict:
+    np = load_numpy()
+    with np.load(metrics_file) as job_metrics:
+        return {column: job_metrics[column] for column in job_metrics.files}
+
+
+def summarize_job_metrics(job_metrics: dict) -> dict:
+    # Aggregate the Task Metrics Columns (Vectorized, No Per-Task Python Loop).
+    np = load_numpy()
+    durations = job_metrics["duration"]
+    stage_ids = job_metrics["stage_id"]
+    host_indexes = job_metrics["host_index"]
+    number_of_hosts = len(job_metrics["hosts"])
+    # Stage Skew: Slowest Task Over the Median Task, Per Stage.
+    stages_skew = {}
+    if durations.size:
+        stages, stage_positions = np.unique(stage_ids, return_inverse=True)
+        order = np.lexsort((durations, stage_positions))
+        stage_starts = np.searchsorted(stage_positions[order], np.arange(stages.size))
+        stage_sizes = np.bincount(stage_positions, minlength=stages.size)
+        sorted_durations = durations[order]
+        max_durations = sorted_durations[stage_starts + stage_sizes - 1]
+        median_durations = (sorted_durations[stage_starts + (stage_sizes - 1) // 2]
+                            + sorted_durations[stage_starts + stage_sizes // 2]) / 2
+        stages_skew = {int(stage): round(float(skew), 2) for stage, skew
+                       in zip(stages, max_durations / np.maximum(median_durations, 1))}
+    # Shuffle Per Node.
+    shuffle_read_per_host = np.bincount(host_indexes, weights=job_metrics["shuffle_read_bytes"],
+                                        minlength=number_of_hosts)
+    shuffle_write_per_host = np.bincount(host_indexes, weights=job_metrics["shuffle_write_bytes"],
+                                         minlength=number_of_hosts)
+    # Executor Utilization: Task Time Over the Executors' Core Time During the Application.
+    total_executor_run_time = int(job_metrics["executor_run_time"].sum())
+    executor_core_time = int(job_metrics["executor_cores"]) * int(job_metrics["application_duration"])
+    return {"tasks": int(durations.size),
+            "stages": len(stages_skew),
+            "total_cpu_time_in_ms": int(job_metrics["executor_cpu_time"].sum()),
+            "total_executor_run_time_in_ms": total_executor_run_time,
+            "gc_time_fraction": round(float(job_metrics["gc_time"].sum()) / max(total_executor_run_time, 1), 4),
+            "executor_utilization": round(total_executor_run_time / executor_core_time, 4)
+            if executor_core_time else None,
+            "input_bytes": int(job_metrics["input_bytes"].sum()),
+            "shuffle_read_bytes": int(job_metrics["shuffle_read_bytes"].sum()),
+            "shuffle_write_bytes": int(job_metrics["shuffle_write_bytes"].sum()),
+            "shuffle_fetch_wait_time_in_ms": int(job_metrics["shuffle_fetch_wait_time"].sum()),
+            "memory_spilled_bytes": int(job_metrics["memory_spilled_bytes"].sum()),
+            "disk_spilled_bytes": int(job_metrics["disk_spilled_bytes"].sum()),
+            "max_stage_skew": max(stages_skew.values(), default=None),
+            "stages_skew": stages_skew,
+            "shuffle_read_bytes_per_host": {str(host): int(bytes_read) for host, bytes_read
+                                            in zip(job_metrics["hosts"], shuffle_read_per_host)},
+            "shuffle_write_bytes_per_host": {str(host): int(bytes_written) for host, bytes_written
+                                             in zip(job_metrics["hosts"], shuffle_write_per_host)}}
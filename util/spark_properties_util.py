@@ -0,0 +1,30 @@
+from pathlib import Path
+from re import compile
+
+# Spark Properties File Line Pattern ('key = value', 'key=value' or 'key value').
+property_pattern = compile(r"^\s*([^#!\s=:]+)\s*(?:[=:]\s*|\s+)(.*?)\s*$")
+
+
+def read_spark_properties_file(properties_file: Path) -> dict:
+    # Read the Properties in File Order, Skipping Comments and Blank Lines.
+    properties = {}
+    with open(file=properties_file, mode="r", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip() or line.lstrip().startswith(("#", "!")):
+                continue
+            property_match = property_pattern.match(line)
+            if property_match:
+                key, value = property_match.groups()
+                properties[key] = value
+    return properties
+
+
+def write_spark_properties_file(properties_file: Path,
+                                properties: dict,
+                                comments: list) -> None:
+    Path(properties_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(file=properties_file, mode="w", encoding="utf-8") as file:
+        for comment in comments:
+            file.write("# {0}\n".format(comment))
+        for key, value in properties.items():
+            file.write("{0} = {1}\n".format(key, value))
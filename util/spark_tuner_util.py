@@ -0,0 +1,192 @@
+from math import ceil
+
+# Minimum Executor Memory Overhead Applied by Spark (In Megabytes).
+min_executor_memory_overhead_in_mb = 384
+
+# Spark's Cloud Committer Bindings (Required by the S3A Committers).
+spark_hadoop_cloud_package = "org.apache.spark:spark-hadoop-cloud_2.12:{spark_version}"
+
+
+def get_worker_reserved_memory_in_kb(memory_in_kb: int,
+                                     tuning_settings: dict) -> int:
+    # Memory Left to the OS and to the Hadoop/Spark Daemons (Fraction of the Node's Memory, With a Floor).
+    reserved_memory_in_kb = int(memory_in_kb * tuning_settings["reserved_memory_fraction"])
+    min_reserved_memory_in_kb = tuning_settings["min_reserved_memory_in_mb"] * 1024
+    return min(max(reserved_memory_in_kb, min_reserved_memory_in_kb), memory_in_kb // 2)
+
+
+def get_worker_available_memory_in_kb(memory_in_kb: int,
+                                      tuning_settings: dict) -> int:
+    return memory_in_kb - get_worker_reserved_memory_in_kb(memory_in_kb, tuning_settings)
+
+
+def get_worker_available_cores(vcpus: int,
+                               tuning_settings: dict) -> int:
+    return max(vcpus - tuning_settings["reserved_cores_per_worker"], 1)
+
+
+def choose_executor_cores(available_cores: int,
+                          max_executor_cores: int) -> int:
+    # Pick the Largest Executor Size Wasting the Fewest Available Cores (Single-Core Executors Only If Forced).
+    if available_cores < 2 or max_executor_cores < 2:
+        return 1
+    candidate_executor_cores = range(2, min(available_cores, max_executor_cores) + 1)
+    return min(candidate_executor_cores,
+               key=lambda executor_cores: (available_cores % executor_cores, -executor_cores))
+
+
+def tune_dynamic_allocation(total_executors: int,
+                            tuning_settings: dict) -> tuple:
+    # Let Each Job Scale Its Executors With Its Demand: Up to the Whole Cluster, Starting From Its Fair Share of
+    # the Concurrent Jobs, Releasing Them When Idle. Returns the Spark Properties and the Reasoning.
+    max_concurrent_jobs = max(tuning_settings["job_queue_max_concurrent_jobs"], 1)
+    initial_executors = max(total_executors // max_concurrent_jobs, 1)
+    idle_timeout_in_seconds = tuning_settings["dynamic_allocation_idle_timeout_in_seconds"]
+    cached_idle_timeout_in_seconds = tuning_settings["dynamic_allocation_cached_idle_timeout_in_seconds"]
+    properties = {"spark.dynamicAllocation.enabled": "true",
+                  "spark.dynamicAllocation.minExecutors": "0",
+                  "spark.dynamicAllocation.initialExecutors": str(initial_executors),
+                  "spark.dynamicAllocation.maxExecutors": str(total_executors),
+                  "spark.dynamicAllocation.executorIdleTimeout": "{0}s".format(idle_timeout_in_seconds),
+                  "spark.dynamicAllocation.cachedExecutorIdleTimeout": "{0}s".format(cached_idle_timeout_in_seconds)}
+    if tuning_settings["enable_external_shuffle_service"]:
+        # Shuffle Files Are Served by the Workers' Shuffle Service, so Removed Executors Lose Nothing.
+        properties.update({"spark.shuffle.service.enabled": "true",
+                           "spark.shuffle.service.port": str(tuning_settings["shuffle_service_port"])})
+        shuffle_files = "served by the workers' external shuffle service"
+    else:
+        # Without the Shuffle Service, Executors Holding Shuffle Data Are Kept Until It Is No Longer Needed.
+        properties["spark.dynamicAllocation.shuffleTracking.enabled"] = "true"
+        shuffle_files = "tracked (executors holding them are kept)"
+    explanation = ["Dynamic allocation: 0 to {0} executor(s) per job, starting with {1} ({0} executor(s) / {2} "
+                   "concurrent job(s)), released after {3} s idle ({4} s if caching data); shuffle files {5}."
+                   .format(total_executors,
+                           initial_executors,
+                           max_concurrent_jobs,
+                           idle_timeout_in_seconds,
+                           cached_idle_timeout_in_seconds,
+                           shuffle_files)]
+    return properties, explanation
+
+
+def tune_executor_layout(workers_specs_list: list,
+                         tuning_settings: dict) -> tuple:
+    # Derive a Uniform Executor Layout That Fits on Every Worker (Sized by the Smallest One).
+    # Each Worker Spec Holds Its 'vcpus' and 'memory_in_kb'. Returns the Spark Properties and the Reasoning.
+    explanation = []
+    workers_available_cores = [get_worker_available_cores(worker_specs["vcpus"], tuning_settings)
+                               for worker_specs in workers_specs_list]
+    workers_available_memory_in_kb = [get_worker_available_memory_in_kb(worker_specs["memory_in_kb"], tuning_settings)
+                                      for worker_specs in workers_specs_list]
+    explanation.append("{0} worker(s): {1} vCPUs and {2} MB of memory in total."
+                       .format(len(workers_specs_list),
+                               sum(worker_specs["vcpus"] for worker_specs in workers_specs_list),
+                               sum(worker_specs["memory_in_kb"] for worker_specs in workers_specs_list) // 1024))
+    explanation.append("Reserved per worker for the OS and daemons: {0} core(s) and max({1:.0%} of memory, {2} MB)."
+                       .format(tuning_settings["reserved_cores_per_worker"],
+                               tuning_settings["reserved_memory_fraction"],
+                               tuning_settings["min_reserved_memory_in_mb"]))
+    # Executor Cores.
+    smallest_worker_available_cores = min(workers_available_cores)
+    executor_cores = choose_executor_cores(smallest_worker_available_cores,
+                                           tuning_settings["max_executor_cores"])
+    explanation.append("Executor cores = {0} (the smallest worker offers {1} core(s), at most {2} per executor, "
+                       "fewest idle cores)."
+                       .format(executor_cores,
+                               smallest_worker_available_cores,
+                               tuning_settings["max_executor_cores"]))
+    # Executors Per Worker and Executor Memory (Heap + Overhead).
+    workers_executors = [max(available_cores // executor_cores, 1) for available_cores in workers_available_cores]
+    executor_total_memory_in_mb = min(available_memory_in_kb // executors // 1024
+                                      for available_memory_in_kb, executors
+                                      in zip(workers_available_memory_in_kb, workers_executors))
+    overhead_fraction = tuning_settings["executor_memory_overhead_fraction"]
+    executor_memory_overhead_in_mb = max(min_executor_memory_overhead_in_mb,
+                                         ceil(executor_total_memory_in_mb * overhead_fraction
+                                              / (1 + overhead_fraction)))
+    executor_memory_in_mb = max(executor_total_memory_in_mb - executor_memory_overhead_in_mb, 1)
+    explanation.append("Executors per worker = {0} (available cores / executor cores)."
+                       .format(sorted(set(workers_executors))))
+    explanation.append("Executor memory = {0} MB of heap + {1} MB of overhead (available memory of the tightest "
+                       "worker / its executors = {2} MB, overhead = max({3} MB, {4:.0%} of the heap))."
+                       .format(executor_memory_in_mb,
+                               executor_memory_overhead_in_mb,
+                               executor_total_memory_in_mb,
+                               min_executor_memory_overhead_in_mb,
+                               overhead_fraction))
+    # Cluster-Wide Parallelism.
+    total_executors = sum(workers_executors)
+    total_executor_cores = total_executors * executor_cores
+    parallelism = total_executor_cores * tuning_settings["parallelism_per_core"]
+    explanation.append("{0} executor(s) x {1} core(s) = {2} task slot(s); parallelism and shuffle partitions = "
+                       "{3} ({4} per slot)."
+                       .format(total_executors,
+                               executor_cores,
+                               total_executor_cores,
+                               parallelism,
+                               tuning_settings["parallelism_per_core"]))
+    properties = {"spark.cores.max": str(total_executor_cores),
+                  "spark.executor.cores": str(executor_cores),
+                  "spark.executor.memory": "{0}m".format(executor_memory_in_mb),
+                  "spark.executor.memoryOverhead": "{0}m".format(executor_memory_overhead_in_mb),
+                  "spark.default.parallelism": str(parallelism),
+                  "spark.sql.shuffle.partitions": str(parallelism)}
+    if tuning_settings["enable_dynamic_allocation"]:
+        dynamic_allocation_properties, dynamic_allocation_explanation = tune_dynamic_allocation(total_executors,
+                                                                                                tuning_settings)
+        properties.update(dynamic_allocation_properties)
+        explanation.extend(dynamic_allocation_explanation)
+    return properties, explanation
+
+
+def tune_s3a_properties(spark_properties: dict,
+                        tuning_settings: dict) -> tuple:
+    # S3A Throughput Profile: a Zero-Rename Committer, Buffered Multipart Uploads, and Connection and Thread Pools
+    # Sized to the Executor's Concurrent Tasks. Returns the Spark Properties and the Reasoning.
+    executor_cores = max(int(spark_properties.get("spark.executor.cores", "1")), 1)
+    threads_max = executor_cores * tuning_settings["s3a_threads_per_executor_core"]
+    # Every Thread Holds a Connection, Plus the Tasks' Own Reads (Input Streams) Beside the Uploads.
+    connection_maximum = threads_max + executor_cores * 2
+    committer = tuning_settings["s3a_committer"]
+    upload_buffer = tuning_settings["s3a_fast_upload_buffer"]
+    multipart_size = tuning_settings["s3a_multipart_size"]
+    input_fadvise = tuning_settings["s3a_input_fadvise"]
+    readahead_range = tuning_settings["s3a_readahead_range"]
+    spark_hadoop_cloud = spark_hadoop_cloud_package.format(spark_version=tuning_settings["spark_version"])
+    spark_jars_packages = [package.strip() for package in spark_properties.get("spark.jars.packages", "").split(",")
+                           if package.strip()]
+    if spark_hadoop_cloud not in spark_jars_packages:
+        spark_jars_packages.append(spark_hadoop_cloud)
+    properties = {"spark.jars.packages": ",".join(spark_jars_packages),
+                  "spark.hadoop.fs.s3a.committer.name": committer,
+                  "spark.hadoop.fs.s3a.committer.magic.enabled": "true" if committer == "magic" else "false",
+                  "spark.hadoop.fs.s3a.committer.threads": str(threads_max),
+                  "spark.hadoop.mapreduce.outputcommitter.factory.scheme.s3a":
+                      "org.apache.hadoop.fs.s3a.commit.S3ACommitterFactory",
+                  "spark.sql.sources.commitProtocolClass":
+                      "org.apache.spark.internal.io.cloud.PathOutputCommitProtocol",
+                  "spark.sql.parquet.output.committer.class":
+                      "org.apache.spark.internal.io.cloud.BindingParquetOutputCommitter",
+                  "spark.hadoop.fs.s3a.fast.upload": "true",
+                  "spark.hadoop.fs.s3a.fast.upload.buffer": upload_buffer,
+                  "spark.hadoop.fs.s3a.multipart.size": multipart_size,
+                  "spark.hadoop.fs.s3a.multipart.threshold": multipart_size,
+                  "spark.hadoop.fs.s3a.threads.max": str(threads_max),
+                  "spark.hadoop.fs.s3a.max.total.tasks": str(threads_max),
+                  "spark.hadoop.fs.s3a.connection.maximum": str(connection_maximum),
+                  "spark.hadoop.fs.s3a.experimental.input.fadvise": input_fadvise,
+                  "spark.hadoop.fs.s3a.readahead.range": readahead_range}
+    explanation = ["S3A: '{0}' committer{1}, uploads buffered on {2} in {3} parts, {4} thread(s) and {5} "
+                   "connection(s) per executor ({6} core(s) x {7} thread(s), plus 2 reads per core), '{8}' input "
+                   "policy with a {9} readahead."
+                   .format(committer,
+                           " (stages through the cluster file system, e.g., HDFS)" if committer == "directory" else "",
+                           "the local disk" if upload_buffer == "disk" else "the heap",
+                           multipart_size,
+                           threads_max,
+                           connection_maximum,
+                           executor_cores,
+                           tuning_settings["s3a_threads_per_executor_core"],
+                           input_fadvise,
+                           readahead_range)]
+    return properties, explanation
@@ -1,104 +1,110 @@
 from configparser import ConfigParser
+from hashlib import sha256
 from itertools import groupby
+from json import dumps, loads
 from operator import itemgetter
+from os import getpid, replace
 from pathlib import Path
-from re import findall
 
 from cloud_manager.ec2_manager import EC2Manager
 from util.config_parser_util import parse_config_section
+from util.config_schema_util import aws_settings_schema, cluster_settings_schema, config_schema_version, \
+    configuration_rules_settings_schema, general_settings_schema, instances_settings_schema, \
+    logging_settings_schema
+from util.os_util import check_if_file_exists, remove_file
 
 
 def parse_sparking_cloud_config_file(config_parser: ConfigParser) -> dict:
     sparking_cloud_settings_dict = dict()
+    errors_list = []
     # Parse 'General Settings'.
-    general_settings = parse_config_section(config_parser, "General Settings")
+    general_settings = parse_config_section(config_parser,
+                                            "General Settings",
+                                            general_settings_schema,
+                                            errors_list)
     sparking_cloud_settings_dict.update({"general_settings": general_settings})
     # If Logging is Enabled...
-    if general_settings["enable_logging"]:
+    if general_settings.get("enable_logging"):
         # Parse 'Logging Settings'.
-        logging_settings = parse_config_section(config_parser, "Logging Settings")
+        logging_settings = parse_config_section(config_parser,
+                                                "Logging Settings",
+                                                logging_settings_schema,
+                                                errors_list)
         sparking_cloud_settings_dict.update({"logging_settings": logging_settings})
-    # Parse 'Clusters Settings'.
+    # Parse 'Clusters Settings' and Their Referenced 'Instances Settings'.
     clusters_settings = []
-    for cluster_name in general_settings["cluster_names"]:
+    instances_settings = {}
+    for cluster_name in general_settings.get("cluster_names", []):
         cluster_dict = {"cluster_name": cluster_name}
-        cluster_name_settings = parse_config_section(config_parser, cluster_name + " Settings")
+        cluster_name_settings = parse_config_section(config_parser,
+                                                     cluster_name + " Settings",
+                                                     cluster_settings_schema,
+                                                     errors_list)
         for setting in cluster_name_settings:
             cluster_dict.update({setting: cluster_name_settings[setting]})
         clusters_settings.append(cluster_dict)
+        for instances_settings_name in cluster_name_settings.get("master_instances_settings", []) + \
+                cluster_name_settings.get("worker_instances_settings", []):
+            if instances_settings_name not in instances_settings:
+                instances_settings[instances_settings_name] = \
+                    parse_config_section(config_parser,
+                                         instances_settings_name + " Settings",
+                                         instances_settings_schema,
+                                         errors_list)
     sparking_cloud_settings_dict.update({"clusters_settings": clusters_settings})
+    sparking_cloud_settings_dict.update({"instances_settings": instances_settings})
     # Parse 'AWS Settings'.
-    aws_settings = parse_config_section(config_parser, "AWS Settings")
+    aws_settings = parse_config_section(config_parser,
+                                        "AWS Settings",
+                                        aws_settings_schema,
+                                        errors_list)
     sparking_cloud_settings_dict.update({"aws_settings": aws_settings})
     # Parse 'Configuration Rules Settings'.
-    configuration_rules_settings = parse_config_section(config_parser,
-                                                        general_settings["configuration_rules"] + " Settings")
-    sparking_cloud_settings_dict.update({"configuration_rules_settings": configuration_rules_settings})
+    if "configuration_rules" in general_settings:
+        configuration_rules_settings = parse_config_section(config_parser,
+                                                            general_settings["configuration_rules"] + " Settings",
+                                                            configuration_rules_settings_schema,
+                                                            errors_list)
+        sparking_cloud_settings_dict.update({"configuration_rules_settings": configuration_rules_settings})
+    # Fail Before Doing Anything (e.g., Launching Instances) if the Config File is Invalid.
+    if errors_list:
+        message = "The Sparking Cloud's config file is invalid:\n  - {0}".format("\n  - ".join(errors_list))
+        raise ValueError(message)
     return sparking_cloud_settings_dict
 
 
-def get_number_of_instances_appended_to_file(instances_file: Path) -> int:
-    instances_list_parser = ConfigParser()
-    instances_list_parser.optionxform = str
-    instances_list_parser.read(filenames=instances_file,
-                               encoding="utf-8")
-    number_of_instances_appended_to_file = 0
-    for section in instances_list_parser.sections():
-        if "Instance" in section:
-            number_of_instances_appended_to_file += 1
-    del instances_list_parser
-    return number_of_instances_appended_to_file
-
-
-def append_instance_dict_to_file(instance_dict: dict,
-                                 instances_file: Path) -> None:
-    instances_file_parents_path = findall("(.*/)", str(instances_file))
-    if instances_file_parents_path:
-        Path(instances_file_parents_path[0]).mkdir(parents=True, exist_ok=True)
-    instance_number = get_number_of_instances_appended_to_file(instances_file) + 1
-    with open(file=instances_file, mode="a", encoding="utf-8") as instances_file:
-        instances_file.write("[Instance {0}]\n".format(instance_number))
-        instances_file.write("provider = {0}\n".format(instance_dict["provider"]))
-        instances_file.write("name = {0}\n".format(instance_dict["name"]))
-        instances_file.write("id = {0}\n".format(instance_dict["id"]))
-        instances_file.write("type = {0}\n".format(instance_dict["type"]))
-        instances_file.write("market_type = {0}\n".format(instance_dict["market_type"]))
-        instances_file.write("key_name = {0}\n".format(instance_dict["key_name"]))
-        instances_file.write("username = {0}\n".format(instance_dict["username"]))
-        instances_file.write("public_ipv4_address = {0}\n".format(instance_dict["public_ipv4_address"]))
-        instances_file.write("ssh_port = {0}\n".format(instance_dict["ssh_port"]))
-        instances_file.write("\n")
-
-
-def read_instances_file(instances_file: Path) -> list:
-    instances_list_parser = ConfigParser()
-    instances_list_parser.optionxform = str
-    instances_list_parser.read(filenames=instances_file,
-                               encoding="utf-8")
-    instances_list = []
-    for section in instances_list_parser.sections():
-        if "Instance" in section:
-            instance_provider = instances_list_parser.get(section, "provider")
-            instance_name = instances_list_parser.get(section, "name")
-            instance_id = instances_list_parser.get(section, "id")
-            instance_type = instances_list_parser.get(section, "type")
-            instance_market_type = instances_list_parser.get(section, "market_type")
-            instance_key_name = instances_list_parser.get(section, "key_name")
-            instance_username = instances_list_parser.get(section, "username")
-            instance_public_ipv4_address = instances_list_parser.get(section, "public_ipv4_address")
-            instance_ssh_port = instances_list_parser.get(section, "ssh_port")
-            instance_dict = {"provider": instance_provider,
-                             "name": instance_name,
-                             "id": instance_id,
-                             "type": instance_type,
-                             "market_type": instance_market_type,
-                             "key_name": instance_key_name,
-                             "username": instance_username,
-                             "public_ipv4_address": instance_public_ipv4_address,
-                             "ssh_port": instance_ssh_port}
-            instances_list.append(instance_dict)
-    del instances_list_parser
-    return instances_list
+def load_sparking_cloud_config_file(sparking_cloud_config_file: Path) -> dict:
+    # Load the Validated Settings From the Cache, Unless the Config File (or the Schema) Has Changed.
+    config_file_bytes = sparking_cloud_config_file.read_bytes()
+    cache_key = {"schema_version": config_schema_version,
+                 "mtime_ns": sparking_cloud_config_file.stat().st_mtime_ns,
+                 "sha256": sha256(config_file_bytes).hexdigest()}
+    cache_file = sparking_cloud_config_file.parent.joinpath("." + sparking_cloud_config_file.name + ".cache.json")
+    if check_if_file_exists(cache_file):
+        try:
+            cached_settings = loads(cache_file.read_text(encoding="utf-8"))
+            if cached_settings["key"] == cache_key:
+                return cached_settings["settings"]
+        except (ValueError, KeyError):
+            # Corrupted or Outdated Cache File: Parse the Config File Again.
+            pass
+    # Parse and Validate the Config File.
+    config_parser = ConfigParser()
+    config_parser.optionxform = str
+    config_parser.read_string(config_file_bytes.decode("utf-8"),
+                              source=str(sparking_cloud_config_file))
+    sparking_cloud_settings_dict = parse_sparking_cloud_config_file(config_parser)
+    del config_parser
+    # Atomically Store the Validated Settings on the Cache File.
+    temporary_cache_file = cache_file.with_name(cache_file.name + ".{0}.tmp".format(getpid()))
+    try:
+        temporary_cache_file.write_text(dumps({"key": cache_key, "settings": sparking_cloud_settings_dict}),
+                                        encoding="utf-8")
+        replace(temporary_cache_file, cache_file)
+    except OSError:
+        # Read-Only Config Folder: Skip Caching.
+        remove_file(temporary_cache_file)
+    return sparking_cloud_settings_dict
 
 
 def generate_cluster_instances_summary(instances_list: list,
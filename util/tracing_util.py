@@ -0,0 +1,221 @@
+from json import dump
+from os import getpid
+from pathlib import Path
+from threading import Lock, get_ident, local
+from time import perf_counter, time
+from typing import Any
+
+# Attributes a Span Inherits From Its Enclosing Span (Same Thread), Unless Set Explicitly.
+inherited_span_attributes = ["cluster", "node", "phase"]
+
+
+class Span:
+
+    __slots__ = ("tracer", "name", "attributes", "parent", "children", "thread_id", "start_time", "end_time")
+
+    def __init__(self,
+                 tracer: Any,
+                 name: str,
+                 attributes: dict,
+                 parent: Any) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.children = 0
+        self.thread_id = get_ident()
+        self.start_time = None
+        self.end_time = None
+
+    def set_attribute(self,
+                      attribute_name: str,
+                      attribute_value: Any) -> None:
+        self.attributes[attribute_name] = attribute_value
+
+    def get_duration(self) -> float:
+        return self.end_time - self.start_time
+
+    def __enter__(self) -> Any:
+        self.tracer.push_span(self)
+        self.start_time = perf_counter()
+        return self
+
+    def __exit__(self,
+                 exception_type: Any,
+                 exception_value: Any,
+                 traceback: Any) -> None:
+        self.end_time = perf_counter()
+        if exception_type is not None:
+            self.attributes["error"] = exception_type.__name__
+        self.tracer.pop_span(self)
+
+
+class NoOpSpan:
+
+    __slots__ = ()
+
+    def set_attribute(self,
+                      attribute_name: str,
+                      attribute_value: Any) -> None:
+        pass
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self,
+                 exception_type: Any,
+                 exception_value: Any,
+                 traceback: Any) -> None:
+        pass
+
+
+class Tracer:
+
+    def __init__(self,
+                 run_name: str) -> None:
+        self.run_name = run_name
+        self.spans = []
+        self.spans_lock = Lock()
+        # Enclosing Spans, Per Thread (Each Thread Pool Task Starts Its Own Stack).
+        self.thread_local = local()
+        self.start_time = perf_counter()
+        self.start_timestamp = time()
+
+    def start_span(self,
+                   name: str,
+                   attributes: dict) -> Span:
+        span_stack = getattr(self.thread_local, "span_stack", None)
+        parent = span_stack[-1] if span_stack else None
+        if parent is not None:
+            for attribute_name in inherited_span_attributes:
+                if attribute_name not in attributes and attribute_name in parent.attributes:
+                    attributes[attribute_name] = parent.attributes[attribute_name]
+        return Span(self, name, attributes, parent)
+
+    def push_span(self,
+                  span: Span) -> None:
+        span_stack = getattr(self.thread_local, "span_stack", None)
+        if span_stack is None:
+            span_stack = self.thread_local.span_stack = []
+        span_stack.append(span)
+
+    def pop_span(self,
+                 span: Span) -> None:
+        self.thread_local.span_stack.remove(span)
+        if span.parent is not None:
+            span.parent.children = span.parent.children + 1
+        with self.spans_lock:
+            self.spans.append(span)
+
+    def get_finished_spans(self) -> list:
+        with self.spans_lock:
+            return sorted(self.spans, key=lambda span: span.start_time)
+
+    def to_chrome_trace(self) -> dict:
+        # Complete Events ('X'), in Microseconds Since the Run Started, One Row Per Thread.
+        process_id = getpid()
+        threads_ids = {}
+        trace_events = []
+        for span in self.get_finished_spans():
+            thread_id = threads_ids.setdefault(span.thread_id, len(threads_ids))
+            trace_events.append({"name": span.name,
+                                 "cat": span.attributes.get("phase", "sparking_cloud"),
+                                 "ph": "X",
+                                 "ts": round((span.start_time - self.start_time) * 1000000),
+                                 "dur": round(span.get_duration() * 1000000),
+                                 "pid": process_id,
+                                 "tid": thread_id,
+                                 "args": span.attributes})
+        return {"traceEvents": trace_events,
+                "displayTimeUnit": "ms",
+                "otherData": {"run_name": self.run_name, "start_timestamp": self.start_timestamp}}
+
+    def to_spans_list(self) -> list:
+        return [{"name": span.name,
+                 "start_in_seconds": round(span.start_time - self.start_time, 6),
+                 "duration_in_seconds": round(span.get_duration(), 6),
+                 "thread": span.thread_id,
+                 "parent": span.parent.name if span.parent is not None else None,
+                 "attributes": span.attributes}
+                for span in self.get_finished_spans()]
+
+    def summarize(self,
+                  top: int = 10) -> dict:
+        spans = self.get_finished_spans()
+        if not spans:
+            return {"total_duration_in_seconds": 0, "critical_path": [], "slowest_nodes": [], "retry_hotspots": []}
+        # Critical Path: Walk Back From the Last Finished Step, Each Time to the Step That Finished Last
+        # Before the Current One Started (Steps Are the Innermost Spans, i.e., the Actual Work).
+        # Stage Spans Enclose Work Done on Other Threads, so They Never Count as Steps.
+        leaf_spans = [span for span in spans if span.children == 0 and "stage" not in span.attributes] or spans
+        critical_path = []
+        current_span = max(leaf_spans, key=lambda span: span.end_time)
+        while current_span is not None:
+            critical_path.append(current_span)
+            predecessors = [span for span in leaf_spans if span.end_time <= current_span.start_time]
+            current_span = max(predecessors, key=lambda span: span.end_time) if predecessors else None
+        critical_path.reverse()
+        # Slowest Nodes: Wall Time Between a Node's First Step and Its Last One.
+        nodes_extents = {}
+        for span in spans:
+            node = span.attributes.get("node", span.attributes.get("host"))
+            if node:
+                start_time, end_time = nodes_extents.get(node, (span.start_time, span.end_time))
+                nodes_extents[node] = (min(start_time, span.start_time), max(end_time, span.end_time))
+        slowest_nodes = sorted(nodes_extents.items(), key=lambda item: item[1][0] - item[1][1])[:top]
+        # Retry Hotspots: Retries Summed Per Step Name and Node.
+        retries = {}
+        for span in spans:
+            if span.attributes.get("retries"):
+                retry_key = (span.name, span.attributes.get("node", span.attributes.get("host")))
+                retries[retry_key] = retries.get(retry_key, 0) + span.attributes["retries"]
+        retry_hotspots = sorted(retries.items(), key=lambda item: -item[1])[:top]
+        return {"total_duration_in_seconds": round(max(span.end_time for span in spans)
+                                                   - min(span.start_time for span in spans), 3),
+                "critical_path": [{"name": span.name,
+                                   "node": span.attributes.get("node", span.attributes.get("host")),
+                                   "start_in_seconds": round(span.start_time - self.start_time, 3),
+                                   "duration_in_seconds": round(span.get_duration(), 3)}
+                                  for span in critical_path],
+                "slowest_nodes": [{"node": node, "duration_in_seconds": round(end_time - start_time, 3)}
+                                  for node, (start_time, end_time) in slowest_nodes],
+                "retry_hotspots": [{"name": name, "node": node, "retries": number_of_retries}
+                                   for (name, node), number_of_retries in retry_hotspots]}
+
+    def export(self,
+               trace_folder: Path) -> tuple:
+        # Write the Chrome Trace (chrome://tracing, Perfetto), the Spans and the Summary Files of the Run.
+        Path(trace_folder).mkdir(parents=True, exist_ok=True)
+        summary = self.summarize()
+        exported_files = []
+        for file_suffix, file_content in [("chrome_trace", self.to_chrome_trace()),
+                                          ("spans", self.to_spans_list()),
+                                          ("summary", summary)]:
+            exported_file = Path(trace_folder).joinpath("{0}_{1}.json".format(self.run_name, file_suffix))
+            with open(file=exported_file, mode="w", encoding="utf-8") as file:
+                dump(file_content, file, indent=2, default=str)
+            exported_files.append(exported_file)
+        return exported_files, summary
+
+
+# Run's Tracer (None Unless Enabled by a Long-Lived Process, e.g., the Deployer).
+tracer = None
+no_op_span = NoOpSpan()
+
+
+def enable_tracing(run_name: str) -> Tracer:
+    global tracer
+    tracer = Tracer(run_name)
+    return tracer
+
+
+def get_tracer() -> Tracer:
+    return tracer
+
+
+def trace_span(name: str,
+               **attributes: Any) -> Any:
+    # Disabled Tracing Costs a Single Check and Hands Back a Shared Do-Nothing Span.
+    if tracer is None:
+        return no_op_span
+    return tracer.start_span(name, attributes)